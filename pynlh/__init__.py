@@ -1,7 +1,48 @@
-from .hand import Hand, HandError  # noqa: F401,E402
-from .combo import Combo  # noqa: F401,E402
-from .rank import RANKS, Rank  # noqa: F401,E402
-from .suit import SUITS, Suit  # noqa: F401,E402
-from .range import Range, RangePart, RangeError  # noqa: F401,E402
-from .tools import timer  # noqa: F401,E402
-from .strategy import Strategy  # noqa: F401,E402
+"""
+pynlh loads its submodules lazily on first attribute access (PEP 562), so
+"import pynlh" stays cheap and NumPy is only imported by the code paths that
+need it.
+"""
+
+from importlib import import_module
+
+_LAZY_ATTRIBUTES = {
+    'Hand': '.hand',
+    'HandError': '.hand',
+    'Combo': '.combo',
+    'ComboRange': '.combo_range',
+    'RANKS': '.rank',
+    'Rank': '.rank',
+    'SUITS': '.suit',
+    'Suit': '.suit',
+    'Range': '.range',
+    'RangePart': '.range',
+    'RangeError': '.range',
+    'timer': '.tools',
+    'Strategy': '.strategy',
+    'equity': '.equity_engine',
+    'EquityResult': '.equity_engine',
+    'combo_equity': '.equity_engine',
+    'preflop_equity': '.preflop',
+    'EquityCache': '.equity_cache',
+    'classify_range': '.classifier',
+    'HandOrdering': '.hand_ordering',
+    'register_ordering': '.hand_ordering',
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str):
+    try:
+        module_name = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,66 @@
+"""
+Card removal for ranges.
+
+Board and dead cards are turned into one 64-bit card mask, which is tested
+against the precomputed masks of all 1326 combos (COMBO_MASK) in a single
+vectorized operation.
+"""
+
+from typing import Iterable, NamedTuple, Union
+
+import numpy as np
+
+from .card import cards_mask
+from .combo_table import COMBO_HAND, COMBO_MASK
+from .hand_table import HAND_TABLE
+
+Cards = Union[str, Iterable, None]
+
+
+class BlockedRange(NamedTuple):
+    """
+    The combos of a range that survive the removal of board and dead cards.
+
+    - combo_indices: Positions of the surviving combos in the combo table.
+    - combo_freqs: The 1326 combo frequencies with blocked combos set to 0.
+    - hand_counts: Number of surviving combos for each of the 169 hands.
+    - weighted_combos: Number of surviving combos weighted by their
+      frequency (e.g. 3 combos at 50% -> 1.5).
+    """
+    combo_indices: np.ndarray
+    combo_freqs: np.ndarray
+    hand_counts: np.ndarray
+    weighted_combos: float
+
+
+def dead_mask(board: Cards = None, dead: Cards = None) -> int:
+    """
+    Returns the card mask of the board and the dead cards (like hero's
+    hand). Cards can be given as a string like 'AsKd7c' or as an iterable
+    of card strings or integers.
+    """
+    return cards_mask(board) | cards_mask(dead)
+
+
+def live_combos(board: Cards = None, dead: Cards = None) -> np.ndarray:
+    """
+    Returns a boolean vector with True for all combos of the combo table
+    that do not share a card with the board or the dead cards.
+    """
+    mask = np.uint64(dead_mask(board, dead))
+    return (COMBO_MASK & mask) == 0
+
+
+def remove_blockers(combo_freqs: np.ndarray,
+                    board: Cards = None,
+                    dead: Cards = None) -> BlockedRange:
+    """
+    Removes the combos blocked by the board and the dead cards from a
+    vector of 1326 combo frequencies.
+    """
+    freqs = np.where(live_combos(board, dead), combo_freqs, 0)
+    combo_indices = np.flatnonzero(freqs)
+    hand_counts = np.bincount(COMBO_HAND[combo_indices],
+                              minlength=len(HAND_TABLE))
+    return BlockedRange(combo_indices, freqs, hand_counts,
+                        float(freqs.sum() / 100))
@@ -0,0 +1,84 @@
+"""
+Integer encoding of the 52 cards of a deck.
+
+A card like 'Kd' is encoded as rank_index * 4 + suit_index, whereas the
+rank_index follows the order of pynlh's RANKS (A=0 ... 2=12) and the
+suit_index the order of pynlh's SUITS (c=0, s=1, d=2, h=3). So 'Ac' is 0
+and '2h' is 51. Sets of cards are represented as 64-bit masks with bit n set
+for card n.
+"""
+
+from typing import Iterable, List, Union
+
+from .rank import NLH_SHORTS as RANK_SHORTS
+from .suit import NLH_SHORTS as SUIT_SHORTS
+
+class CardError(Exception):
+    pass
+
+    def __init__(self, card_str: str, msg: str = 'Not a valid card!'):
+        """
+        Exception class of pynlh's card encoding.
+        """
+        self.card_str = card_str
+        self.msg = msg
+        super().__init__(self.msg)
+
+    def __str__(self):
+        return f"'{self.card_str}' -> {self.msg}"
+
+
+CARDS = tuple(rank + suit for rank in RANK_SHORTS for suit in SUIT_SHORTS)
+CARD_INDEX = {card: i for i, card in enumerate(CARDS)}
+NO_OF_CARDS = len(CARDS)
+
+
+def card_to_int(card: Union[str, int]) -> int:
+    """
+    Converts a card like 'Kd' (or 'kD') to its integer encoding. Integers
+    are passed through after a range check.
+    """
+    if not isinstance(card, str):
+        if not 0 <= card < NO_OF_CARDS:
+            raise CardError(str(card))
+        return int(card)
+    try:
+        return CARD_INDEX[card[0].upper() + card[1:].lower()]
+    except (KeyError, IndexError, TypeError):
+        raise CardError(str(card)) from None
+
+
+def cards_to_ints(cards: Union[str, Iterable]) -> List[int]:
+    """
+    Converts cards to a list of integers. Accepts a string of concatenated
+    cards (like 'AsKd7c', spaces and commas are ignored), an iterable of
+    card strings or an iterable of integers. None returns an empty list.
+    """
+    if cards is None:
+        return []
+    if isinstance(cards, str):
+        s = cards.replace(' ', '').replace(',', '')
+        if len(s) % 2:
+            raise CardError(cards)
+        cards = [s[i:i + 2] for i in range(0, len(s), 2)]
+    rv = [card_to_int(card) for card in cards]
+    if len(set(rv)) != len(rv):
+        raise CardError(str(cards), msg='Cards must not repeat!')
+    return rv
+
+
+def cards_mask(cards: Union[str, Iterable]) -> int:
+    """
+    Returns the 64-bit mask of the given cards (see cards_to_ints).
+    """
+    rv = 0
+    for card in cards_to_ints(cards):
+        rv |= 1 << card
+    return rv
+
+
+def int_to_card(card: int) -> str:
+    """
+    Converts an integer encoded card back to a string like 'Kd'.
+    """
+    return CARDS[card]
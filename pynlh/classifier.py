@@ -0,0 +1,171 @@
+"""
+Postflop hand classes of whole ranges.
+
+classify_combos() puts every combo into one made hand class (MADE_HANDS,
+strongest first) and flags its draws (DRAWS) on a board of 3-5 cards. It
+works on arrays of combos from the combo table: straights, flushes and
+better come from the evaluator, pairs from comparing the hole card ranks
+with the board ranks and straight draws from the STRAIGHT_HIGH table of
+rank masks.
+
+A draw needs at least one hole card (four to a straight on the board are
+only hero's draw if a hole card makes a higher straight). Draws are only
+flagged while cards are to come and the hand is weaker than the drawn
+hand.
+"""
+
+from typing import Dict, NamedTuple
+
+import numpy as np
+
+from .blockers import Cards
+from .card import cards_to_ints
+from .combo_table import COMBO_CARDS
+from .evaluator import (FLUSH, FULL_HOUSE, QUADS, RANK_BITS, STRAIGHT,
+                        STRAIGHT_FLUSH, STRAIGHT_HIGH, EvaluatorError,
+                        NO_OF_RANKS, evaluate_combos, hand_category)
+
+MADE_HANDS = ('straight_flush', 'quads', 'full_house', 'flush', 'straight',
+              'set', 'trips', 'two_pair', 'overpair', 'top_pair',
+              'underpair', 'middle_pair', 'bottom_pair', 'ace_high',
+              'no_made_hand')
+(STRAIGHT_FLUSH_CLASS, QUADS_CLASS, FULL_HOUSE_CLASS, FLUSH_CLASS,
+ STRAIGHT_CLASS, SET, TRIPS_CLASS, TWO_PAIR_CLASS, OVERPAIR, TOP_PAIR,
+ UNDERPAIR, MIDDLE_PAIR, BOTTOM_PAIR, ACE_HIGH, NO_MADE_HAND) = \
+    range(len(MADE_HANDS))
+DRAWS = ('flush_draw', 'oesd', 'gutshot', 'backdoor_flush_draw')
+FLUSH_DRAW, OESD, GUTSHOT, BACKDOOR_FLUSH_DRAW = range(len(DRAWS))
+# Pseudo class of hands weaker than a pair without a flush or straight
+# draw.
+AIR = 'air'
+
+_EVALUATOR_CLASSES = {STRAIGHT_FLUSH: STRAIGHT_FLUSH_CLASS,
+                      QUADS: QUADS_CLASS, FULL_HOUSE: FULL_HOUSE_CLASS,
+                      FLUSH: FLUSH_CLASS, STRAIGHT: STRAIGHT_CLASS}
+
+
+class RangeClasses(NamedTuple):
+    """
+    The hand classes of the combos of a range on a board.
+
+    - combo_indices: Positions of the combos in the combo table.
+    - weights: Combo frequencies as share of a combo (50% -> 0.5).
+    - made: Made hand class of every combo (index in MADE_HANDS).
+    - draws: (n, len(DRAWS)) flags of the draws of every combo.
+    """
+    combo_indices: np.ndarray
+    weights: np.ndarray
+    made: np.ndarray
+    draws: np.ndarray
+
+    def counts(self) -> Dict[str, float]:
+        """
+        Weighted number of combos in every made hand class, with every
+        draw and without showdown value or draw (AIR).
+        """
+        made = np.bincount(self.made, weights=self.weights,
+                           minlength=len(MADE_HANDS))
+        rv = dict(zip(MADE_HANDS, made.tolist()))
+        rv.update(zip(DRAWS, (self.weights @ self.draws).tolist()))
+        air = ((self.made >= ACE_HIGH)
+               & ~self.draws[:, [FLUSH_DRAW, OESD, GUTSHOT]].any(axis=1))
+        rv[AIR] = float(self.weights @ air)
+        return rv
+
+
+def _ranks(cards: np.ndarray) -> np.ndarray:
+    # 12 for an ace down to 0 for a deuce, so a higher rank is stronger.
+    return NO_OF_RANKS - 1 - cards // 4
+
+
+def _pair_classes(hole: np.ndarray, board: np.ndarray) -> np.ndarray:
+    """
+    Classes below a straight from the hole card ranks and the board ranks.
+    """
+    high, low = _ranks(hole).max(axis=1), _ranks(hole).min(axis=1)
+    board_ranks = _ranks(board)
+    board_counts = np.bincount(board_ranks, minlength=NO_OF_RANKS)
+    distinct = np.unique(board_ranks)[::-1]
+    second = distinct[1] if len(distinct) > 1 else -1
+    pocket_pair = high == low
+    high_hits = board_counts[high]
+    low_hits = board_counts[low]
+    hit = np.where(high_hits > 0, high, np.where(low_hits > 0, low, -1))
+    conditions = [
+        pocket_pair & (high_hits == 1),
+        ~pocket_pair & ((high_hits >= 2) | (low_hits >= 2)),
+        ~pocket_pair & (high_hits == 1) & (low_hits == 1),
+        pocket_pair & (high > distinct[0]),
+        hit == distinct[0],
+        pocket_pair,
+        hit == second,
+        hit >= 0,
+        high == NO_OF_RANKS - 1,
+    ]
+    choices = [SET, TRIPS_CLASS, TWO_PAIR_CLASS, OVERPAIR, TOP_PAIR,
+               UNDERPAIR, MIDDLE_PAIR, BOTTOM_PAIR, ACE_HIGH]
+    return np.select(conditions, choices, default=NO_MADE_HAND)
+
+
+def _draws(hole: np.ndarray, board: np.ndarray,
+           made: np.ndarray) -> np.ndarray:
+    rv = np.zeros((len(hole), len(DRAWS)), dtype=bool)
+    if len(board) == 5:
+        return rv
+    # Flush draws: 4 (or 3 on the flop) cards of a suit with a hole card.
+    board_suits = np.bincount(board % 4, minlength=4)
+    hole_suits = hole % 4
+    for suit in range(4):
+        in_hole = (hole_suits == suit).sum(axis=1)
+        total = board_suits[suit] + in_hole
+        rv[:, FLUSH_DRAW] |= (in_hole > 0) & (total == 4)
+        if len(board) == 3:
+            rv[:, BACKDOOR_FLUSH_DRAW] |= (in_hole > 0) & (total == 3)
+    rv[:, FLUSH_DRAW] &= made > FLUSH_CLASS
+    rv[:, BACKDOOR_FLUSH_DRAW] &= made > FLUSH_CLASS
+    rv[:, BACKDOOR_FLUSH_DRAW] &= ~rv[:, FLUSH_DRAW]
+    # Straight draws: ranks that give a higher straight than the board
+    # alone would make with them.
+    board_mask = np.bitwise_or.reduce(RANK_BITS[board])
+    hand_mask = board_mask | RANK_BITS[hole[:, 0]] | RANK_BITS[hole[:, 1]]
+    outs = np.zeros(len(hole), dtype=np.int64)
+    for rank in range(NO_OF_RANKS):
+        bit = 1 << rank
+        outs += (STRAIGHT_HIGH[hand_mask | bit]
+                 > STRAIGHT_HIGH[board_mask | bit])
+    straight_draw = (made > STRAIGHT_CLASS) & (STRAIGHT_HIGH[hand_mask] == 0)
+    rv[:, OESD] = straight_draw & (outs >= 2)
+    rv[:, GUTSHOT] = straight_draw & (outs == 1)
+    return rv
+
+
+def classify_combos(combo_indices: np.ndarray, board: Cards) -> tuple:
+    """
+    Classifies combos (positions in the combo table) on a board of 3-5
+    cards like 'AsKd7c'. Returns the made hand class of every combo
+    (index in MADE_HANDS) and an (n, len(DRAWS)) array of draw flags.
+    Combos must not collide with the board.
+    """
+    board = np.array(cards_to_ints(board), dtype=np.int64)
+    if not 3 <= len(board) <= 5:
+        raise EvaluatorError(board.tolist(),
+                             msg='Boards must have 3-5 cards!')
+    combo_indices = np.asarray(combo_indices, dtype=np.int64)
+    hole = COMBO_CARDS[combo_indices].astype(np.int64)
+    categories = hand_category(evaluate_combos(combo_indices, board))
+    made = _pair_classes(hole, board)
+    for category, made_class in _EVALUATOR_CLASSES.items():
+        made[categories == category] = made_class
+    return made, _draws(hole, board, made)
+
+
+def classify_range(range_, board: Cards, dead: Cards = None) -> RangeClasses:
+    """
+    Classifies the combos of a Range or ComboRange that are not blocked by
+    the board or the dead cards.
+    """
+    blocked = range_.remove_blockers(board=board, dead=dead)
+    combo_indices = blocked.combo_indices
+    made, draws = classify_combos(combo_indices, board)
+    return RangeClasses(combo_indices, blocked.combo_freqs[combo_indices]
+                        / 100, made, draws)
@@ -1,7 +1,33 @@
-from numpy import random
+import numpy as np
 
-from .rank import Rank
-from .suit import Suit
+from .card import CardError
+from .combo_table import (COMBO_CARDS, COMBO_INDEX, COMBO_MASK, COMBO_STR,
+                          combo_index)
+from .rank import RANKS, Rank
+from .suit import SUITS, Suit
+from .tools import Immutable, get_rng
+
+
+def pick_mask(freqs: np.ndarray, rng=None, size: int = None) -> np.ndarray:
+    """
+    Vectorized version of Combo.pick. Draws one uniform number per frequency
+    in a single call and returns a boolean array of the picked combos.
+    If "size" is given, that many independent picks are drawn and a
+    (size, len(freqs)) array is returned.
+    "rng" can be a seed or a NumPy Generator. (see pynlh.tools.get_rng)
+    """
+    freqs = np.asarray(freqs, dtype=float)
+    shape = freqs.shape if size is None else (size,) + freqs.shape
+    random_floats = get_rng(rng).uniform(0.01, 100, shape)
+    return (freqs == 100) | (freqs > random_floats)
+
+
+def combos_to_str(indices, combo_delimiter: str = ',') -> str:
+    """
+    Joins the combos at the given positions of the combo table to a string
+    like 'AcKc,AsKs'.
+    """
+    return combo_delimiter.join([COMBO_STR[i] for i in indices])
 
 
 class ComboError(Exception):
@@ -19,26 +45,77 @@ class ComboError(Exception):
         return f"'{self.combo_str}' -> {self.msg}"
 
 
-class Combo():
-    def __init__(self,
-                 combo_str: str = None,
-                 rank1: Rank = None,
-                 rank2: Rank = None,
-                 suit1: Suit = None,
-                 suit2: Suit = None,
-                 freq: float = 0.00,
-                 ) -> None:
+class Combo(Immutable):
+    """
+    Pynlh's Combo class object.
+    Can be instantiated either giving it a combo_str like "Ac5d" or
+    via Suits and Rank objects.
+
+    Combos are immutable and interned: there is exactly one Combo object per
+    entry of pynlh's combo table (so Combo('5dAc') is Combo('Ac5d')).
+    Frequencies are kept by the Range, not by the Combo.
+    """
+    __slots__ = ('combo_str', 'rank1', 'rank2', 'suit1', 'suit2', 'index')
+    _instances = [None] * len(COMBO_STR)
+
+    def __new__(cls,
+                combo_str: str = None,
+                rank1: Rank = None,
+                rank2: Rank = None,
+                suit1: Suit = None,
+                suit2: Suit = None,
+                ) -> 'Combo':
+        if combo_str is None:
+            try:
+                combo_str = (rank1.short + suit1.short
+                             + rank2.short + suit2.short)
+            except AttributeError:
+                raise ComboError(str(combo_str),
+                                 msg='Ranks and suits are missing!') from None
+        try:
+            index = COMBO_INDEX[combo_str]
+        except (KeyError, TypeError):
+            try:
+                index = combo_index(combo_str)
+            except (KeyError, CardError):
+                raise ComboError(str(combo_str)) from None
+        return cls.from_index(index)
+
+    @classmethod
+    def from_index(cls, index: int) -> 'Combo':
         """
-        Pynlh's Combo class object.
-        Can be instantiated either giving it a combo_str like "Ac5d" or
-        via Suits and Rank objects.
+        Returns the Combo at the given position of pynlh's combo table.
         """
-        self.combo_str = combo_str
-        self.rank1 = rank1
-        self.rank2 = rank2
-        self.suit1 = suit1
-        self.suit2 = suit2
-        self.freq = freq
+        rv = cls._instances[index]
+        if rv is None:
+            rv = super().__new__(cls)
+            combo_str = COMBO_STR[index]
+            rv.combo_str = combo_str
+            rv.rank1 = RANKS[combo_str[0]]
+            rv.suit1 = SUITS[combo_str[1]]
+            rv.rank2 = RANKS[combo_str[2]]
+            rv.suit2 = SUITS[combo_str[3]]
+            rv.index = int(index)
+            rv._freeze()
+            cls._instances[index] = rv
+        return rv
+
+    def __reduce__(self):
+        return (self.__class__, (self.combo_str,))
+
+    @property
+    def cards(self) -> tuple:
+        """
+        The integer encoded cards of the combo. (see pynlh.card)
+        """
+        return tuple(int(c) for c in COMBO_CARDS[self.index])
+
+    @property
+    def mask(self) -> int:
+        """
+        The 64-bit card mask of the combo. (see pynlh.card)
+        """
+        return int(COMBO_MASK[self.index])
 
     def __repr__(self) -> str:
         return f"Combo('{self.combo_str}')"
@@ -46,8 +123,11 @@ class Combo():
     def __str__(self) -> str:
         return self.combo_str
 
-    def pick(self) -> bool:
-        if self.freq == 100:
+    def pick(self, freq: float, rng=None) -> bool:
+        """
+        Picks the combo with the given frequency (0-100).
+        """
+        if freq == 100:
             return True
-        random_float = random.uniform(0.01, 100)
-        return self.freq > random_float
+        random_float = get_rng(rng).uniform(0.01, 100)
+        return freq > random_float
@@ -0,0 +1,212 @@
+"""
+Combo-level ranges.
+
+A ComboRange keeps one frequency (0-100) per combo of pynlh's combo table,
+so it can represent the output of Range.pick_combos (e.g. 'AhKh' but not
+'AsKs'). It aggregates down to the 169-hand Range view with to_range().
+"""
+
+import re
+from typing import Iterable, List, Union
+
+import numpy as np
+
+from .card import CardError
+from .combo import Combo, combos_to_str, pick_mask
+from .combo_table import COMBO_HAND, COMBO_STR, combo_index
+from .hand_table import HAND_TABLE, NO_OF_COMBOS
+from .range import Range, RangeArithmetic
+from .range_encoder import format_freq
+from .range_parser import RangeError
+
+COMBO_TOKEN_RE = re.compile(r'''
+    (?P<SKIP>[\s,;]+)
+  | (?P<COMBO>[AKQJTakqjt2-9][cdhsCDHS][AKQJTakqjt2-9][cdhsCDHS])
+  | (?P<OPEN>\[\s*(?P<freq>[0-9]*\.?[0-9]*)\s*\])
+  | (?P<CLOSE>\[/[^\]]*\])
+''', re.VERBOSE)
+
+HAND_NO_OF_COMBOS = np.array([hand.n_combos for hand in HAND_TABLE])
+
+
+def compile_combos(combo_str: str) -> np.ndarray:
+    """
+    Compiles a combo string like 'AcKc,AdKd,[50]QhQs[/50]' into a vector
+    of 1326 frequencies (in the order of pynlh's combo table).
+    """
+    freqs = np.zeros(NO_OF_COMBOS)
+    freq = 100.0
+    pos = 0
+    while pos < len(combo_str):
+        m = COMBO_TOKEN_RE.match(combo_str, pos)
+        if m is None:
+            msg = combo_str[pos] + RangeError.ERR003_NOT_VALID_CHAR
+            raise RangeError(combo_str, position=pos, msg=msg)
+        kind = m.lastgroup
+        if kind == 'COMBO':
+            try:
+                freqs[combo_index(m.group())] = freq
+            except (KeyError, CardError):
+                raise RangeError(combo_str, position=pos,
+                                 msg=f"'{m.group()}' is not a valid combo!")
+        elif kind == 'OPEN':
+            try:
+                freq = float(m.group('freq'))
+            except ValueError:
+                freq = -1
+            if not 0 <= freq <= 100:
+                raise RangeError(combo_str, position=pos,
+                                 msg=m.group() + RangeError.ERR008_FREQ)
+        elif kind == 'CLOSE':
+            freq = 100.0
+        pos = m.end()
+    return freqs
+
+
+class ComboRange(RangeArithmetic):
+
+    def __init__(self,
+                 combos: Union[str, Iterable] = '',
+                 freq: float = 100.0,
+                 ) -> None:
+        """
+        A range with one frequency per combo (1326 "freqs" in the order of
+        pynlh's combo table).
+
+        "combos" can be a combo string like 'AcKc,AdKd' (with optional
+        frequency tags like '[50]QhQs[/50]'), the output of
+        Range.pick_combos (a list of Combo objects or a string) or an
+        iterable of combo strings or combo table indices. Combos given as
+        iterable get the frequency "freq".
+        """
+        if isinstance(combos, str):
+            self.freqs = compile_combos(combos)
+            return
+        self.freqs = np.zeros(NO_OF_COMBOS)
+        indices = [self._combo_index(c) for c in combos]
+        self.freqs[indices] = freq
+
+    @staticmethod
+    def _combo_index(combo) -> int:
+        if isinstance(combo, Combo):
+            return combo.index
+        if isinstance(combo, (int, np.integer)):
+            if not 0 <= combo < NO_OF_COMBOS:
+                raise KeyError(combo)
+            return int(combo)
+        return combo_index(combo)
+
+    @classmethod
+    def _wrap(cls, freqs: np.ndarray) -> 'ComboRange':
+        rv = cls.__new__(cls)
+        rv.freqs = freqs
+        return rv
+
+    @classmethod
+    def from_freqs(cls, freqs: np.ndarray) -> 'ComboRange':
+        """
+        Creates a ComboRange from a vector of 1326 frequencies.
+        """
+        freqs = np.array(freqs, dtype=float)
+        if freqs.shape != (NO_OF_COMBOS,):
+            raise RangeError(str(freqs.shape),
+                             msg='Frequencies must be a vector of 1326 '
+                                 'combos.')
+        return cls._wrap(freqs)
+
+    @classmethod
+    def from_range(cls, range_: Range) -> 'ComboRange':
+        """
+        Expands a Range to its combos, which keep the frequency of their
+        hand.
+        """
+        return cls._wrap(range_.combo_freqs)
+
+    def __getitem__(self, combo) -> float:
+        if combo not in self:
+            raise KeyError(combo)
+        return float(self.freqs[self._combo_index(combo)])
+
+    def __setitem__(self, combo, freq: float):
+        self.freqs[self._combo_index(combo)] = freq
+
+    def __delitem__(self, combo):
+        if combo not in self:
+            raise KeyError(combo)
+        self.freqs[self._combo_index(combo)] = 0
+
+    def __iter__(self):
+        return ((COMBO_STR[i], float(self.freqs[i]))
+                for i in np.flatnonzero(self.freqs))
+
+    def __contains__(self, combo) -> bool:
+        try:
+            return self.freqs[self._combo_index(combo)] > 0
+        except (KeyError, CardError):
+            return False
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self.freqs))
+
+    def __repr__(self) -> str:
+        return f"ComboRange({self})"
+
+    def __str__(self) -> str:
+        """
+        The combo string like 'AcKc,AdKd,[50]QhQs[/50]' with the 100%
+        combos first and the other frequencies by descending frequency.
+        """
+        rv = []
+        for freq in np.unique(self.freqs[self.freqs > 0])[::-1].tolist():
+            combos = combos_to_str(np.flatnonzero(self.freqs == freq))
+            if freq == 100:
+                rv.append(combos)
+            else:
+                freq_str = format_freq(freq)
+                rv.append(f'[{freq_str}]{combos}[/{freq_str}]')
+        return ','.join(rv)
+
+    @property
+    def combo_freqs(self) -> np.ndarray:
+        return self.freqs
+
+    @property
+    def combo_indices(self) -> np.ndarray:
+        return np.flatnonzero(self.freqs)
+
+    @property
+    def combos(self) -> List[Combo]:
+        return [Combo.from_index(i) for i in self.combo_indices]
+
+    @property
+    def hand_freqs(self) -> np.ndarray:
+        """
+        The frequencies aggregated to the 169 hands: the share of each
+        hand's combos (weighted by their frequency) that is in the range.
+        """
+        return (np.bincount(COMBO_HAND, weights=self.freqs,
+                            minlength=len(HAND_TABLE))
+                / HAND_NO_OF_COMBOS)
+
+    def to_range(self) -> Range:
+        """
+        Aggregates the combos to a Range of 169 hands (see hand_freqs).
+        """
+        return Range._wrap(self.hand_freqs)
+
+    def pick_combo_indices(self, rng=None, board=None,
+                           dead=None) -> np.ndarray:
+        """
+        Picks every combo with its frequency and returns the positions of
+        the picked combos in pynlh's combo table. Combos blocked by "board"
+        or "dead" cards are never picked.
+        """
+        combo_indices = self.live_combo_indices(board, dead)
+        picked = pick_mask(self.freqs[combo_indices], rng=rng)
+        return combo_indices[picked]
+
+    def pick_combos(self, as_str=False, rng=None, board=None, dead=None):
+        indices = self.pick_combo_indices(rng=rng, board=board, dead=dead)
+        if as_str:
+            return combos_to_str(indices)
+        return [Combo.from_index(i) for i in indices]
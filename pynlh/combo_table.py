@@ -0,0 +1,84 @@
+"""
+Precomputed table of all 1326 two-card combos.
+
+The combos are ordered by the hand table, so the combos of a hand are found
+at HAND_TABLE[i].combo_slice. Within a hand they keep the order of the
+former Hand.all_combos_str (e.g. 'AcAs', 'AcAd', ... for 'AA').
+
+- COMBO_STR: Tuple with the combo strings like 'AcKc'.
+- COMBO_CARDS: (1326, 2) int8 array with the integer encoded cards.
+- COMBO_MASK: (1326,) uint64 array with the card mask of every combo.
+- COMBO_HAND: (1326,) int16 array with the hand table index of every combo.
+- COMBO_INDEX: Lookup from combo string (in both card orders) to index.
+"""
+
+from types import MappingProxyType
+
+import numpy as np
+
+from .card import CARDS, CARD_INDEX, cards_to_ints
+from .hand_table import HAND_TABLE, NO_OF_COMBOS, find_hand
+from .suit import NLH_SHORTS as SUIT_SHORTS
+
+def _hand_combos_str(handstring: str, hand_type: str) -> list:
+    rank1, rank2 = handstring[0], handstring[1]
+    if hand_type == 'pair':
+        return [rank1 + s1 + rank2 + s2
+                for i, s1 in enumerate(SUIT_SHORTS)
+                for s2 in SUIT_SHORTS[i + 1:]]
+    elif hand_type == 'suited':
+        return [rank1 + s + rank2 + s for s in SUIT_SHORTS]
+    return [rank1 + s1 + rank2 + s2
+            for s1 in SUIT_SHORTS for s2 in SUIT_SHORTS if s1 != s2]
+
+
+def _build_combo_table():
+    combos = []
+    hands = []
+    for hand in HAND_TABLE:
+        hand_combos = _hand_combos_str(hand.handstring, hand.hand_type)
+        assert len(hand_combos) == hand.n_combos
+        combos += hand_combos
+        hands += [hand.index] * hand.n_combos
+    cards = np.array([(CARD_INDEX[c[:2]], CARD_INDEX[c[2:]]) for c in combos],
+                     dtype=np.int8)
+    one = np.uint64(1)
+    masks = ((one << cards[:, 0].astype(np.uint64))
+             | (one << cards[:, 1].astype(np.uint64)))
+    return tuple(combos), cards, masks, np.array(hands, dtype=np.int16)
+
+
+COMBO_STR, COMBO_CARDS, COMBO_MASK, COMBO_HAND = _build_combo_table()
+COMBO_INDEX = MappingProxyType(
+    {**{c[2:] + c[:2]: i for i, c in enumerate(COMBO_STR)},
+     **{c: i for i, c in enumerate(COMBO_STR)}}
+)
+for _array in (COMBO_CARDS, COMBO_MASK, COMBO_HAND):
+    _array.flags.writeable = False
+
+assert len(COMBO_STR) == NO_OF_COMBOS
+
+
+def combo_index(combo) -> int:
+    """
+    Returns the index of a combo like 'AcKc', 'KcAc' or a pair of cards
+    like ('Ac', 'Kc') or (0, 4) in the combo table.
+    """
+    if isinstance(combo, str) and combo in COMBO_INDEX:
+        return COMBO_INDEX[combo]
+    cards = cards_to_ints(combo)
+    if len(cards) != 2:
+        raise KeyError(combo)
+    return COMBO_INDEX[CARDS[cards[0]] + CARDS[cards[1]]]
+
+
+def hand_combo_slice(hand) -> slice:
+    """
+    Returns the slice of the combo table holding the combos of a hand like
+    'AKs'. Raises a KeyError for hands that are not in the hand table (like
+    'AK' without a suit).
+    """
+    info = find_hand(hand)
+    if info is None:
+        raise KeyError(hand)
+    return info.combo_slice
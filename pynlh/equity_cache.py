@@ -0,0 +1,229 @@
+"""
+Persistent equity cache.
+
+EquityCache memoizes equity() results in a local SQLite file. The key of
+a query is built from the canonical range strings (see
+pynlh.range_encoder) and the board and dead cards normalized by suit
+isomorphism, so isomorphic queries like AsKs7d and AhKh7c share one
+entry. Combo ranges are relabeled together with the board. Keys carry
+KEY_VERSION and the file carries SCHEMA_VERSION, so bumping either
+invalidates old entries. The least recently used entries are evicted
+beyond "maxsize" entries.
+"""
+
+import hashlib
+import json
+import sqlite3
+from pathlib import Path
+from threading import Lock
+from time import time
+from typing import NamedTuple, Optional, Union
+
+import numpy as np
+
+from .blockers import Cards
+from .card import cards_to_ints, int_to_card
+from .combo_range import ComboRange
+from .equity_engine import AnyRange, EquityResult, equity
+from .isomorphism import COMBO_PERMUTATIONS, PERMUTED_CARDS
+from .range import Range
+
+# Version of the key format. Bump it whenever the canonical forms or the
+# equity calculation change, so old entries are never hit again.
+KEY_VERSION = 1
+# Version of the table layout (stored as SQLite user_version).
+SCHEMA_VERSION = 1
+# equity() arguments that don't change the result.
+_IGNORED_ARGUMENTS = ('processes',)
+
+
+class EquityCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+def _range_key(range_: AnyRange, permutation: int) -> str:
+    """
+    Canonical string of a range with its suits relabeled. 169-hand ranges
+    are suit-symmetric, so only combo ranges depend on the permutation.
+    """
+    if isinstance(range_, str):
+        range_ = Range(range_)
+    if isinstance(range_, Range):
+        return f'R:{range_}'
+    freqs = np.empty_like(range_.combo_freqs)
+    freqs[COMBO_PERMUTATIONS[permutation]] = range_.combo_freqs
+    return f'C:{ComboRange._wrap(freqs)}'
+
+
+def canonical_query(hero_range: AnyRange,
+                    villain_range: AnyRange,
+                    board: Cards = None,
+                    dead: Cards = None) -> tuple:
+    """
+    Returns the canonical strings of the ranges, the board and the dead
+    cards. Among all 24 suit relabelings the one with the smallest sorted
+    board and dead cards is used (ties are broken by the range strings),
+    so isomorphic queries give the same strings.
+    """
+    board = cards_to_ints(board)
+    dead = cards_to_ints(dead)
+    candidates = []
+    for p, cards in enumerate(PERMUTED_CARDS):
+        candidates.append((sorted(cards[board].tolist()),
+                           sorted(cards[dead].tolist()), p))
+    best = min(candidates)[:2]
+    rv = []
+    for board_p, dead_p, p in candidates:
+        if (board_p, dead_p) == best:
+            rv.append((_range_key(hero_range, p),
+                       _range_key(villain_range, p),
+                       ''.join(int_to_card(card) for card in board_p),
+                       ''.join(int_to_card(card) for card in dead_p)))
+            if isinstance(hero_range, (Range, str)) \
+                    and isinstance(villain_range, (Range, str)):
+                break
+    return min(rv)
+
+
+def cache_key(hero_range: AnyRange,
+              villain_range: AnyRange,
+              board: Cards = None,
+              dead: Cards = None,
+              **kwargs) -> str:
+    """
+    Key of an equity() query: a hash of KEY_VERSION, the canonical query
+    and the equity() arguments that change the result. A NumPy Generator
+    as "rng" counts as no seed.
+    """
+    kwargs = {name: value for name, value in kwargs.items()
+              if name not in _IGNORED_ARGUMENTS}
+    if not isinstance(kwargs.get('rng'), (int, type(None))):
+        kwargs['rng'] = None
+    key = json.dumps([KEY_VERSION,
+                      canonical_query(hero_range, villain_range, board,
+                                      dead),
+                      sorted(kwargs.items())])
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+class EquityCache():
+
+    def __init__(self,
+                 path: Union[str, Path],
+                 maxsize: int = 100_000,
+                 ) -> None:
+        """
+        A size-bounded LRU cache of equity results in the SQLite file
+        "path" (':memory:' for a cache without file). It can be shared by
+        threads and processes. Once "maxsize" results are stored, the least
+        recently used ones are evicted.
+        """
+        self.path = str(path)
+        self.maxsize = maxsize
+        self._lock = Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        with self._lock, self._db:
+            self._create_tables()
+
+    def _create_tables(self):
+        version = self._db.execute('PRAGMA user_version').fetchone()[0]
+        if version != SCHEMA_VERSION:
+            self._db.execute('DROP TABLE IF EXISTS equity')
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS equity (key TEXT PRIMARY KEY, '
+            'equity REAL, win REAL, tie REAL, std_error REAL, '
+            'iterations INTEGER, last_used REAL)')
+        self._db.execute('CREATE INDEX IF NOT EXISTS equity_last_used '
+                         'ON equity (last_used)')
+        self._db.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+
+    def __enter__(self) -> 'EquityCache':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return self._db.execute('SELECT 1 FROM equity WHERE key = ?',
+                                    (key,)).fetchone() is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute(
+                'SELECT COUNT(*) FROM equity').fetchone()[0]
+
+    def get(self, key: str) -> Optional[EquityResult]:
+        """
+        Returns the result stored for a key (see cache_key) or None.
+        """
+        with self._lock, self._db:
+            row = self._db.execute(
+                'SELECT equity, win, tie, std_error, iterations FROM equity '
+                'WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self._db.execute('UPDATE equity SET last_used = ? WHERE key = ?',
+                             (time(), key))
+            self.hits += 1
+            return EquityResult(*row)
+
+    def put(self, key: str, result: EquityResult) -> None:
+        """
+        Stores a result and evicts the least recently used results beyond
+        "maxsize".
+        """
+        with self._lock, self._db:
+            self._db.execute(
+                'INSERT OR REPLACE INTO equity VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (key, *result, time()))
+            excess = self._db.execute(
+                'SELECT COUNT(*) FROM equity').fetchone()[0] - self.maxsize
+            if excess > 0:
+                self._db.execute(
+                    'DELETE FROM equity WHERE key IN (SELECT key FROM '
+                    'equity ORDER BY last_used LIMIT ?)', (excess,))
+                self.evictions += excess
+
+    def equity(self,
+               hero_range: AnyRange,
+               villain_range: AnyRange,
+               board: Cards = None,
+               dead: Cards = None,
+               **kwargs) -> EquityResult:
+        """
+        Returns the cached result of equity() for these arguments and
+        calculates and stores it on a miss.
+        """
+        key = cache_key(hero_range, villain_range, board, dead, **kwargs)
+        result = self.get(key)
+        if result is None:
+            result = equity(hero_range, villain_range, board, dead,
+                            **kwargs)
+            self.put(key, result)
+        return result
+
+    def info(self) -> EquityCacheInfo:
+        currsize = len(self)
+        with self._lock:
+            return EquityCacheInfo(self.hits, self.misses, self.evictions,
+                                   self.maxsize, currsize)
+
+    def clear(self):
+        """
+        Empties the cache and resets its counters.
+        """
+        with self._lock, self._db:
+            self._db.execute('DELETE FROM equity')
+            self.hits = self.misses = self.evictions = 0
+
+    def close(self):
+        self._db.close()
@@ -0,0 +1,626 @@
+"""
+Range versus range equity.
+
+equity() either samples pairs of non-colliding hero and villain combos in
+proportion to their range frequencies and completes the board with random
+cards (Monte Carlo), or enumerates every pair on every possible runout
+(exact). The exact mode is chosen automatically when the number of pairs
+times the number of runouts is within a budget. Both modes can split their
+work (sampling batches or runout slices) over a process pool.
+"""
+
+import os
+from collections import deque
+from contextlib import closing
+from functools import lru_cache
+from itertools import chain, combinations, islice
+from math import comb, sqrt
+from multiprocessing import Pool
+from time import perf_counter
+from typing import (Callable, Dict, Iterable, Iterator, NamedTuple,
+                    Optional, Union)
+
+import numpy as np
+
+from .blockers import Cards
+from .card import NO_OF_CARDS, cards_to_ints
+from .combo_range import ComboRange
+from .combo_table import COMBO_CARDS, COMBO_HAND, COMBO_MASK
+from .evaluator import NO_OF_RANKS, evaluate
+from .hand_table import HAND_TABLE, NO_OF_COMBOS
+from .range import Range
+from .shared import SharedArrays, SharedHandle, attach
+from .tools import get_seed_sequence
+
+AnyRange = Union[Range, ComboRange, str]
+
+# Samples evaluated at once.
+BATCH_SIZE = 1 << 16
+# Maximum number of pair and runout combinations for which equity() with
+# method='auto' enumerates instead of sampling.
+EXACT_BUDGET = 20_000_000
+# Pair and runout combinations compared at once by the enumeration.
+ENUMERATION_CHUNK = 1 << 20
+METHODS = ('auto', 'exact', 'monte_carlo')
+NO_OF_HANDS = len(HAND_TABLE)
+# Standard errors on each side of the estimate covered by the 95%
+# confidence interval used for early stopping.
+CONFIDENCE_Z = 1.96
+
+
+class EquityError(Exception):
+    pass
+
+    def __init__(self, msg: str = 'Cannot calculate the equity!'):
+        """
+        Exception class of pynlh's equity calculation.
+        """
+        self.msg = msg
+        super().__init__(self.msg)
+
+
+class EquityResult(NamedTuple):
+    """
+    Result of an equity calculation.
+
+    - equity: Hero's share of the pot (win + tie / 2).
+    - win: Share of the samples hero wins.
+    - tie: Share of the samples that split the pot.
+    - std_error: Standard error of "equity" (0 for exact results).
+    - iterations: Number of evaluated samples.
+    """
+    equity: float
+    win: float
+    tie: float
+    std_error: float
+    iterations: int
+
+
+class Matchups(NamedTuple):
+    """
+    All pairs of non-colliding hero and villain combos with their weights.
+    """
+    hero: np.ndarray
+    villain: np.ndarray
+    weights: np.ndarray
+    board: np.ndarray
+    dead_mask: int
+
+
+def as_range(range_: AnyRange) -> Union[Range, ComboRange]:
+    """
+    Reads a range string as Range and returns Ranges and ComboRanges as
+    they are.
+    """
+    if isinstance(range_, str):
+        return Range(range_)
+    return range_
+
+
+def _board_cards(board: Cards, dead: Cards) -> tuple:
+    board = np.array(cards_to_ints(board), dtype=np.int8)
+    if len(board) > 5:
+        raise EquityError(msg='A board has at most 5 cards!')
+    dead = cards_to_ints(dead)
+    if set(board.tolist()) & set(dead):
+        raise EquityError(msg='Board and dead cards must not overlap!')
+    dead_mask = 0
+    for card in board.tolist() + dead:
+        dead_mask |= 1 << card
+    return board, dead_mask
+
+
+def matchups(hero_range: AnyRange, villain_range: AnyRange,
+             board: Cards = None, dead: Cards = None) -> Matchups:
+    """
+    Finds all pairs of hero and villain combos that neither collide with
+    each other nor with the board or the dead cards. The weight of a pair
+    is the product of both combo frequencies.
+    """
+    board, dead_mask = _board_cards(board, dead)
+    live = (COMBO_MASK & np.uint64(dead_mask)) == 0
+    hero_freqs = np.where(live, as_range(hero_range).combo_freqs, 0)
+    villain_freqs = np.where(live, as_range(villain_range).combo_freqs, 0)
+    hero = np.flatnonzero(hero_freqs)
+    villain = np.flatnonzero(villain_freqs)
+    weights = np.outer(hero_freqs[hero], villain_freqs[villain])
+    weights[(COMBO_MASK[hero][:, None] & COMBO_MASK[villain]) != 0] = 0
+    hero_pos, villain_pos = np.nonzero(weights)
+    if not len(hero_pos):
+        raise EquityError(msg='The ranges have no non-colliding combos!')
+    return Matchups(hero[hero_pos], villain[villain_pos],
+                    weights[hero_pos, villain_pos], board, dead_mask)
+
+
+def _complete_boards(used: np.ndarray, n_cards: int, rng) -> np.ndarray:
+    """
+    Draws n_cards random cards for every row that are not in the row's
+    card mask "used" (uint64).
+    """
+    rv = np.empty((len(used), n_cards), dtype=np.int8)
+    used = used.copy()
+    one = np.uint64(1)
+    for i in range(n_cards):
+        cards = rng.integers(0, NO_OF_CARDS, len(used), dtype=np.uint64)
+        taken = np.flatnonzero((used >> cards) & one)
+        while len(taken):
+            cards[taken] = rng.integers(0, NO_OF_CARDS, len(taken),
+                                        dtype=np.uint64)
+            taken = taken[((used[taken] >> cards[taken]) & one) != 0]
+        used |= one << cards
+        rv[:, i] = cards
+    return rv
+
+
+def _showdown(hero: np.ndarray, villain: np.ndarray,
+              boards: np.ndarray) -> np.ndarray:
+    """
+    Returns hero's share of the pot (1, 0.5 or 0) for every sample.
+    """
+    hero_scores = evaluate(np.concatenate([COMBO_CARDS[hero], boards], 1))
+    villain_scores = evaluate(
+        np.concatenate([COMBO_CARDS[villain], boards], 1))
+    return ((hero_scores > villain_scores)
+            + 0.5 * (hero_scores == villain_scores))
+
+
+def _result(n: int, wins: int, ties: int) -> EquityResult:
+    """
+    Builds the result of n samples from the number of won and tied ones.
+    """
+    win = wins / n
+    tie = ties / n
+    equity_ = win + tie / 2
+    # Shares are 1, 0.5 or 0, so their variance follows from the counts.
+    variance = max(win + tie / 4 - equity_ ** 2, 0.)
+    return EquityResult(equity_, win, tie, sqrt(variance / n), n)
+
+
+def _deal(matchups_: Matchups, picked: np.ndarray, rng) -> np.ndarray:
+    """
+    Deals the rest of the board to the picked matchups (positions in
+    "matchups_") and returns hero's share of the pot for every one.
+    """
+    n = len(picked)
+    board = matchups_.board
+    hero = matchups_.hero[picked]
+    villain = matchups_.villain[picked]
+    used = (COMBO_MASK[hero] | COMBO_MASK[villain]
+            | np.uint64(matchups_.dead_mask))
+    boards = np.concatenate(
+        [np.broadcast_to(board, (n, len(board))),
+         _complete_boards(used, 5 - len(board), rng)], axis=1)
+    return _showdown(hero, villain, boards)
+
+
+def _sample(matchups_: Matchups, n: int, rng) -> np.ndarray:
+    """
+    Samples n matchups in proportion to their weights, deals the rest of
+    the board and returns hero's share of the pot for every sample.
+    """
+    cdf = np.cumsum(matchups_.weights)
+    picked = np.searchsorted(cdf, rng.uniform(0, cdf[-1], n), side='right')
+    return _deal(matchups_, picked, rng)
+
+
+def _batch_tasks(iterations: Optional[int], rng) -> Iterator[tuple]:
+    """
+    Yields (seed, size) of the sampling batches. Every batch has its own
+    random stream spawned from one root, so the samples do not depend on
+    the process that draws them.
+    """
+    root = get_seed_sequence(rng)
+    n = 0
+    while iterations is None or n < iterations:
+        size = BATCH_SIZE
+        if iterations is not None:
+            size = min(size, iterations - n)
+        yield root.spawn(1)[0], size
+        n += size
+
+
+def _batch_counts(matchups_: Matchups, seed: np.random.SeedSequence,
+                  size: int) -> tuple:
+    """
+    Samples one batch and returns its size and the number of won and tied
+    samples.
+    """
+    shares = _sample(matchups_, size, np.random.default_rng(seed))
+    return (size, int(np.count_nonzero(shares == 1)),
+            int(np.count_nonzero(shares == 0.5)))
+
+
+# State of a pool worker: the shared memory block, the matchups and the
+# tables in it.
+_WORKER = {}
+
+
+def _init_worker(handle: SharedHandle, dead_mask: int) -> None:
+    shm, arrays = attach(handle)
+    _WORKER['shm'] = shm
+    _WORKER['matchups'] = Matchups(arrays.pop('hero'),
+                                   arrays.pop('villain'),
+                                   arrays.pop('weights'),
+                                   arrays.pop('board'), dead_mask)
+    _WORKER['tables'] = arrays
+
+
+def _work(func: Callable, task: tuple):
+    return func(_WORKER['matchups'], *task, **_WORKER['tables'])
+
+
+def _run(matchups_: Matchups, func: Callable, tasks: Iterable[tuple],
+         processes: int, tables: Dict[str, np.ndarray] = None) -> Iterator:
+    """
+    Yields func(matchups_, *task, **tables) for every task in order. With
+    more than one process the tasks run in a process pool. The workers
+    read the matchups and the "tables" from shared memory, so a task only
+    pickles its own arguments. At most two tasks per process are queued
+    ahead of the consumer.
+
+    The evaluator's lookup tables are not shared: they are small (0.75 MB)
+    and every process builds them when it imports pynlh.evaluator, with
+    any start method.
+    """
+    tasks = iter(tasks)
+    tables = tables or {}
+    if processes == 1:
+        for task in tasks:
+            yield func(matchups_, *task, **tables)
+        return
+    arrays = {'hero': matchups_.hero, 'villain': matchups_.villain,
+              'weights': matchups_.weights, 'board': matchups_.board,
+              **tables}
+    with SharedArrays(arrays) as shared, \
+            Pool(processes, _init_worker,
+                 (shared.handle, matchups_.dead_mask)) as pool:
+        pending = deque(pool.apply_async(_work, (func, task))
+                        for task in islice(tasks, 2 * processes))
+        while pending:
+            result = pending.popleft().get()
+            for task in islice(tasks, 1):
+                pending.append(pool.apply_async(_work, (func, task)))
+            yield result
+
+
+def _processes(processes: Optional[int]) -> int:
+    if processes is None:
+        return os.cpu_count() or 1
+    if processes < 1:
+        raise EquityError(msg='At least one process is needed!')
+    return processes
+
+
+def sample_equity(matchups_: Matchups,
+                  iterations: Optional[int] = 100_000,
+                  tolerance: float = None,
+                  deadline: float = None,
+                  rng=None,
+                  processes: Optional[int] = 1) -> EquityResult:
+    """
+    Estimates the equity in batches of BATCH_SIZE samples. Sampling stops
+    after "iterations" samples, as soon as the 95% confidence interval
+    (CONFIDENCE_Z standard errors on each side) is not wider than
+    +-"tolerance" or when "deadline" seconds have passed, whichever comes
+    first. At least one batch is always sampled.
+
+    The batches are spread over "processes" processes (None for one per
+    CPU). Every batch has its own random stream derived from "rng" and
+    the batches are counted in order, so a seed gives the same result with
+    any number of processes (unless the deadline stops the sampling).
+    """
+    if iterations is None and tolerance is None and deadline is None:
+        raise EquityError(msg='Sampling needs iterations, a tolerance or '
+                              'a deadline to stop!')
+    if iterations is not None and iterations < 1:
+        raise EquityError(msg='At least one iteration is needed!')
+    if tolerance is not None and tolerance <= 0:
+        raise EquityError(msg='The tolerance must be positive!')
+    processes = _processes(processes)
+    stop_time = None if deadline is None else perf_counter() + deadline
+    n = wins = ties = 0
+    batches = _run(matchups_, _batch_counts,
+                   _batch_tasks(iterations, rng), processes)
+    with closing(batches):
+        for size, batch_wins, batch_ties in batches:
+            n += size
+            wins += batch_wins
+            ties += batch_ties
+            result = _result(n, wins, ties)
+            if ((tolerance is not None
+                 and CONFIDENCE_Z * result.std_error <= tolerance)
+                    or (stop_time is not None
+                        and perf_counter() >= stop_time)):
+                break
+    return result
+
+
+def _live_cards(dead_mask: int) -> list:
+    return [card for card in range(NO_OF_CARDS) if not dead_mask >> card & 1]
+
+
+def enumeration_size(matchups_: Matchups) -> int:
+    """
+    Number of pair and runout combinations an exact enumeration compares
+    (including the runouts that collide with a pair).
+    """
+    n_cards = 5 - len(matchups_.board)
+    return len(matchups_.hero) * comb(
+        len(_live_cards(matchups_.dead_mask)), n_cards)
+
+
+def _runout_scores(combos: np.ndarray, boards: np.ndarray) -> np.ndarray:
+    """
+    Scores every combo on every board. Returns an (n_boards, n_combos)
+    array. Combos colliding with a board get meaningless scores.
+    """
+    n_boards, n_combos = len(boards), len(combos)
+    cards = np.empty((n_boards, n_combos, 7), dtype=np.int8)
+    cards[:, :, :2] = COMBO_CARDS[combos]
+    cards[:, :, 2:] = boards[:, None, :]
+    return evaluate(cards)
+
+
+@lru_cache(maxsize=8)
+def _runout_table(board: tuple, dead_mask: int) -> tuple:
+    """
+    All runouts of a board as boards with 5 cards (int8) and their card
+    masks (uint64), in the order of itertools.combinations of the live
+    cards. Cached, as preflop enumerations reuse the 2.6 million runouts.
+    """
+    n_cards = 5 - len(board)
+    live_cards = _live_cards(dead_mask)
+    runouts = np.fromiter(
+        chain.from_iterable(combinations(live_cards, n_cards)),
+        dtype=np.int8).reshape(comb(len(live_cards), n_cards), n_cards)
+    masks = np.zeros(len(runouts), dtype=np.uint64)
+    for i in range(n_cards):
+        masks |= np.uint64(1) << runouts[:, i].astype(np.uint64)
+    boards = np.empty((len(runouts), 5), dtype=np.int8)
+    boards[:, :len(board)] = board
+    boards[:, len(board):] = runouts
+    for array in (boards, masks):
+        array.flags.writeable = False
+    return boards, masks
+
+
+def _runout_counts(matchups_: Matchups, start: int, stop: int,
+                   boards: np.ndarray, runout_masks: np.ndarray) -> tuple:
+    """
+    Counts for every pair the won and tied runouts among the runouts
+    start:stop of "boards" and their card masks "runout_masks" (see
+    _runout_table). Hero and villain combos are scored once per runout.
+    Runouts colliding with a pair are skipped with the combo masks.
+    """
+    boards = boards[start:stop]
+    runout_masks = runout_masks[start:stop]
+
+    hero, hero_pos = np.unique(matchups_.hero, return_inverse=True)
+    villain, villain_pos = np.unique(matchups_.villain,
+                                     return_inverse=True)
+    pair_masks = COMBO_MASK[matchups_.hero] | COMBO_MASK[matchups_.villain]
+    wins = np.zeros(len(pair_masks), dtype=np.int64)
+    ties = np.zeros(len(pair_masks), dtype=np.int64)
+    step = max(1, ENUMERATION_CHUNK // len(pair_masks))
+    for chunk_start in range(0, len(boards), step):
+        chunk = slice(chunk_start, chunk_start + step)
+        hero_scores = _runout_scores(hero, boards[chunk])[:, hero_pos]
+        villain_scores = _runout_scores(villain,
+                                        boards[chunk])[:, villain_pos]
+        valid = (runout_masks[chunk, None] & pair_masks) == 0
+        wins += ((hero_scores > villain_scores) & valid).sum(axis=0)
+        ties += ((hero_scores == villain_scores) & valid).sum(axis=0)
+    return wins, ties
+
+
+def _enumeration_counts(matchups_: Matchups, processes: int) -> tuple:
+    """
+    Counts the won and tied runouts of every pair. With more than one
+    process the runouts are split into slices that are counted in a
+    process pool. Returns the counts and the number of runouts per pair.
+    """
+    n_cards = 5 - len(matchups_.board)
+    live_cards = _live_cards(matchups_.dead_mask)
+    all_runouts = comb(len(live_cards), n_cards)
+    n_slices = min(all_runouts, 1 if processes == 1 else 4 * processes)
+    bounds = [all_runouts * i // n_slices for i in range(n_slices + 1)]
+    # Built once and shared with the pool workers.
+    boards, runout_masks = _runout_table(
+        tuple(matchups_.board.tolist()), matchups_.dead_mask)
+    tables = {'boards': boards, 'runout_masks': runout_masks}
+    wins = ties = 0
+    for slice_wins, slice_ties in _run(matchups_, _runout_counts,
+                                       zip(bounds, bounds[1:]), processes,
+                                       tables):
+        wins = wins + slice_wins
+        ties = ties + slice_ties
+    # Every pair blocks 4 live cards, so all pairs have as many runouts.
+    return wins, ties, comb(len(live_cards) - 4, n_cards)
+
+
+def enumerate_equity(matchups_: Matchups,
+                     processes: Optional[int] = 1) -> EquityResult:
+    """
+    Calculates the exact equity by evaluating every matchup on every
+    runout of the board. The win and tie counts of every pair are exact
+    integers. With more than one process (None for one per CPU) the
+    runouts are split into slices that are counted in a process pool.
+    """
+    wins, ties, n_runouts = _enumeration_counts(matchups_,
+                                                _processes(processes))
+    total = matchups_.weights.sum() * n_runouts
+    win = float(matchups_.weights @ wins / total)
+    tie = float(matchups_.weights @ ties / total)
+    return EquityResult(win + tie / 2, win, tie, 0., len(wins) * n_runouts)
+
+
+def _check_method(method: str) -> None:
+    if method not in METHODS:
+        raise EquityError(msg=f"Unknown method '{method}'. Use one of "
+                              f"{', '.join(METHODS)}.")
+
+
+def _enumerates(matchups_: Matchups, method: str, exact_budget: int) -> bool:
+    return method == 'exact' or (
+        method == 'auto' and enumeration_size(matchups_) <= exact_budget)
+
+
+def equity(hero_range: AnyRange,
+           villain_range: AnyRange,
+           board: Cards = None,
+           dead: Cards = None,
+           iterations: Optional[int] = 100_000,
+           rng=None,
+           method: str = 'auto',
+           exact_budget: int = EXACT_BUDGET,
+           tolerance: float = None,
+           deadline: float = None,
+           processes: Optional[int] = 1) -> EquityResult:
+    """
+    Calculates hero's equity against villain.
+
+    The ranges can be Range or ComboRange objects (as held by a Strategy)
+    or range strings. Their frequencies weight the combos. "board" and
+    "dead" take cards like 'AsKd7c'.
+
+    "method" is 'exact' (enumerate every runout), 'monte_carlo' (sample
+    runouts, reproducible with "rng" as seed or NumPy Generator) or
+    'auto', which enumerates if the number of pairs times runouts is at
+    most "exact_budget" and samples otherwise.
+
+    Sampling stops after "iterations" samples (None for no limit), once
+    the 95% confidence interval is within +-"tolerance" or after
+    "deadline" seconds (see sample_equity). EquityResult holds the
+    achieved standard error and the number of samples used.
+
+    "processes" spreads the work over a process pool (None for one
+    process per CPU). A seed gives the same result with any number of
+    processes.
+    """
+    _check_method(method)
+    matchups_ = matchups(hero_range, villain_range, board, dead)
+    if _enumerates(matchups_, method, exact_budget):
+        return enumerate_equity(matchups_, processes=processes)
+    return sample_equity(matchups_, iterations, tolerance=tolerance,
+                         deadline=deadline, rng=rng, processes=processes)
+
+
+class ComboEquities(NamedTuple):
+    """
+    Hero's equity per combo against villain.
+
+    - combo_equities: Equity of every combo of pynlh's combo table (NaN
+      for combos that are not in hero's range or not sampled).
+    - combo_weights: Weight of every combo: its frequency times the
+      weighted villain combos it doesn't collide with.
+    - grid: 13x13 equities of the hands (aggregated over their combos by
+      weight) at [x - 1, y - 1] of the hand, the layout of
+      Range.build_0freq_hands_dict. NaN for hands not in the range.
+    - histogram: Share of hero's range (by weight) in each equity bucket.
+    - bucket_edges: The edges of the histogram's buckets.
+    - equity: Hero's overall equity.
+    """
+    combo_equities: np.ndarray
+    combo_weights: np.ndarray
+    grid: np.ndarray
+    histogram: np.ndarray
+    bucket_edges: np.ndarray
+    equity: float
+
+
+def _hero_blocks(matchups_: Matchups) -> tuple:
+    """
+    Returns the hero combos and where their pairs start and end. Matchups
+    are ordered by hero combo.
+    """
+    combos, starts = np.unique(matchups_.hero, return_index=True)
+    return combos, starts, np.append(starts[1:], len(matchups_.hero))
+
+
+def _batch_combo_sums(matchups_: Matchups, seed: np.random.SeedSequence,
+                      size: int) -> tuple:
+    """
+    Samples one batch stratified by hero combo: every sample picks one of
+    hero's combos uniformly and a villain combo in proportion to the pair
+    weights. Returns the number of samples and the sum of hero's shares
+    per combo.
+    """
+    rng = np.random.default_rng(seed)
+    combos, starts, ends = _hero_blocks(matchups_)
+    cdf = np.cumsum(matchups_.weights)
+    low = np.concatenate([[0.], cdf])[starts]
+    high = cdf[ends - 1]
+    block = rng.integers(0, len(combos), size)
+    target = low[block] + rng.uniform(0, 1, size) * (high - low)[block]
+    picked = np.clip(np.searchsorted(cdf, target, side='right'),
+                     starts[block], ends[block] - 1)
+    shares = _deal(matchups_, picked, rng)
+    hero = matchups_.hero[picked]
+    return (np.bincount(hero, minlength=NO_OF_COMBOS),
+            np.bincount(hero, weights=shares, minlength=NO_OF_COMBOS))
+
+
+def _combo_equities(equities: np.ndarray, weights: np.ndarray,
+                    buckets: int) -> ComboEquities:
+    known = ~np.isnan(equities)
+    known_weights = np.where(known, weights, 0)
+    known_equities = np.where(known, equities, 0)
+    hand_weights = np.bincount(COMBO_HAND, weights=known_weights,
+                               minlength=NO_OF_HANDS)
+    hand_equities = np.full(NO_OF_HANDS, np.nan)
+    np.divide(np.bincount(COMBO_HAND, weights=known_weights * known_equities,
+                          minlength=NO_OF_HANDS),
+              hand_weights, out=hand_equities, where=hand_weights > 0)
+    edges = np.linspace(0, 1, buckets + 1)
+    histogram = np.histogram(equities[known], bins=edges,
+                             weights=weights[known])[0]
+    total = known_weights.sum()
+    return ComboEquities(equities, weights,
+                         hand_equities.reshape(NO_OF_RANKS, NO_OF_RANKS),
+                         histogram / total, edges,
+                         float(known_weights @ known_equities / total))
+
+
+def combo_equity(hero_range: AnyRange,
+                 villain_range: AnyRange,
+                 board: Cards = None,
+                 dead: Cards = None,
+                 iterations: int = 100_000,
+                 rng=None,
+                 method: str = 'auto',
+                 exact_budget: int = EXACT_BUDGET,
+                 buckets: int = 10,
+                 processes: Optional[int] = 1) -> ComboEquities:
+    """
+    Calculates the equity of every combo of hero's range against villain
+    in one pass, aggregated to the 13x13 hand grid and a histogram with
+    "buckets" equal equity buckets (see ComboEquities).
+
+    The arguments work as for equity(). The exact enumeration aggregates
+    the win and tie counts of all pairs by hero combo. Sampling spreads
+    "iterations" samples evenly over hero's combos.
+    """
+    _check_method(method)
+    matchups_ = matchups(hero_range, villain_range, board, dead)
+    processes = _processes(processes)
+    weights = np.bincount(matchups_.hero, weights=matchups_.weights,
+                          minlength=NO_OF_COMBOS)
+    equities = np.full(NO_OF_COMBOS, np.nan)
+    if _enumerates(matchups_, method, exact_budget):
+        wins, ties, n_runouts = _enumeration_counts(matchups_, processes)
+        shares = np.bincount(matchups_.hero,
+                             weights=matchups_.weights * (wins + ties / 2),
+                             minlength=NO_OF_COMBOS)
+        np.divide(shares, weights * n_runouts, out=equities,
+                  where=weights > 0)
+    else:
+        if iterations < 1:
+            raise EquityError(msg='At least one iteration is needed!')
+        counts = shares = 0
+        for batch_counts, batch_shares in _run(
+                matchups_, _batch_combo_sums, _batch_tasks(iterations, rng),
+                processes):
+            counts = counts + batch_counts
+            shares = shares + batch_shares
+        np.divide(shares, counts, out=equities, where=counts > 0)
+    return _combo_equities(equities, weights, buckets)
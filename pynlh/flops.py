@@ -0,0 +1,273 @@
+"""
+Range reports across all flops.
+
+The 22100 flops fall into 1755 classes that only differ by a relabeling of
+the suits (flop_classes()). analyze_flops() analyzes one flop per class
+(equity, combos left after card removal and the hand categories both
+ranges make) in a process pool and yields the results in class order.
+write_flop_report() streams them into a CSV file and appends the average
+over all flops, each class weighted by its number of flops.
+
+Only ranges of the 169 hands look the same on every flop of a class. A
+ComboRange like 'AhKh' does not, so its flops are analyzed one by one
+(all_flops()).
+"""
+
+import csv
+from functools import lru_cache
+from itertools import combinations
+from multiprocessing import Pool
+from pathlib import Path
+from typing import Iterator, NamedTuple, Optional, Union
+
+import numpy as np
+
+from .card import NO_OF_CARDS, int_to_card
+from .combo_range import ComboRange
+from .equity_engine import AnyRange, EquityError, as_range, equity
+from .evaluator import HAND_CATEGORIES, evaluate_combos, hand_category
+from .isomorphism import canonical_keys, unpack_key
+from .rank import RANKS
+from .suit import SUITS
+from .tools import get_seed_sequence
+
+# Flops analyzed per pool task.
+FLOPS_PER_TASK = 8
+TEXTURES = {1: 'monotone', 2: 'two-tone', 3: 'rainbow'}
+PAIRINGS = {1: 'trips', 2: 'paired', 3: 'unpaired'}
+_CATEGORY_COLUMNS = [category.lower().replace(' ', '_')
+                     for category in HAND_CATEGORIES]
+CSV_COLUMNS = (['flop', 'weight', 'texture', 'pairing', 'equity',
+                'std_error', 'hero_combos', 'villain_combos']
+               + [f'hero_{column}' for column in _CATEGORY_COLUMNS]
+               + [f'villain_{column}' for column in _CATEGORY_COLUMNS])
+
+
+class FlopClasses(NamedTuple):
+    """
+    - flops: One representative flop per class, shape (1755, 3) int8.
+    - weights: Number of flops in every class (summing up to 22100).
+    """
+    flops: np.ndarray
+    weights: np.ndarray
+
+
+class FlopAnalysis(NamedTuple):
+    """
+    Analysis of both ranges on one flop (or the weighted average over
+    flops for the flop 'all').
+
+    - equity, std_error: Hero's equity against villain (NaN if the ranges
+      have no non-colliding combos on the flop).
+    - hero_combos, villain_combos: Combos left after removing the flop
+      cards, weighted by their frequency.
+    - hero_categories, villain_categories: Share of the combos making each
+      of the HAND_CATEGORIES on the flop.
+    """
+    flop: str
+    weight: int
+    equity: float
+    std_error: float
+    hero_combos: float
+    villain_combos: float
+    hero_categories: np.ndarray
+    villain_categories: np.ndarray
+
+    def csv_row(self) -> list:
+        if self.flop == 'all':
+            texture = pairing = ''
+        else:
+            texture, pairing = flop_texture(self.flop)
+        return ([self.flop, self.weight, texture, pairing, self.equity,
+                 self.std_error, self.hero_combos, self.villain_combos]
+                + self.hero_categories.tolist()
+                + self.villain_categories.tolist())
+
+
+@lru_cache(maxsize=1)
+def flop_classes() -> FlopClasses:
+    """
+    Returns the 1755 suit-isomorphic flop classes. The representative of a
+    class is its canonical flop (see pynlh.isomorphism).
+    """
+    flops = np.fromiter(combinations(range(NO_OF_CARDS), 3),
+                        dtype=np.dtype((np.int64, 3)))
+    keys, weights = np.unique(canonical_keys(flops[:, None, :]),
+                              return_counts=True)
+    representatives = np.array([unpack_key(key, 3) for key in keys],
+                               dtype=np.int8)
+    for array in (representatives, weights):
+        array.flags.writeable = False
+    return FlopClasses(representatives, weights)
+
+
+@lru_cache(maxsize=1)
+def all_flops() -> FlopClasses:
+    """
+    Returns all 22100 flops, each as a class of its own (weight 1).
+    """
+    flops = np.fromiter(combinations(range(NO_OF_CARDS), 3),
+                        dtype=np.dtype((np.int8, 3)))
+    weights = np.ones(len(flops), dtype=np.int64)
+    for array in (flops, weights):
+        array.flags.writeable = False
+    return FlopClasses(flops, weights)
+
+
+def flop_str(flop: np.ndarray) -> str:
+    return ''.join(int_to_card(card) for card in flop)
+
+
+def flop_texture(flop: str) -> tuple:
+    """
+    Returns the suit texture ('monotone', 'two-tone', 'rainbow') and the
+    pairing ('trips', 'paired', 'unpaired') of a flop like 'AsKs7d'.
+    """
+    ranks = {RANKS[flop[i]] for i in range(0, 6, 2)}
+    suits = {SUITS[flop[i]] for i in range(1, 6, 2)}
+    return TEXTURES[len(suits)], PAIRINGS[len(ranks)]
+
+
+def _category_shares(range_: AnyRange, flop: str) -> tuple:
+    """
+    Returns the weighted number of combos of a range left on a flop and
+    the share of them making each hand category.
+    """
+    blocked = range_.remove_blockers(board=flop)
+    indices = blocked.combo_indices
+    shares = np.zeros(len(HAND_CATEGORIES))
+    if len(indices):
+        categories = hand_category(evaluate_combos(indices, flop))
+        shares = np.bincount(categories,
+                             weights=blocked.combo_freqs[indices],
+                             minlength=len(HAND_CATEGORIES))
+        shares /= shares.sum()
+    return blocked.weighted_combos, shares
+
+
+def analyze_flop(hero_range: AnyRange,
+                 villain_range: AnyRange,
+                 flop: str,
+                 weight: int = 1,
+                 **kwargs) -> FlopAnalysis:
+    """
+    Analyzes both ranges on one flop. "kwargs" are passed to equity().
+    """
+    hero_range = as_range(hero_range)
+    villain_range = as_range(villain_range)
+    try:
+        result = equity(hero_range, villain_range, board=flop, **kwargs)
+        equity_, std_error = result.equity, result.std_error
+    except EquityError:
+        equity_ = std_error = float('nan')
+    hero_combos, hero_categories = _category_shares(hero_range, flop)
+    villain_combos, villain_categories = _category_shares(villain_range,
+                                                          flop)
+    return FlopAnalysis(flop, weight, equity_, std_error, hero_combos,
+                        villain_combos, hero_categories, villain_categories)
+
+
+# Ranges and equity() arguments of a pool worker.
+_WORKER = {}
+
+
+def _init_worker(hero_range, villain_range, kwargs) -> None:
+    _WORKER.update(hero=hero_range, villain=villain_range, kwargs=kwargs)
+
+
+def _analyze_task(task: list) -> list:
+    return [analyze_flop(_WORKER['hero'], _WORKER['villain'], flop,
+                         weight, rng=seed, **_WORKER['kwargs'])
+            for flop, weight, seed in task]
+
+
+def analyze_flops(hero_range: AnyRange,
+                  villain_range: AnyRange,
+                  processes: Optional[int] = None,
+                  rng=None,
+                  iterations: int = 10_000,
+                  classes: FlopClasses = None,
+                  **kwargs) -> Iterator[FlopAnalysis]:
+    """
+    Yields the analysis of one flop of every flop class in class order.
+    "classes" restricts the analysis to some classes (default: all of
+    flop_classes(), or all_flops() if a range is a ComboRange). Flop
+    classes with more than one flop can't be used for ComboRanges, as
+    their combos are not suit symmetric. The flops are analyzed in a pool
+    of "processes" processes (None for one per CPU). Every flop gets its
+    own random stream derived from "rng", so a seed gives the same results
+    with any number of processes. "iterations" and "kwargs" are passed to
+    equity().
+    """
+    hero_range = as_range(hero_range)
+    villain_range = as_range(villain_range)
+    kwargs['iterations'] = iterations
+    combo_ranges = (isinstance(hero_range, ComboRange)
+                    or isinstance(villain_range, ComboRange))
+    if classes is None:
+        classes = all_flops() if combo_ranges else flop_classes()
+    elif combo_ranges and (np.asarray(classes.weights) != 1).any():
+        raise EquityError(msg='ComboRanges differ between the flops of a '
+                              'flop class. Analyze every flop (see '
+                              'all_flops()).')
+    seeds = get_seed_sequence(rng).spawn(len(classes.weights))
+    flops = [(flop_str(flop), int(weight), seed) for flop, weight, seed
+             in zip(classes.flops, classes.weights, seeds)]
+    if processes == 1:
+        for flop, weight, seed in flops:
+            yield analyze_flop(hero_range, villain_range, flop, weight,
+                               rng=seed, **kwargs)
+        return
+    tasks = [flops[i:i + FLOPS_PER_TASK]
+             for i in range(0, len(flops), FLOPS_PER_TASK)]
+    with Pool(processes, _init_worker,
+              (hero_range, villain_range, kwargs)) as pool:
+        for results in pool.imap(_analyze_task, tasks):
+            yield from results
+
+
+def _weighted_average(analyses: list) -> FlopAnalysis:
+    weights = np.array([a.weight for a in analyses])
+    equities = np.array([a.equity for a in analyses])
+    known = ~np.isnan(equities)
+    equity_ = float('nan')
+    if known.any():
+        equity_ = float(np.average(equities[known], weights=weights[known]))
+    return FlopAnalysis(
+        'all', int(weights.sum()), equity_, float('nan'),
+        float(np.average([a.hero_combos for a in analyses],
+                         weights=weights)),
+        float(np.average([a.villain_combos for a in analyses],
+                         weights=weights)),
+        np.average([a.hero_categories for a in analyses], axis=0,
+                   weights=weights),
+        np.average([a.villain_categories for a in analyses], axis=0,
+                   weights=weights))
+
+
+def write_flop_report(hero_range: AnyRange,
+                      villain_range: AnyRange,
+                      path: Union[str, Path],
+                      processes: Optional[int] = None,
+                      rng=None,
+                      **kwargs) -> FlopAnalysis:
+    """
+    Writes the analysis of every flop class (see analyze_flops) as CSV
+    file with the columns CSV_COLUMNS. Rows are written as they arrive.
+    The last row 'all' averages all flops weighted by their class size
+    (flops without non-colliding combos are left out of the equity). This
+    average is returned as well.
+    """
+    analyses = []
+    with open(path, 'w', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(CSV_COLUMNS)
+        for analysis in analyze_flops(hero_range, villain_range,
+                                      processes=processes, rng=rng,
+                                      **kwargs):
+            writer.writerow(analysis.csv_row())
+            file.flush()
+            analyses.append(analysis)
+        rv = _weighted_average(analyses)
+        writer.writerow(rv.csv_row())
+    return rv
@@ -1,16 +1,17 @@
-from functools import total_ordering
-from typing import List
-
-from .rank import RANKS
-from .suit import SUITS
-from .combo import Combo
-
 """
 Version: 0.02
 
 Author: GTOHOLE 11-20
 """
 
+from functools import total_ordering
+from typing import List
+
+from .rank import RANKS
+from .combo import Combo, combos_to_str, pick_mask
+from .combo_table import COMBO_STR, hand_combo_slice
+from .hand_table import HANDS_BY_NAME, SKLANSKY_MALMUTH_DEFAULT
+from .tools import Immutable
 
 class HandError(Exception):
     """
@@ -28,59 +29,94 @@ class HandError(Exception):
 
 
 @total_ordering
-class Hand():
-
-    def __init__(self,
-                 handstring: str = None,
-                 hand: str = None,
-                 hand_type: str = None,
-                 freq: float = 100.00,
-                 ) -> None:
-        """
-        Pynlh's Hand class.
-        Can be instantiated either by giving it a "handstring" like "AKs"
-        or a "hand" like "AK" and a "hand_type" like "offsuit", "suited,
-        "nosuit" or "pair".
-        """
+class Hand(Immutable):
+    """
+    Pynlh's Hand class.
+    Can be instantiated either by giving it a "handstring" like "AKs"
+    or a "hand" like "AK" and a "hand_type" like "offsuit", "suited,
+    "nosuit" or "pair".
+
+    Hands are immutable and interned by their canonical handstring:
+    Hand('AKs'), Hand('aks') and Hand('KAs') return the same object.
+    Frequencies are kept by the Range, not by the Hand.
+    """
+    __slots__ = ('hand', 'hand_type', 'handstring', 'rank1', 'rank2',
+                 'class_skl_mal')
+    _instances = {}
+
+    def __new__(cls,
+                handstring: str = None,
+                hand: str = None,
+                hand_type: str = None,
+                ) -> 'Hand':
+        if handstring is not None:
+            try:
+                return cls._instances[handstring]
+            except KeyError:
+                pass
+            if len(handstring) not in (2, 3):
+                raise HandError(handstring)
+        self = super().__new__(cls)
         self.hand = hand
         self.hand_type = hand_type
         self.handstring = handstring
-        self.freq = freq
         self._set_default_values()
         try:
             self.rank1 = RANKS[self.hand[0]]
             self.rank2 = RANKS[self.hand[1]]
-        except KeyError or TypeError:
+        except (KeyError, TypeError, IndexError):
+            raise HandError(self.handstring)
+        if (self.hand_type is None or len(self.hand) != 2
+                or (self.hand_type == 'pair') != (self.rank1 == self.rank2)):
             raise HandError(self.handstring)
+        if self.rank1.order > self.rank2.order:
+            # 'KAs' is 'AKs'.
+            self.rank1, self.rank2 = self.rank2, self.rank1
+            self.hand = self.hand[::-1]
+            self.handstring = self.eval_handstring()
+        # Interned by the canonical handstring only, so the cache holds at
+        # most one instance per hand (169 plus 78 "nosuit" hands).
+        try:
+            return cls._instances[self.handstring]
+        except KeyError:
+            pass
         self.class_skl_mal = self.get_sklansky_malmuth_handclass()
+        self._freeze()
+        return cls._instances.setdefault(self.handstring, self)
+
+    def __reduce__(self):
+        return (self.__class__, (self.handstring,))
+
+    def __hash__(self) -> int:
+        return hash(self.handstring)
 
     @property
     def all_combos_str(self):
-        cards_list = []
-        rv = []
-        for suit in SUITS:
-            for rank in self.hand:
-                cards_list.append(rank+suit)
-        for card1 in cards_list:
-            for card2 in cards_list:
-                if ((card1 != card2) and (card1[0] == self.hand[0]) and
-                        (card2[0] == self.hand[1]) and
-                        ((card1+card2) not in rv) and (card2+card1) not in rv):
-                    rv.append(card1+card2)
-        if self.hand_type == 'pair':
-            rv = [c for c in rv if c[0] == c[2]]
-        elif self.hand_type == 'suited':
-            rv = [c for c in rv if c[1] == c[3]]
-        elif self.hand_type == 'offsuit':
-            rv = [c for c in rv if (c[0] != c[2]) and (c[1] != c[3])]
-        elif self.hand_type == 'nosuit':
-            rv = [c for c in rv if (c[0] != c[2])]
-        return rv
+        return [COMBO_STR[i] for i in self.combo_indices]
+
+    @property
+    def combo_indices(self) -> List[int]:
+        """
+        The positions of the hand's combos in pynlh's combo table.
+        "Nosuit" hands consist of the suited and the offsuit combos.
+        """
+        return [i for s in self.combo_slices
+                for i in range(s.start, s.stop)]
+
+    @property
+    def combo_slices(self) -> List[slice]:
+        if self.hand_type == 'nosuit':
+            handstrings = [self.hand + 's', self.hand + 'o']
+        else:
+            handstrings = [self.handstring]
+        try:
+            return [hand_combo_slice(h) for h in handstrings]
+        except KeyError:
+            raise HandError(self.handstring) from None
 
     @property
     def combos(self) -> List[Combo]:
-        return [Combo(combo_str=combo, freq=self.freq)
-                for combo in self.all_combos_str]
+        return [Combo.from_index(i) for i in self.combo_indices]
 
     @property
     def index_x(self):
@@ -184,41 +220,19 @@ class Hand():
                 return "offsuit"
 
     def get_sklansky_malmuth_handclass(self):
-        if self.handstring in ["AA", "AKs", "KK", "QQ", "JJ"]:
-            return 1
-        elif self.handstring in ["AKo", "AQs", "AJs", "KQs", "TT"]:
-            return 2
-        elif self.handstring in ["AQo", "ATs", "KJs", "QJs", "JTs", "99"]:
-            return 3
-        elif self.handstring in ["AJo", "KQo", "KTs", "QTs", "J9s", "T9s",
-                                 "98s", "88"]:
-            return 4
-        elif self.handstring in ["A9s", "A8s", "A7s", "A6s", "A5s", "A4s",
-                                 "A3s", "A2s", "KJo", "QJo", "JTo", "Q9s",
-                                 "T8s", "97s", "87s", "77", "76s", "66", ]:
-            return 5
-        elif self.handstring in ["ATo", "KTo", "QTo", "J8s", "86s", "75s",
-                                 "65s", "55", "54s"]:
-            return 6
-        elif self.handstring in ["K9s", "K8s", "K7s", "K6s", "K5s", "K4s",
-                                 "K3s", "K2s", "J9o", "T9o", "98o", "64s",
-                                 "53s", "44", "43s", "33", "22"]:
-            return 7
-        elif self.handstring in ["A9o", "K9o", "Q9o", "J8o", "J7s", "T8o",
-                                 "96s", "87o", "85s", "76o", "74s", "65o",
-                                 "54o", "42s", "32s", "K9o", "Q9o", "J8o",
-                                 "J7s", "T8o", "96s", "87o", "85s", "76o",
-                                 "74s", "65o", "54o", "42s", "32s", "K9o",
-                                 "Q9o", "J8o", "J7s", "T8o", "96s", "87o",
-                                 "85s", "76o", "74s", "65o", "54o", "42s",
-                                 "32s"]:
-            return 8
-        else:
-            return 9
+        hand = HANDS_BY_NAME.get(self.handstring)
+        if hand is None:
+            return SKLANSKY_MALMUTH_DEFAULT
+        return hand.skl_mal
 
-    def pick_combos(self, as_str=False) -> List[Combo]:
-        if not as_str:
-            return [combo for combo in self.combos if combo.pick()]
-
-        combos_list = [str(combo) for combo in self.combos if combo.pick()]
-        return ','.join(combos_list)
+    def pick_combos(self, as_str=False, rng=None,
+                    freq: float = 100.00) -> List[Combo]:
+        """
+        Picks every combo of the hand with the given frequency.
+        """
+        indices = self.combo_indices
+        picked = pick_mask([freq] * len(indices), rng=rng)
+        indices = [i for i, p in zip(indices, picked) if p]
+        if as_str:
+            return combos_to_str(indices)
+        return [Combo.from_index(i) for i in indices]
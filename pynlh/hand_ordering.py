@@ -0,0 +1,189 @@
+"""
+Orderings of the 169 hands for percentage ranges like '15%' or '10%-20%'.
+
+A HandOrdering ranks all hands from best to worst and keeps the number of
+combos of every prefix of the ranking. A percentage is resolved to the
+prefix with the number of combos closest to that share of all 1326 combos.
+The prefix of every possible number of combos is precomputed
+("prefix_lengths"), so resolving a percentage is one lookup.
+
+ORDERINGS holds the named orderings. 'equity' (the default) ranks the
+hands by their all-in equity against a random hand, 'sklansky_malmuth' by
+their Sklansky-Malmuth group (by equity within a group). More orderings
+can be added with register_ordering(), e.g. the exact equity ranking from
+the preflop matrix:
+
+    register_ordering('exact',
+                      HandOrdering.from_values(preflop.equity_vs_random()))
+"""
+
+from typing import Dict, Iterable, Sequence, Union
+
+import numpy as np
+
+from .hand_table import HAND_TABLE, HANDS_BY_NAME, NO_OF_COMBOS
+
+DEFAULT_ORDERING = 'equity'
+# The hands by all-in equity against a random hand, best first (Monte Carlo
+# with 20 million showdowns per hand).
+EQUITY_VS_RANDOM = (
+    'AA', 'KK', 'QQ', 'JJ', 'TT', '99', '88', 'AKs', '77', 'AQs', 'AJs', 'AKo',
+    'ATs', 'AQo', 'AJo', 'KQs', '66', 'A9s', 'ATo', 'KJs', 'A8s', 'KTs', 'KQo',
+    'A7s', 'A9o', 'KJo', '55', 'QJs', 'K9s', 'A5s', 'A6s', 'A8o', 'KTo', 'QTs',
+    'A4s', 'A7o', 'K8s', 'A3s', 'QJo', 'K9o', 'A6o', 'A5o', 'Q9s', 'JTs',
+    'K7s', 'A2s', 'QTo', '44', 'A4o', 'K6s', 'K8o', 'Q8s', 'A3o', 'K5s', 'J9s',
+    'Q9o', 'JTo', 'K7o', 'A2o', 'K4s', 'Q7s', 'K6o', 'K3s', 'J8s', 'T9s', '33',
+    'Q8o', 'Q6s', 'K5o', 'J9o', 'K2s', 'Q5s', 'T8s', 'J7s', 'K4o', 'Q4s',
+    'Q7o', 'T9o', 'J8o', 'K3o', 'Q6o', 'Q3s', '98s', 'T7s', 'J6s', 'K2o', '22',
+    'Q2s', 'Q5o', 'J5s', 'T8o', 'J7o', 'Q4o', '97s', 'J4s', 'T6s', 'J3s',
+    'Q3o', '98o', '87s', 'T7o', 'J6o', '96s', 'J2s', 'Q2o', 'T5s', 'J5o',
+    'T4s', '97o', '86s', 'J4o', 'T6o', '95s', 'T3s', '76s', 'J3o', '87o',
+    'T2s', '85s', '96o', 'J2o', 'T5o', '94s', '75s', 'T4o', '93s', '86o',
+    '65s', '84s', '95o', 'T3o', '92s', '76o', '74s', 'T2o', '54s', '85o',
+    '64s', '83s', '94o', '75o', '82s', '73s', '93o', '65o', '53s', '63s',
+    '84o', '92o', '43s', '74o', '54o', '72s', '64o', '52s', '62s', '83o',
+    '82o', '42s', '73o', '53o', '63o', '32s', '43o', '72o', '52o', '62o',
+    '42o', '32o')
+
+
+class HandOrderingError(Exception):
+    pass
+
+    def __init__(self, msg: str = 'Not a valid hand ordering!'):
+        """
+        Exception class of pynlh's hand orderings.
+        """
+        self.msg = msg
+        super().__init__(self.msg)
+
+
+def _hand_index(hand: Union[str, int]) -> int:
+    if isinstance(hand, str):
+        try:
+            return HANDS_BY_NAME[hand].index
+        except KeyError:
+            raise HandOrderingError(msg=f"'{hand}' is not a valid hand!")
+    return int(hand)
+
+
+def _prefix_lengths(cumulative_combos: np.ndarray) -> np.ndarray:
+    """
+    For every number of combos (0-1326) the length of the prefix with the
+    closest number of combos (the shorter one on a tie).
+    """
+    combos = np.arange(NO_OF_COMBOS + 1)
+    longer = np.searchsorted(cumulative_combos, combos)
+    shorter = np.maximum(longer - 1, 0)
+    use_shorter = (combos - cumulative_combos[shorter]
+                   <= cumulative_combos[longer] - combos)
+    return np.where(use_shorter, shorter, longer)
+
+
+class HandOrdering():
+
+    def __init__(self, hands: Iterable[Union[str, int]]) -> None:
+        """
+        A ranking of all 169 hands from best to worst, given as handstrings
+        like 'AKs' or as positions in pynlh's hand table.
+
+        - indices: Hand table positions of the hands, best first.
+        - cumulative_combos: Number of combos of the best n hands (170
+          entries, starting with 0).
+        - prefix_lengths: Number of best hands closest to every number of
+          combos (1327 entries).
+        """
+        self.indices = np.array([_hand_index(hand) for hand in hands],
+                                dtype=np.int64)
+        if sorted(self.indices.tolist()) != list(range(len(HAND_TABLE))):
+            raise HandOrderingError(msg='An ordering must hold each of the '
+                                        '169 hands exactly once!')
+        n_combos = np.array([HAND_TABLE[i].n_combos for i in self.indices])
+        self.cumulative_combos = np.concatenate([[0], np.cumsum(n_combos)])
+        self.prefix_lengths = _prefix_lengths(self.cumulative_combos)
+        for array in (self.indices, self.cumulative_combos,
+                      self.prefix_lengths):
+            array.flags.writeable = False
+
+    @classmethod
+    def from_values(cls, values: Sequence[float]) -> 'HandOrdering':
+        """
+        Ranks the hands by 169 values (in the order of pynlh's hand table),
+        the highest value first. Hands with equal values keep the order of
+        the hand table.
+        """
+        values = np.asarray(values, dtype=float)
+        if values.shape != (len(HAND_TABLE),):
+            raise HandOrderingError(msg='An ordering needs one value per '
+                                        'hand (169 values)!')
+        return cls(np.argsort(-values, kind='stable'))
+
+    @property
+    def hands(self) -> list:
+        """
+        The handstrings of the hands, best first.
+        """
+        return [HAND_TABLE[i].handstring for i in self.indices]
+
+    def prefix_length(self, percent: float) -> int:
+        """
+        Number of best hands making up "percent" (0-100) percent of all
+        combos.
+        """
+        if not 0 <= percent <= 100:
+            raise HandOrderingError(msg=f'{percent} is not a valid '
+                                        f'percentage (0-100)!')
+        return int(self.prefix_lengths[round(percent * NO_OF_COMBOS / 100)])
+
+    def top(self, percent: float) -> np.ndarray:
+        """
+        Hand table positions of the best "percent" percent of all hands.
+        """
+        return self.indices[:self.prefix_length(percent)]
+
+    def between(self, lower: float, upper: float) -> np.ndarray:
+        """
+        Hand table positions of the hands from the best "lower" to the best
+        "upper" percent (like 10-20 for the second best tenth).
+        """
+        lower, upper = sorted((lower, upper))
+        return self.indices[self.prefix_length(lower):
+                            self.prefix_length(upper)]
+
+
+def _sklansky_malmuth(equity: HandOrdering) -> HandOrdering:
+    rank = np.empty(len(HAND_TABLE), dtype=np.int64)
+    rank[equity.indices] = np.arange(len(HAND_TABLE))
+    groups = np.array([hand.skl_mal for hand in HAND_TABLE])
+    return HandOrdering(np.lexsort((rank, groups)))
+
+
+ORDERINGS: Dict[str, HandOrdering] = {}
+ORDERINGS[DEFAULT_ORDERING] = HandOrdering(EQUITY_VS_RANDOM)
+ORDERINGS['sklansky_malmuth'] = _sklansky_malmuth(ORDERINGS[DEFAULT_ORDERING])
+
+
+def register_ordering(name: str,
+                      ordering: Union[HandOrdering, Iterable],
+                      ) -> HandOrdering:
+    """
+    Adds a named ordering (a HandOrdering or the 169 hands, best first).
+    Registered orderings can't be replaced, as compiled percentage ranges
+    are cached by their range string.
+    """
+    if name in ORDERINGS:
+        raise HandOrderingError(msg=f"The ordering '{name}' already "
+                                    f"exists!")
+    if not isinstance(ordering, HandOrdering):
+        ordering = HandOrdering(ordering)
+    ORDERINGS[name] = ordering
+    return ordering
+
+
+def get_ordering(name: str = None) -> HandOrdering:
+    """
+    Returns the ordering registered as "name" (default: DEFAULT_ORDERING).
+    """
+    try:
+        return ORDERINGS[name or DEFAULT_ORDERING]
+    except KeyError:
+        raise HandOrderingError(msg=f"Unknown hand ordering '{name}'!")
@@ -0,0 +1,99 @@
+"""
+Precomputed table of all 169 No-Limit Holdem hands.
+
+The table is built once at import time and is ordered like the 13x13 grid
+(index = (x - 1) * 13 + (y - 1)), which is also the order of the frequency
+vector of pynlh's Range class.
+"""
+
+from types import MappingProxyType
+from typing import NamedTuple
+
+from .rank import NLH_SHORTS
+
+SKLANSKY_MALMUTH_GROUPS = {
+    1: ('AA', 'AKs', 'KK', 'QQ', 'JJ'),
+    2: ('AKo', 'AQs', 'AJs', 'KQs', 'TT'),
+    3: ('AQo', 'ATs', 'KJs', 'QJs', 'JTs', '99'),
+    4: ('AJo', 'KQo', 'KTs', 'QTs', 'J9s', 'T9s', '98s', '88'),
+    5: ('A9s', 'A8s', 'A7s', 'A6s', 'A5s', 'A4s', 'A3s', 'A2s', 'KJo', 'QJo',
+        'JTo', 'Q9s', 'T8s', '97s', '87s', '77', '76s', '66'),
+    6: ('ATo', 'KTo', 'QTo', 'J8s', '86s', '75s', '65s', '55', '54s'),
+    7: ('K9s', 'K8s', 'K7s', 'K6s', 'K5s', 'K4s', 'K3s', 'K2s', 'J9o', 'T9o',
+        '98o', '64s', '53s', '44', '43s', '33', '22'),
+    8: ('A9o', 'K9o', 'Q9o', 'J8o', 'J7s', 'T8o', '96s', '87o', '85s', '76o',
+        '74s', '65o', '54o', '42s', '32s'),
+}
+SKLANSKY_MALMUTH_DEFAULT = 9
+
+COMBOS_PER_HAND_TYPE = {'pair': 6, 'suited': 4, 'offsuit': 12}
+
+
+class HandInfo(NamedTuple):
+    """
+    One row of the hand table.
+
+    - index: Position in the table (and in Range.freqs).
+    - handstring: Like 'AKs'.
+    - x, y: index_x and index_y of the hand in the 13x13 grid.
+    - hand_type: 'pair', 'suited' or 'offsuit'.
+    - skl_mal: The Sklansky-Malmuth group (1-9).
+    - n_combos: Number of combos of the hand (6, 4 or 12).
+    - combo_slice: Position of the hand's combos in the 1326 combo table.
+    """
+    index: int
+    handstring: str
+    x: int
+    y: int
+    hand_type: str
+    skl_mal: int
+    n_combos: int
+    combo_slice: slice
+
+
+def _build_hand_table() -> tuple:
+    skl_mal = {hand: group
+               for group, hands in SKLANSKY_MALMUTH_GROUPS.items()
+               for hand in hands}
+    rv = []
+    combo_start = 0
+    for n, rank in enumerate(NLH_SHORTS):
+        for n2, rank2 in enumerate(NLH_SHORTS):
+            if n == n2:
+                hand, hand_type = rank + rank2, 'pair'
+            elif n > n2:
+                hand, hand_type = rank2 + rank + 's', 'suited'
+            else:
+                hand, hand_type = rank + rank2 + 'o', 'offsuit'
+            n_combos = COMBOS_PER_HAND_TYPE[hand_type]
+            rv.append(HandInfo(
+                index=len(rv),
+                handstring=hand,
+                x=n + 1,
+                y=n2 + 1,
+                hand_type=hand_type,
+                skl_mal=skl_mal.get(hand, SKLANSKY_MALMUTH_DEFAULT),
+                n_combos=n_combos,
+                combo_slice=slice(combo_start, combo_start + n_combos),
+            ))
+            combo_start += n_combos
+    return tuple(rv)
+
+
+HAND_TABLE = _build_hand_table()
+HANDS_BY_NAME = MappingProxyType({h.handstring: h for h in HAND_TABLE})
+HANDS_BY_XY = MappingProxyType({(h.x, h.y): h for h in HAND_TABLE})
+NO_OF_COMBOS = sum(h.n_combos for h in HAND_TABLE)
+
+
+def find_hand(hand: str) -> HandInfo:
+    """
+    Looks up a hand (like 'AKs' or Hand('AKs')) in the table. Hands with
+    swapped ranks (like '23o') are found as well. Returns None for unknown
+    hands.
+    """
+    hand = str(hand)
+    rv = HANDS_BY_NAME.get(hand)
+    if rv is None:
+        rv = HANDS_BY_NAME.get(hand[1::-1] + hand[2:])
+    return rv
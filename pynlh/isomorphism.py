@@ -0,0 +1,75 @@
+"""
+Suit isomorphism.
+
+Poker situations that only differ by a relabeling of the suits (e.g. AhKh
+vs QsQc and AdKd vs QhQs) are equivalent. canonical_keys() maps groups of
+cards (hole cards, boards) to the minimum over all 24 suit permutations
+of their packed, sorted cards, so isomorphic situations share one key.
+"""
+
+from itertools import permutations
+
+import numpy as np
+
+from .card import NO_OF_CARDS
+from .combo_table import COMBO_CARDS
+
+SUIT_PERMUTATIONS = np.array(list(permutations(range(4))), dtype=np.int64)
+# PERMUTED_CARDS[p, card] is the card with its suit relabeled by the
+# permutation p (card = rank * 4 + suit).
+PERMUTED_CARDS = (np.arange(NO_OF_CARDS) // 4 * 4
+                  + SUIT_PERMUTATIONS[:, np.arange(NO_OF_CARDS) % 4])
+PERMUTED_CARDS.flags.writeable = False
+
+
+def _build_combo_permutations() -> np.ndarray:
+    combo_of_cards = np.zeros((NO_OF_CARDS, NO_OF_CARDS), dtype=np.int64)
+    combos = np.arange(len(COMBO_CARDS))
+    combo_of_cards[COMBO_CARDS[:, 0], COMBO_CARDS[:, 1]] = combos
+    combo_of_cards[COMBO_CARDS[:, 1], COMBO_CARDS[:, 0]] = combos
+    return combo_of_cards[PERMUTED_CARDS[:, COMBO_CARDS[:, 0]],
+                          PERMUTED_CARDS[:, COMBO_CARDS[:, 1]]]
+
+
+# COMBO_PERMUTATIONS[p, combo] is the combo table index of the combo with
+# its suits relabeled by the permutation p.
+COMBO_PERMUTATIONS = _build_combo_permutations()
+COMBO_PERMUTATIONS.flags.writeable = False
+# Bits per card in a key.
+CARD_BITS = 6
+
+
+def pack_cards(cards: np.ndarray) -> np.ndarray:
+    """
+    Packs the last axis of an array of cards into one integer per row,
+    the first card in the highest bits.
+    """
+    rv = np.zeros(cards.shape[:-1], dtype=np.int64)
+    for i in range(cards.shape[-1]):
+        rv = (rv << CARD_BITS) | cards[..., i]
+    return rv
+
+
+def canonical_keys(groups: np.ndarray) -> np.ndarray:
+    """
+    Returns the suit-canonical key of every row of "groups", an array of
+    shape (n, g, k) holding g groups of k cards per row (like the hole
+    cards of hero and villain with shape (n, 2, 2) or flops with shape
+    (n, 1, 3)). The cards within a group are unordered, the groups are
+    not. Rows have the same key if and only if a suit permutation maps
+    one to the other.
+    """
+    groups = np.asarray(groups, dtype=np.int64)
+    n, g, k = groups.shape
+    permuted = np.sort(PERMUTED_CARDS[:, groups], axis=-1)
+    return pack_cards(permuted.reshape(len(SUIT_PERMUTATIONS), n, g * k)
+                      ).min(axis=0)
+
+
+def unpack_key(key: int, n_cards: int) -> list:
+    """
+    Returns the cards of a packed key (see pack_cards).
+    """
+    mask = (1 << CARD_BITS) - 1
+    return [(int(key) >> CARD_BITS * (n_cards - 1 - i)) & mask
+            for i in range(n_cards)]
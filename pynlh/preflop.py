@@ -0,0 +1,233 @@
+"""
+Preflop all-in equity from a precomputed 169x169 hand matrix.
+
+PREFLOP_FILE holds hero's win and tie share for every pair of hands,
+averaged over all non-colliding combo pairs. Range versus range equity is
+then a product of the matrix with both frequency vectors, weighted by
+PAIR_COUNTS (the number of non-colliding combo pairs of two hands), and
+takes microseconds.
+
+The matrix is built once offline with the exact enumeration engine:
+
+    python -m pynlh.preflop --build [--processes N]
+
+Every hand pair is enumerated on all 2.6 million boards, so the build
+takes a few CPU hours (about half an hour on 8 cores). The file is
+memory-mapped when it is first used.
+"""
+
+import argparse
+import os
+from math import comb
+from multiprocessing import Pool
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+import numpy as np
+
+from .card import NO_OF_CARDS
+from .combo_table import COMBO_CARDS, COMBO_HAND, COMBO_MASK
+from .equity_engine import EquityResult, Matchups, enumerate_equity
+from .hand_table import HAND_TABLE, HANDS_BY_NAME
+from .isomorphism import canonical_keys
+from .range import Range
+
+PREFLOP_FILE = Path(__file__).parent / 'data' / 'preflop.npy'
+NO_OF_HANDS = len(HAND_TABLE)
+# Boards dealt to every pair of combos.
+BOARDS_PER_PAIR = comb(NO_OF_CARDS - 4, 5)
+
+
+class PreflopError(Exception):
+    pass
+
+    def __init__(self, msg: str = 'Cannot calculate the preflop equity!'):
+        """
+        Exception class of pynlh's preflop equity matrix.
+        """
+        self.msg = msg
+        super().__init__(self.msg)
+
+
+def _build_pair_counts() -> np.ndarray:
+    hero, villain = np.nonzero((COMBO_MASK[:, None] & COMBO_MASK) == 0)
+    hands = COMBO_HAND[hero].astype(np.int64) * NO_OF_HANDS \
+        + COMBO_HAND[villain]
+    return np.bincount(hands, minlength=NO_OF_HANDS ** 2).reshape(
+        NO_OF_HANDS, NO_OF_HANDS)
+
+
+# PAIR_COUNTS[i, j]: Number of pairs of a combo of hand i and a combo of
+# hand j without a common card.
+PAIR_COUNTS = _build_pair_counts()
+PAIR_COUNTS.flags.writeable = False
+
+
+def _hand_index(hand: Union[str, int]) -> int:
+    if isinstance(hand, str):
+        try:
+            return HANDS_BY_NAME[hand].index
+        except KeyError:
+            raise PreflopError(msg=f"'{hand}' is not a valid hand!")
+    return int(hand)
+
+
+def representatives(hero_hand: Union[str, int],
+                    villain_hand: Union[str, int]) -> Matchups:
+    """
+    The combo pairs of two hands reduced by suit isomorphism. Hero always
+    holds the first combo of its hand, every villain combo class is
+    represented once and weighted by its size.
+    """
+    hero = np.flatnonzero(COMBO_HAND == _hand_index(hero_hand))[0]
+    villain = np.flatnonzero(COMBO_HAND == _hand_index(villain_hand))
+    villain = villain[(COMBO_MASK[villain] & COMBO_MASK[hero]) == 0]
+    cards = np.stack([np.broadcast_to(COMBO_CARDS[hero], (len(villain), 2)),
+                      COMBO_CARDS[villain]], axis=1)
+    _, first, counts = np.unique(canonical_keys(cards), return_index=True,
+                                 return_counts=True)
+    return Matchups(np.full(len(first), hero), villain[first],
+                    counts.astype(float), np.zeros(0, dtype=np.int8), 0)
+
+
+def hand_pair_equity(hero_hand: Union[str, int],
+                     villain_hand: Union[str, int]) -> EquityResult:
+    """
+    Exact all-in equity of one hand against another (like 'AKs' vs 'QQ').
+    """
+    return enumerate_equity(representatives(hero_hand, villain_hand))
+
+
+def _win_tie(pair: tuple) -> tuple:
+    result = hand_pair_equity(*pair)
+    return pair, result.win, result.tie
+
+
+def build_matrix(hands: Iterable[Union[str, int]] = None,
+                 processes: Optional[int] = None,
+                 verbose: bool = False) -> np.ndarray:
+    """
+    Enumerates the win and tie shares of all pairs of "hands" (default:
+    all 169) and returns them as array of shape (2, 169, 169). Entries of
+    other hands are NaN. Every hand pair is one task of a process pool
+    with "processes" processes (None for one per CPU).
+    """
+    if hands is None:
+        hands = range(NO_OF_HANDS)
+    hands = sorted({_hand_index(hand) for hand in hands})
+    pairs = [(i, j) for i in hands for j in hands if i <= j]
+    rv = np.full((2, NO_OF_HANDS, NO_OF_HANDS), np.nan)
+    with Pool(processes) as pool:
+        results = pool.imap_unordered(_win_tie, pairs)
+        for n, ((i, j), win, tie) in enumerate(results, 1):
+            rv[:, i, j] = win, tie
+            # Villain wins what hero neither wins nor ties.
+            rv[:, j, i] = 1 - win - tie, tie
+            if verbose and n % 100 == 0:
+                print(f"{n}/{len(pairs)} hand pairs")
+    return rv
+
+
+def build(path: Union[str, Path] = PREFLOP_FILE,
+          processes: Optional[int] = None,
+          verbose: bool = False) -> None:
+    """
+    Builds the full matrix and saves it as .npy file.
+    """
+    path = Path(path)
+    matrix = build_matrix(processes=processes, verbose=verbose)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix('.tmp.npy')
+    np.save(tmp, matrix)
+    os.replace(tmp, path)
+    _MATRICES.pop(path, None)
+
+
+# Loaded (memory-mapped) matrices by path.
+_MATRICES = {}
+
+
+def load_matrix(path: Union[str, Path] = PREFLOP_FILE) -> np.ndarray:
+    """
+    Returns the memory-mapped matrix of win and tie shares with shape
+    (2, 169, 169).
+    """
+    path = Path(path)
+    if path not in _MATRICES:
+        if not path.exists():
+            raise PreflopError(
+                msg=f"The preflop equity matrix '{path}' does not exist. "
+                    f"Build it once with 'python -m pynlh.preflop --build'.")
+        matrix = np.load(path, mmap_mode='r')
+        if matrix.shape != (2, NO_OF_HANDS, NO_OF_HANDS):
+            raise PreflopError(msg=f"'{path}' is not a preflop equity "
+                                   f"matrix (shape {matrix.shape})!")
+        _MATRICES[path] = matrix
+    return _MATRICES[path]
+
+
+def _hand_freqs(range_: Union[Range, str]) -> np.ndarray:
+    if isinstance(range_, str):
+        range_ = Range(range_)
+    if not isinstance(range_, Range):
+        raise PreflopError(msg='The preflop matrix needs 169-hand ranges '
+                               '(Range or range string). Use equity() for '
+                               'combo ranges.')
+    return range_.freqs / 100
+
+
+def preflop_equity(hero_range: Union[Range, str],
+                   villain_range: Union[Range, str],
+                   path: Union[str, Path] = PREFLOP_FILE) -> EquityResult:
+    """
+    Exact preflop all-in equity of two ranges from the precomputed matrix.
+    The pair of two hands is weighted by both frequencies times the
+    number of their non-colliding combo pairs.
+    """
+    win_tie = load_matrix(path)
+    hero = _hand_freqs(hero_range)
+    villain = _hand_freqs(villain_range)
+    weights = np.outer(hero, villain) * PAIR_COUNTS
+    total = weights.sum()
+    if not total:
+        raise PreflopError(msg='The ranges have no non-colliding combos!')
+    used = weights > 0
+    if np.isnan(win_tie[:, used]).any():
+        raise PreflopError(msg='The preflop matrix misses hand pairs of '
+                               'these ranges!')
+    win = float((weights[used] * win_tie[0][used]).sum() / total)
+    tie = float((weights[used] * win_tie[1][used]).sum() / total)
+    return EquityResult(win + tie / 2, win, tie, 0.,
+                        int(PAIR_COUNTS[used].sum()) * BOARDS_PER_PAIR)
+
+
+def equity_vs_random(path: Union[str, Path] = PREFLOP_FILE) -> np.ndarray:
+    """
+    Exact all-in equity of every hand against a random hand (169 values in
+    the order of pynlh's hand table), e.g. for a HandOrdering.
+    """
+    win_tie = load_matrix(path)
+    equities = (win_tie[0] + win_tie[1] / 2) * PAIR_COUNTS
+    return equities.sum(axis=1) / PAIR_COUNTS.sum(axis=1)
+
+
+def main(args=None) -> None:
+    parser = argparse.ArgumentParser(
+        prog='python -m pynlh.preflop',
+        description='Preflop all-in equity matrix.')
+    parser.add_argument('--build', action='store_true',
+                        help='enumerate all hand pairs and save the matrix')
+    parser.add_argument('--output', default=str(PREFLOP_FILE),
+                        help='matrix file (default: %(default)s)')
+    parser.add_argument('--processes', type=int, default=None,
+                        help='worker processes (default: one per CPU)')
+    args = parser.parse_args(args)
+    if not args.build:
+        parser.print_help()
+        return
+    build(args.output, processes=args.processes, verbose=True)
+    print(f"Saved {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -4,16 +4,121 @@ Version: 0.02
 Author: GTOHOLE 11-20
 """
 from typing import List
-from pandas import DataFrame
-from random import sample
-from copy import deepcopy
 
+import numpy as np
+
+from .blockers import BlockedRange, live_combos, remove_blockers
+from .combo import Combo, combos_to_str, pick_mask
+from .combo_table import COMBO_HAND, hand_combo_slice
 from .hand import Hand
-from .rank import RANKS
+from .hand_table import HAND_TABLE, HANDS_BY_XY, find_hand
+from .range_cache import RANGE_CACHE
+from .range_encoder import encode_range, format_freq
+from .range_parser import (RangeError, compile_range, expand_part,
+                           parse_range)
+from .tools import get_rng
+
+
+class RangeArithmetic():
+    """
+    Frequency arithmetic shared by Range (169 hands) and ComboRange (1326
+    combos). Subclasses keep their frequencies (0-100) in "freqs", expand
+    them to all combos in "combo_freqs" and create new instances with
+    "_wrap". Combining a Range with a ComboRange returns a ComboRange.
+    """
+
+    def _operands(self, other: 'RangeArithmetic') -> tuple:
+        if self.freqs.shape == other.freqs.shape:
+            return self.freqs, other.freqs, self._wrap
+        from .combo_range import ComboRange
+        return self.combo_freqs, other.combo_freqs, ComboRange._wrap
+
+    def __add__(self, other: 'RangeArithmetic') -> 'RangeArithmetic':
+        a, b, wrap = self._operands(other)
+        return wrap(np.minimum(a + b, 100))
+
+    def __sub__(self, other: 'RangeArithmetic') -> 'RangeArithmetic':
+        a, b, wrap = self._operands(other)
+        return wrap(np.maximum(a - b, 0))
+
+    def __and__(self, other: 'RangeArithmetic') -> 'RangeArithmetic':
+        return self.intersect(other)
+
+    def __or__(self, other: 'RangeArithmetic') -> 'RangeArithmetic':
+        return self.maximum(other)
+
+    def __mul__(self, factor: float) -> 'RangeArithmetic':
+        return self.scale(factor)
+
+    __rmul__ = __mul__
+
+    def intersect(self, other: 'RangeArithmetic') -> 'RangeArithmetic':
+        """
+        Returns the hands that are in both ranges with the lower of both
+        frequencies. Same as minimum().
+        """
+        return self.minimum(other)
+
+    def minimum(self, other: 'RangeArithmetic') -> 'RangeArithmetic':
+        """
+        Returns a new range with the element-wise minimum of both
+        frequencies.
+        """
+        a, b, wrap = self._operands(other)
+        return wrap(np.minimum(a, b))
+
+    def maximum(self, other: 'RangeArithmetic') -> 'RangeArithmetic':
+        """
+        Returns a new range with the element-wise maximum of both
+        frequencies.
+        """
+        a, b, wrap = self._operands(other)
+        return wrap(np.maximum(a, b))
+
+    def scale(self, factor: float) -> 'RangeArithmetic':
+        """
+        Returns a new range with all frequencies multiplied by factor and
+        clipped to 0-100. (e.g. Range('[50]AA[/50]').scale(.5) -> 25% AA)
+        """
+        return self._wrap(np.clip(self.freqs * factor, 0, 100))
+
+    def clip(self, lower: float = 0,
+             upper: float = 100) -> 'RangeArithmetic':
+        """
+        Returns a new range with all frequencies clipped to lower-upper.
+        """
+        return self._wrap(np.clip(self.freqs, lower, upper))
+
+    def remove_blockers(self, board=None, dead=None) -> BlockedRange:
+        """
+        Removes the combos that share a card with the board or the dead
+        cards (like 'AsKd7c'). Returns the surviving combos, the remaining
+        combos per hand and the weighted number of combos.
+        """
+        return remove_blockers(self.combo_freqs, board, dead)
+
+    def live_combo_indices(self, board=None, dead=None) -> np.ndarray:
+        """
+        The positions of the range's combos in pynlh's combo table without
+        the combos blocked by the board or the dead cards.
+        """
+        combo_indices = self.combo_indices
+        if board is None and dead is None:
+            return combo_indices
+        return combo_indices[live_combos(board, dead)[combo_indices]]
+
+    def normalize(self) -> 'RangeArithmetic':
+        """
+        Returns a new range scaled so that its highest frequency is 100.
+        """
+        top = self.freqs.max()
+        if top == 0:
+            return self._wrap(self.freqs.copy())
+        return self._wrap(self.freqs * (100 / top))
 
 
-class Range():
-    def __init__(self, range_str: str):
+class Range(RangeArithmetic):
+    def __init__(self, range_str: str, ordering: str = None):
         '''This class represents a range and is usually defined by a
         range string like 'AA,QQ-TT,AKs,QJo-Q9o,[56.0]KQs-KTs[/56.0]'.
 
@@ -31,93 +136,146 @@ class Range():
         - AK-AJ --> AKo, AKs, AQs, AQo, ,AJs, Ajo
         - [50]AA, KK[/50], QQ
         - [50]AA-QQ[/50]
+        - 15% --> the best 15% of all combos
+        - [50]10%-20%[/50] --> the hands between the best 10% and 20%
         - ...
 
         Remarks:
 
-        ";" will be replaced by a ","
+        ";" and line breaks will be replaced by a ","
+
+        The frequencies are stored in "freqs", a NumPy vector with one slot
+        per hand of the 13x13 grid (see "grid_index"). A hand with a
+        frequency of 0 is not part of the range. Compiled range strings are
+        kept in a process-wide LRU cache (see pynlh.range_cache), so only the
+        copy of the cached vector is made for a known range string.
+
+        Percentages are resolved with the hand ordering "ordering" (see
+        pynlh.hand_ordering, default: 'equity'). Ranges of other orderings
+        are not cached and keep the resolved hands as "range_str".
         '''
-        self.range_str = range_str.replace(";", ",").replace('\n', '')
-        self.parts: List[RangePart] = []
-        self.hands_dict: dict = self.build_0freq_hands_dict()
-        self.converted_range_dict: dict = self.convert_range_str_to_dict()
-        self._validate_input()
+        self.range_str = range_str.replace(";", ",").replace('\n', ',')
+        # The string as given is compiled, so errors point into it.
+        if ordering is None:
+            self.freqs: np.ndarray = RANGE_CACHE.get(range_str).copy()
+        else:
+            self.freqs = compile_range(range_str, ordering)
+            self.range_str = encode_range(self.freqs)
 
     def __delitem__(self, hand):
-        del self.converted_range_dict[hand]
+        if hand not in self:
+            raise KeyError(hand)
+        self.freqs[self.grid_index(hand)] = 0
+        self._range_str = None
 
     def __setitem__(self, hand, freq):
-        self.converted_range_dict[hand] = freq
+        self.freqs[self.grid_index(hand)] = freq
+        self._range_str = None
 
     def __getitem__(self, hand):
-        return self.converted_range_dict[hand]
+        if hand not in self:
+            raise KeyError(hand)
+        return float(self.freqs[self.grid_index(hand)])
 
     def __iter__(self):
-        return iter(self.converted_range_dict.items())
+        return ((GRID_HANDS[i], float(self.freqs[i]))
+                for i in np.flatnonzero(self.freqs))
 
     def __contains__(self, key) -> bool:
-        return key in self.converted_range_dict
-
-    def __sub__(self, other: 'Range') -> 'Range':
-        diff = deepcopy(self)
-        for hand, freq in other:
-            if hand in self:
-                s_freq = self[hand]
-                if freq < s_freq:
-                    diff[hand] = s_freq - freq
-                else:
-                    del diff[hand]
-        return diff
+        i = self._find_grid_index(key)
+        return i is not None and self.freqs[i] > 0
 
     def __len__(self):
-        return len(self.converted_range_dict)
-
-    def __add__(self, other: 'Range') -> 'Range':
-        sum_ = deepcopy(self)
-        for hand, o_freq in other:
-            if hand in self:
-                s_freq = self[hand]
-                if s_freq < 100:
-                    new_freq = s_freq + o_freq
-                    sum_[hand] = min(new_freq, 100)
-            else:
-                sum_[hand] = o_freq
-
-        return sum_
+        return int(np.count_nonzero(self.freqs))
 
     @property
     def combos(self) -> list:
         """
-        Collects all Combo objects from RangePart objects and
+        Collects all Combo objects from the hands of the range and
         consolidates them in one list, that is returned
         """
-        return [combo for part in self.parts for combo in part.combos]
+        return [Combo.from_index(i) for i in self.combo_indices]
+
+    @property
+    def combo_freqs(self) -> np.ndarray:
+        """
+        The frequencies of the range expanded to all 1326 combos (in the
+        order of pynlh's combo table).
+        """
+        return self.freqs[COMBO_HAND]
+
+    @property
+    def combo_indices(self) -> np.ndarray:
+        """
+        The positions of the range's combos in pynlh's combo table.
+        """
+        return np.flatnonzero(self.combo_freqs)
+
+    @property
+    def hands(self) -> List[Hand]:
+        return [Hand(handstring=hand) for hand, _ in self]
+
+    @property
+    def converted_range_dict(self) -> dict:
+        """
+        Dictionary view of the range like {'AA': 100, 'KK': 50.0}.
+        Built from "freqs" on every access.
+        """
+        return dict(self)
+
+    @property
+    def hands_dict(self) -> dict:
+        """
+        Dictionary with all No-Limit Holdem hands like
+        {'AA': [100, 1, 1], 'AKo': [0, 1, 2] ...} whereas the values
+        represent [Frequency, Index_x, Index_y]. Built from "freqs" on every
+        access.
+        """
+        return {hand.handstring: [float(self.freqs[hand.index]),
+                                  hand.x, hand.y]
+                for hand in HAND_TABLE}
+
+    @property
+    def parts(self) -> List['RangePart']:
+        """
+        The RangePart objects of the range string. Those are parsed from
+        "range_str" on every access and are not kept with the Range.
+        """
+        str_no_space = self.range_str.replace(" ", "")
+        return [RangePart(part=part_str, my_range_obj=self)
+                for part_str in self.split_range_str_in_parts(str_no_space)]
 
     def __repr__(self) -> str:
         return f"Range({self.range_str})"
 
     def __str__(self) -> str:
-        return self.range_str
+        """
+        The canonical range string, which is equal for equal ranges
+        regardless of how they were created.
+        """
+        return encode_range(self.freqs)
 
-    def _validate_input(self):
+    @staticmethod
+    def grid_index(hand: str) -> int:
         """
-        Validates the range string. Checks for valid characters.
+        Returns the position of a hand (like 'AKs') in the "freqs" vector,
+        which is (index_x - 1) * 13 + (index_y - 1).
         """
-        for ch in self.range_str.upper():
-            if ch not in 'AKQJT9876543210,-OS []./+':
-                err_msg = ch + RangeError.ERR003_NOT_VALID_CHAR
-                raise RangeError(self.range_str, msg=err_msg)
+        i = Range._find_grid_index(hand)
+        if i is None:
+            raise KeyError(hand)
+        return i
 
     @staticmethod
-    def _flatten_l_of_ls(x) -> list:
+    def _find_grid_index(hand: str) -> int:
         """
-        Helperfunction that's flattens lists of lists.
+        Looks up the grid index of a hand and returns None for unknown hands.
+        Hands with swapped ranks (like '23o') are found as well.
         """
-        rv = []
-        for sub in x:
-            for itm in sub:
-                rv.append(itm)
-        return rv
+        hand = find_hand(hand)
+        if hand is None:
+            return None
+        return hand.index
 
     @staticmethod
     def build_0freq_hands_dict() -> dict:
@@ -127,50 +285,61 @@ class Range():
         the values represent [Frequency, Index_x, Index_y]. Whereas the
         Frequency will always be 0.
         """
-        hands_dict = {}
-        i = 0
-        for n, rank in enumerate(RANKS):
-            for n2, rank2 in enumerate(RANKS):
-                i += 1
-                if rank == rank2:
-                    # hand_type = "pair"
-                    hand = rank + rank2
-                elif n > n2:
-                    # hand_type = "suited"
-                    hand = rank2 + rank + 's'
-                else:
-                    # hand_type = "offsuit"
-                    hand = rank + rank2 + 'o'
-                hands_dict[hand] = [0, n + 1, n2 + 1]
-        return hands_dict
+        return {hand.handstring: [0, hand.x, hand.y] for hand in HAND_TABLE}
+
+    @classmethod
+    def from_freqs(cls, freqs: np.ndarray, range_str: str = None) -> 'Range':
+        """
+        Creates a Range directly from a vector of 169 frequencies (in the
+        order of "grid_index") without parsing a range string. If no
+        range_str is given, one is built from the frequencies.
+        """
+        freqs = np.array(freqs, dtype=float)
+        if freqs.shape != (GRID_SIZE,):
+            raise RangeError(str(freqs.shape),
+                             msg=RangeError.ERR004_WRONG_SHAPE)
+        return cls._wrap(freqs, range_str)
+
+    @classmethod
+    def _wrap(cls, freqs: np.ndarray, range_str: str = None) -> 'Range':
+        """
+        Creates a Range around an existing frequency vector without copying
+        or checking it. Used for the results of the range arithmetic.
+        """
+        rv = cls.__new__(cls)
+        rv.freqs = freqs
+        rv._range_str = range_str
+        return rv
+
+    @property
+    def range_str(self) -> str:
+        """
+        The range string of the range. Ranges created by arithmetic build it
+        from their frequencies on first access.
+        """
+        if self._range_str is None:
+            self._range_str = self.build_range_str()
+        return self._range_str
+
+    @range_str.setter
+    def range_str(self, range_str: str):
+        self._range_str = range_str
+
+    def build_range_str(self) -> str:
+        """
+        Builds the canonical range string like 'KK+,[50]QQ[/50]' from the
+        frequencies (see pynlh.range_encoder).
+        """
+        return encode_range(self.freqs)
 
     @staticmethod
     def full_range() -> 'Range':
-        return Range('''22+,23o,42o+,52o+,62o+,72o+,82o+,92o+,T2o+,J2o+,Q2o+,K2o+,
-                     A2o+,23s,42s+,52s+,62s+,72s+,82s+,92s+,T2s+,J2s+,Q2s+,K2s+,
-                     A2s+''')
+        return Range._wrap(np.full(GRID_SIZE, 100.0),
+                           range_str=FULL_RANGE_STR)
 
-    @classmethod
-    def build_xy_dict(cls: 'Range') -> dict:
-        return {(x, y): hand for hand, (_, x, y)
-                in cls.build_0freq_hands_dict().items()}
-
-    def build_df_freqs_and_combos_skl_mal(self) -> DataFrame:
-        """
-        Takes Range object and creates a DataFrame grouped by
-        Sklansky-Malmuth-Groups and frequencies.
-        """
-        hands = []
-        for h, f in self.converted_range_dict.items():
-            hand = Hand(handstring=h)
-            hand_dict = {'hand': hand.handstring,
-                         'group': hand.class_skl_mal,
-                         'combos': hand.all_combos_str,
-                         'freq': f}
-            hands.append(hand_dict)
-        df = DataFrame(hands)
-        df = df.groupby(['group', 'freq']).agg(list)
-        return df
+    @staticmethod
+    def build_xy_dict() -> dict:
+        return {xy: hand.handstring for xy, hand in HANDS_BY_XY.items()}
 
     def convert_range_str_to_dict(self) -> dict:
         """
@@ -183,29 +352,48 @@ class Range():
                 , 'KTs': 56.0}"""
 
         rv = {}
-        str_no_space = self.range_str.replace(" ", "")
-        str_split = self.split_range_str_in_parts(str_no_space)
-        for part_str in str_split:
-            self.parts.append(RangePart(part=part_str,
-                                        my_range_obj=self))
-        for part in self.parts:
-            for h in part.hands_str:
-                rv[h] = part.freq
+        for part in parse_range(self.range_str):
+            for i in part.indices:
+                rv[GRID_HANDS[i]] = part.freq
         return rv
 
-    def pick_combos(self, as_str=False):
-        if not as_str:
-            return [combo for part in self.parts
-                    for combo in part.pick_combos()]
+    def pick_combo_indices(self, rng=None, board=None,
+                           dead=None) -> np.ndarray:
+        """
+        Picks every combo of the range with its frequency and returns the
+        positions of the picked combos in pynlh's combo table. All random
+        numbers are drawn in one vectorized call.
+        "rng" can be a seed or a NumPy Generator for reproducible picks.
+        Combos blocked by "board" or "dead" cards are never picked.
+        """
+        combo_indices = self.live_combo_indices(board, dead)
+        picked = pick_mask(self.freqs[COMBO_HAND[combo_indices]], rng=rng)
+        return combo_indices[picked]
+
+    def pick_combos_bulk(self, n_samples: int, rng=None, board=None,
+                         dead=None) -> np.ndarray:
+        """
+        Draws n_samples independent pick_combos() randomizations at once.
+        Returns a boolean (n_samples, 1326) array with True for the picked
+        combos (in the order of pynlh's combo table).
+        """
+        combo_indices = self.live_combo_indices(board, dead)
+        rv = np.zeros((n_samples, len(COMBO_HAND)), dtype=bool)
+        rv[:, combo_indices] = pick_mask(
+            self.freqs[COMBO_HAND[combo_indices]], rng=rng, size=n_samples)
+        return rv
 
-        combos_list = [str(combo) for part in self.parts
-                       for combo in part.pick_combos()]
-        return ','.join(combos_list)
+    def pick_combos(self, as_str=False, rng=None, board=None, dead=None):
+        indices = self.pick_combo_indices(rng=rng, board=board, dead=dead)
+        if as_str:
+            return combos_to_str(indices)
+        return [Combo.from_index(i) for i in indices]
 
     def randomize_suits_for_range(self,
                                   grouping='skl-mal',
                                   combo_delimiter=',',
-                                  debug=False):
+                                  debug=False,
+                                  rng=None):
         """
         Takes a Range object and creates rangestring with frequencies
         approximately applied using suits.
@@ -218,107 +406,67 @@ class Range():
 
         - grouping='skl-mal'  -  uses the Sklansky-Malmuth groups to return the
             number of combos per group with frequencies applied.
+
+        "rng" can be a seed or a NumPy Generator for reproducible results.
+        """
+        indices = self.randomize_suits_indices(grouping=grouping, rng=rng)
+        return combos_to_str(indices, combo_delimiter=combo_delimiter)
+
+    def randomize_suits_indices(self, grouping='skl-mal',
+                                rng=None) -> np.ndarray:
+        """
+        Array version of randomize_suits_for_range. Returns the positions of
+        the chosen combos in pynlh's combo table.
+
+        The combos are grouped (by hand or by Sklansky-Malmuth group and
+        frequency), and round(freq / 100 * combos of the group) combos are
+        sampled without replacement from every group.
         """
-        randomized_suits_string = ''
-        combos_list = []
-        rv = ''
+        combo_indices = self.combo_indices
+        hands = COMBO_HAND[combo_indices]
+        freqs = self.freqs[hands]
         if grouping == 'by_hand':
-            for h, f in self.converted_range_dict.items():
-                hand = Hand(handstring=h)
-                no_of_combos = (f/100) * len(hand.all_combos_str)
-                combos_list.append(
-                    sample(hand.all_combos_str, round(no_of_combos)))
-            for x in combos_list:
-                for combo in x:
-                    rv += combo + combo_delimiter
-            randomized_suits_string = rv[:-len(combo_delimiter)]
-            return randomized_suits_string
+            keys = (hands,)
         elif grouping == 'skl-mal':
-            df = self.build_df_freqs_and_combos_skl_mal()
-            ls_comobs_hand = []
-            rv_list = []
-            df['flat_combos'] = df['combos'].apply(self._flatten_l_of_ls, 1)
-            df['no. of combos'] = df['flat_combos'].apply(len, 1)
-            df['Calc no. of combos'] = 0
-            for (grp, freq), (_, combos_lists, _, _, _) in df.iterrows():
-                ls_comobs_hand = []
-                for combos_list in combos_lists:
-                    ls_comobs_hand += combos_list
-                no_of_combos = round((freq/100) * len(ls_comobs_hand))
-                df.loc[(grp, freq), 'Calc no. of combos'] = no_of_combos
-                ls_combos_grp = sample(ls_comobs_hand, no_of_combos)
-                rv_list += ls_combos_grp
-            for combo in rv_list:
-                rv += combo + combo_delimiter
-            randomized_suits_string = rv[:-len(combo_delimiter)]
-            # print(df.head(10))
-            return randomized_suits_string
+            keys = (freqs, HAND_SKL_MAL[hands])
+        else:
+            raise RangeError(grouping, msg=RangeError.ERR005_GROUPING)
+        if len(combo_indices) == 0:
+            return combo_indices
+        # Sort the combos by group and number the groups.
+        order = np.lexsort(keys)
+        sorted_keys = np.stack([k[order] for k in keys])
+        new_group = np.any(sorted_keys[:, 1:] != sorted_keys[:, :-1], axis=0)
+        group_ids = np.concatenate(([0], np.cumsum(new_group)))
+        group_sizes = np.bincount(group_ids)
+        group_freqs = np.zeros(len(group_sizes))
+        group_freqs[group_ids] = freqs[order]
+        no_of_combos = np.round(group_freqs / 100 * group_sizes)
+        # Shuffle within the groups and keep the first no_of_combos each.
+        shuffled = np.lexsort((get_rng(rng).random(len(order)), group_ids))
+        group_starts = np.cumsum(group_sizes) - group_sizes
+        rank_in_group = np.arange(len(order)) - group_starts[group_ids]
+        keep = rank_in_group < no_of_combos[group_ids]
+        return combo_indices[order[shuffled[keep]]]
 
     def split_range_str_in_parts(self, range_str: str = None) -> List[str]:
         """
         Parses the given rangestring and returns a list with it's partial
         strings in a list.
         """
-        r_str = ''
-        if range_str is not None:
-            r_str = range_str
-        elif self.range_str != '':
-            r_str = self.range_str
-        else:
-            raise RangeError(self.range_str, msg="Unknown Error!")
-        read_freq = False
-        read_part = True
-        freq_str = ''
-        part_str = ''
-        freq_end = True
-        rv = []
-        freq = 100
-        for i, chr in enumerate(r_str):
-            if read_freq:
-                freq_str += chr
-            elif read_part:
-                part_str += chr
-            if ((chr == ',') or (i == len(r_str) - 1)):
-                part_str = part_str.replace('[', '').replace(']', '')
-                part_str = part_str.replace(',', '')
-                rv.append(f"[{freq}]{part_str}[/{freq}]")
-                part_str = ''
-                if freq_end:
-                    freq = 100
-                    freq_str = ''
-            if chr == '[':
-                read_freq = True
-                freq_end = False
-            elif chr == ']':
-                if '/' in freq_str:
-                    freq_end = True
-                else:
-                    freq = float(freq_str.replace('[', '').replace(']', ''))
-                read_freq = False
-            else:
-                read_part = True
-        return rv
-
-
-class RangeError(Exception):
-    """
-    Exception class of pynlh's Range class.
-    """
-    pass
-
-    ERR001_LEN_NOT_EQUAL = """Length of starting hand is not equal to the
-                           ending hand of this Range Part. ERR001"""
-    ERR002_PAIR_LEN_NOT_2 = """The length of a pair Range Part must be exactly
-                            2. - ERR002"""
-    ERR003_NOT_VALID_CHAR = ' is not a valid character for a range - ERR003'
+        if range_str is None:
+            range_str = self.range_str
+        return [f"[{part.freq}]{part.part}[/{part.freq}]"
+                for part in parse_range(range_str)]
 
-    def __init__(self, range_str: str, msg: str = 'Not a valid range!'):
-        self.range_str = range_str
-        self.msg = msg
-        super().__init__(self.msg)
 
-    def __str__(self):
-        return f"'{self.range_str}' -> {self.msg}"
+GRID_SIZE = len(HAND_TABLE)
+FULL_RANGE_STR = (
+    '22+,23o,42o+,52o+,62o+,72o+,82o+,92o+,T2o+,J2o+,Q2o+,K2o+,A2o+,23s,42s+,'
+    '52s+,62s+,72s+,82s+,92s+,T2s+,J2s+,Q2s+,K2s+,A2s+'
+)
+GRID_HANDS = tuple(hand.handstring for hand in HAND_TABLE)
+HAND_SKL_MAL = np.array([hand.skl_mal for hand in HAND_TABLE])
 
 
 class RangePart():
@@ -368,7 +516,18 @@ class RangePart():
         Collects all Combo objects from Hand objects and consolidates them
         in one list, that is returned
         """
-        return [combo for hand in self.hands for combo in hand.combos]
+        return [Combo.from_index(i) for i in self.combo_indices]
+
+    @property
+    def combo_indices(self) -> List[int]:
+        """
+        The positions of the part's combos in pynlh's combo table.
+        """
+        rv = []
+        for hand in self.hands_str:
+            combo_slice = hand_combo_slice(hand)
+            rv += range(combo_slice.start, combo_slice.stop)
+        return rv
 
     @property
     def is_range(self):
@@ -388,8 +547,7 @@ class RangePart():
 
     @property
     def hands(self) -> List[Hand]:
-        return [Hand(handstring=hand, freq=self.freq)
-                for hand in self.hands_str]
+        return [Hand(handstring=hand) for hand in self.hands_str]
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(part={self.part})"
@@ -401,21 +559,7 @@ class RangePart():
         """
         Gets hands from range string. Returns a list of all hands.
         """
-        if self.is_range:
-            return self.get_hands_from_range()
-        if self.part_no_freq[0] == self.part_no_freq[1]:
-            if len(self.part_no_freq) != 2:
-                raise RangeError(self.part,
-                                 msg=RangeError.ERR002_PAIR_LEN_NOT_2)
-            return [self.part_no_freq]
-        else:
-            hand = Hand(handstring=self.part_no_freq)
-            if hand.hand_type == 'nosuit':
-                return [self.part_no_freq + 's', self.part_no_freq + 'o']
-            elif hand.hand_type in ['suited', 'offsuit']:
-                return [self.part_no_freq]
-            else:
-                raise RangeError(self.part)
+        return expand_part(self.part_no_freq)
 
     def check_has_freq(self):
         """
@@ -438,107 +582,13 @@ class RangePart():
         else:
             return 100
 
-    def get_start_hand_for_plus_range(self,
-                                      end_hand: Hand) -> Hand:
-        end_x = end_hand.index_x
-        end_y = end_hand.index_y
-        if end_hand.hand_type == 'suited':
-            start_y = end_y
-            start_x = end_y + 1
-        elif end_hand.hand_type in ['offsuit', 'nosuit']:
-            start_x = end_x
-            start_y = end_x + 1
-        elif end_hand.hand_type == 'pair':
-            return Hand(handstring='AA')
-        else:
-            raise RangeError(self.part)
-        d = self.my_range_obj.hands_dict.items()
-        rv_list = [hand for hand, (_, x, y) in d if ((x == start_x)
-                                                     and (start_y == y))]
-        if len(rv_list) == 1:
-            return Hand(handstring=rv_list[0])
-        else:
-            raise RangeError(self.part_no_freq)
-
-    def get_hands_from_range(self):
-        """
-        Finds hands in a hand range (like QQ-TT). Will return a list
-        with all hands including the starting hand (QQ)
-        and the ending hand (TT).
-
-        The rangepart string without frequency tags is used for this.
-
-        'QQ-TT'
-            -->
-        ['QQ', 'JJ', 'TT']
-        """
-        rv = []
-        s = self.part_no_freq
-        start_hand = ''
-        if (self.plus not in s) and (self.range_identifier in s):
-            start_hand = Hand(handstring=s[:s.find(self.range_identifier)])
-            end_hand = Hand(handstring=s[s.find(self.range_identifier) + 1:])
-            if len(start_hand) != len(end_hand):
-                raise RangeError(self.part,
-                                 msg=RangeError.ERR001_LEN_NOT_EQUAL)
-            elif start_hand.hand_type != end_hand.hand_type:
-                raise RangeError(self.part)
-        elif self.is_plus_range:
-            end_hand = Hand(handstring=s.replace(self.plus, ''))
-            start_hand = self.get_start_hand_for_plus_range(end_hand)
-        else:
-            raise RangeError(self.part)
-        start_x = start_hand.index_x
-        start_y = start_hand.index_y
-        end_x = end_hand.index_x
-        end_y = end_hand.index_y
-
-        rv.append(start_hand.handstring)
-        new_hands_dict = {}
-        h = self.my_range_obj.hands_dict
-        if start_hand.hand_type == 'pair':
-            # Pair: x-index (right) must be between start and end hand
-            # and y-index (down) must be between start and end hand.
-            new_hands_dict = {
-                key: (x, y)
-                for (key, (_, x, y)) in h.items() if ((y > start_y)
-                                                      and (y < end_y)
-                                                      and (x > start_x)
-                                                      and (x < end_x)
-                                                      and (y == x))
-            }
-        elif start_hand.hand_type == 'suited':
-            # Suited: x-index (right) must lie between start and end
-            # hand and y-index must remain the same.
-            new_hands_dict = {
-                key: (x, y)
-                for (key, (_, x, y)) in h.items() if ((x > start_x)
-                                                      and (x < end_x)
-                                                      and (y == start_y)
-                                                      and (y == end_y))
-            }
-        elif start_hand.hand_type == 'offsuit':
-            # Offsuit: y-index (down) must be between start and end
-            # hand x-index must remain the same.
-            new_hands_dict = {
-                key: (x, y)
-                for (key, (_, x, y)) in h.items() if ((y > start_y)
-                                                      and (y < end_y)
-                                                      and (x == start_x)
-                                                      and (x == end_x))
-            }
-        for key in new_hands_dict:
-            rv.append(Hand(handstring=key).handstring)
-        rv.append(end_hand.handstring)
-        return rv
-
-    def pick_combos(self, as_str=False):
-        if not as_str:
-            return [combo for hand in self.hands
-                    for combo in hand.pick_combos()]
-        combos_list = [str(combo) for hand in self.hands
-                       for combo in hand.pick_combos()]
-        return ','.join(combos_list)
+    def pick_combos(self, as_str=False, rng=None):
+        indices = np.array(self.combo_indices, dtype=int)
+        indices = indices[pick_mask(np.full(len(indices), self.freq),
+                                    rng=rng)]
+        if as_str:
+            return combos_to_str(indices)
+        return [Combo.from_index(i) for i in indices]
 
     def remove_freq_tag(self):
         """Removes the frequency tag from a range part string. Returns a
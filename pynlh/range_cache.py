@@ -0,0 +1,122 @@
+"""
+Process-wide LRU cache of compiled range strings.
+
+Range strings are normalized (whitespace between tokens removed, ';' and
+line breaks replaced by ',') and mapped to their read-only 169-slot
+frequency vector, so the same chart is only compiled once per process.
+Whitespace within a token (like 'A Ks' or '[5 0]') is kept, so an invalid
+range string never shares its key with a valid one. On a miss the range
+string itself is compiled, so errors point into the string the caller
+passed.
+"""
+
+import re
+from collections import OrderedDict
+from threading import Lock
+from typing import Callable, NamedTuple
+
+import numpy as np
+
+from .range_parser import compile_range
+
+# Whitespace between two characters that may belong to one token (first
+# group) or between tokens.
+_WHITESPACE_RE = re.compile(r'(?<=[\w.%\[])(\s+)(?=[\w.%/])|\s+')
+# Runs of separators, which are read like one.
+_COMMAS_RE = re.compile(r',{2,}')
+
+
+def _whitespace_key(m) -> str:
+    if '\n' in m.group() and not _in_tag(m.string, m.start()):
+        # A line break separates parts like ','.
+        return ','
+    return ' ' if m.group(1) else ''
+
+
+def _in_tag(range_str: str, pos: int) -> bool:
+    return range_str.rfind('[', 0, pos) > range_str.rfind(']', 0, pos)
+
+
+class RangeCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+def normalize_range_str(range_str: str) -> str:
+    """
+    Normalizes a range string to its cache key.
+    (e.g. 'AA-JJ;\\n[25]ATs+[/25]' -> 'AA-JJ,[25]ATs+[/25]', but
+    'A K s' -> 'A K s')
+    """
+    return _COMMAS_RE.sub(',', _WHITESPACE_RE.sub(_whitespace_key, range_str)
+                          .replace(';', ','))
+
+
+class RangeCache():
+
+    def __init__(self,
+                 maxsize: int = 256,
+                 compile_func: Callable[[str], np.ndarray] = compile_range,
+                 ) -> None:
+        """
+        A thread-safe, size-bounded LRU cache mapping normalized range
+        strings to read-only frequency vectors. Once "maxsize" range strings
+        are cached, the least recently used one is evicted.
+        """
+        self.maxsize = maxsize
+        self.compile_func = compile_func
+        self._data = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __contains__(self, range_str: str) -> bool:
+        return normalize_range_str(range_str) in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, range_str: str) -> np.ndarray:
+        """
+        Returns the read-only frequency vector of a range string and compiles
+        it on a cache miss. Invalid range strings raise a RangeError and are
+        not cached. Misses compile "range_str" as given, so the positions
+        of errors refer to it.
+        """
+        key = normalize_range_str(range_str)
+        with self._lock:
+            freqs = self._data.get(key)
+            if freqs is not None:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return freqs
+            self.misses += 1
+        freqs = self.compile_func(range_str)
+        freqs.flags.writeable = False
+        with self._lock:
+            self._data[key] = freqs
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+        return freqs
+
+    def info(self) -> RangeCacheInfo:
+        with self._lock:
+            return RangeCacheInfo(self.hits, self.misses, self.evictions,
+                                  self.maxsize, len(self._data))
+
+    def clear(self):
+        """
+        Empties the cache and resets its counters.
+        """
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+
+RANGE_CACHE = RangeCache()
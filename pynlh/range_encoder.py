@@ -0,0 +1,151 @@
+"""
+Canonical encoder for 169-slot frequency vectors, the inverse of
+range_parser.compile_range.
+
+encode_range() sweeps the grid once, groups the hands by frequency and
+writes every group with the shortest of the plain and the merged notation:
+
+- pairs: 'QQ+', 'JJ-88', '55'
+- rows:  'ATs+', 'KQo-KTo', 'AT+' (suited and offsuit), 'K9s'
+- frequencies: the 100% group comes first, the other groups follow by
+  descending frequency as '[50]...[/50]'.
+
+The row and group encodings are memoized. The result only depends on the
+frequencies, so equal ranges are encoded to identical strings.
+"""
+
+from functools import lru_cache
+from typing import List, Tuple
+
+import numpy as np
+
+from .hand_table import HANDS_BY_NAME
+from .rank import NLH_SHORTS as R
+
+def format_freq(freq: float) -> str:
+    """
+    Formats a frequency for a range string. (e.g. 50.0 -> '50',
+    5.2 -> '5.2')
+    """
+    freq_str = repr(float(freq))
+    if freq_str.endswith('.0'):
+        return freq_str[:-2]
+    return freq_str
+
+
+def _build_key_index() -> np.ndarray:
+    """
+    The grid indices swept by the encoder as a (25, 13) array: the pairs
+    by rank in the first line, then the suited and then the offsuit hands
+    of every row (the hands sharing their higher rank) by kicker. Empty
+    cells point to an extra slot behind the 169 hands.
+    """
+    rv = np.full((1 + 2 * (len(R) - 1), len(R)), len(HANDS_BY_NAME))
+    rv[0] = [HANDS_BY_NAME[r + r].index for r in R]
+    for line, suit in ((1, 's'), (len(R), 'o')):
+        for i, high in enumerate(R[:-1]):
+            for k in range(i + 1, len(R)):
+                rv[line + i, k] = HANDS_BY_NAME[high + R[k] + suit].index
+    return rv
+
+
+_KEY_INDEX = _build_key_index()
+_RANK_BITS = 1 << np.arange(len(R), dtype=np.int64)
+
+
+def _runs(mask: int) -> List[Tuple[int, int]]:
+    """
+    Splits a bitmask of rank indices into runs of consecutive ranks.
+    (0b100111 -> [(0, 2), (5, 5)])
+    """
+    rv = []
+    rank = 0
+    while mask:
+        if mask & 1:
+            if rv and rv[-1][1] == rank - 1:
+                rv[-1] = (rv[-1][0], rank)
+            else:
+                rv.append((rank, rank))
+        mask >>= 1
+        rank += 1
+    return rv
+
+
+def _pair_parts(mask: int) -> List[str]:
+    rv = []
+    for first, last in _runs(mask):
+        if first == last:
+            rv.append(R[first] * 2)
+        elif first == 0:
+            rv.append(R[last] * 2 + '+')
+        else:
+            rv.append(f'{R[first] * 2}-{R[last] * 2}')
+    return rv
+
+
+def _row_parts(row: int, kickers: int, suit: str) -> List[str]:
+    rv = []
+    for first, last in _runs(kickers):
+        first_hand = R[row] + R[first] + suit
+        last_hand = R[row] + R[last] + suit
+        if first == last:
+            rv.append(first_hand)
+        elif first == row + 1:
+            rv.append(last_hand + '+')
+        else:
+            rv.append(f'{first_hand}-{last_hand}')
+    return rv
+
+
+@lru_cache(maxsize=4096)
+def _encode_row(row: int, suited: int, offsuit: int) -> Tuple[str, ...]:
+    """
+    Encodes a row (given as bitmasks of the kickers) either as suited and
+    offsuit parts or with the kickers of both merged to parts without
+    suit ('AT+'), whichever is shorter.
+    """
+    plain = _row_parts(row, suited, 's') + _row_parts(row, offsuit, 'o')
+    both = suited & offsuit
+    if not both:
+        return tuple(plain)
+    merged = (_row_parts(row, both, '')
+              + _row_parts(row, suited & ~both, 's')
+              + _row_parts(row, offsuit & ~both, 'o'))
+    if len(','.join(merged)) < len(','.join(plain)):
+        return tuple(merged)
+    return tuple(plain)
+
+
+@lru_cache(maxsize=1024)
+def _encode_group(masks: Tuple[int, ...]) -> str:
+    """
+    Encodes the hands of one frequency, given as the bitmasks of the lines
+    of _KEY_INDEX.
+    """
+    parts = _pair_parts(masks[0])
+    rows = len(R) - 1
+    for row in range(rows):
+        suited, offsuit = masks[1 + row], masks[1 + rows + row]
+        if suited or offsuit:
+            parts += _encode_row(row, suited, offsuit)
+    return ','.join(parts)
+
+
+def encode_range(freqs) -> str:
+    """
+    Encodes a vector of 169 frequencies (in the order of pynlh's hand table)
+    to its canonical range string like 'QQ+,AKs,[50]AQs-ATs,KQo[/50]'.
+    """
+    freqs = np.asarray(freqs, dtype=float)
+    values = np.unique(freqs[freqs > 0])[::-1]
+    grid = np.append(freqs, 0)[_KEY_INDEX]
+    masks = (grid == values[:, None, None]) @ _RANK_BITS
+    rv = []
+    for freq, group_masks in zip(values.tolist(), masks.tolist()):
+        parts = _encode_group(tuple(group_masks))
+        if freq == 100:
+            rv.append(parts)
+        else:
+            freq_str = format_freq(freq)
+            rv.append(f'[{freq_str}]{parts}[/{freq_str}]')
+    return ','.join(rv)
@@ -0,0 +1,350 @@
+"""
+Single-pass tokenizer and compiler for GTO+/Flopzilla range strings.
+
+compile_range('AA-QQ,[50]AKs,KQo-KTo[/50]') turns a range string straight
+into the 169-slot frequency vector used by pynlh's Range. Errors are raised
+with the position of the offending character.
+
+Grammar (whitespace is ignored, ';' and line breaks work like ','):
+
+    range    := [part] (',' [part])*
+    part     := [open] (hand ['-' hand | '+'] | percent ['-' percent])
+                close*
+    open     := '[' number ']'
+    close    := '[/' number ']'
+    hand     := rank rank ['s' | 'o']
+    percent  := number '%'
+
+Percentages select the best hands of a hand ordering (see
+pynlh.hand_ordering): '15%' the best 15% of all combos, '10%-20%' the
+hands between the best 10% and the best 20%.
+"""
+
+import re
+import string
+from typing import Iterator, List, NamedTuple, Tuple
+
+import numpy as np
+
+from .hand import HandError
+from .hand_ordering import HandOrdering, get_ordering
+from .hand_table import HAND_TABLE, HANDS_BY_NAME
+from .rank import NLH_SHORTS
+
+class RangeError(Exception):
+    """
+    Exception class of pynlh's Range class.
+    """
+    pass
+
+    ERR001_LEN_NOT_EQUAL = """Length of starting hand is not equal to the
+                           ending hand of this Range Part. ERR001"""
+    ERR002_PAIR_LEN_NOT_2 = """The length of a pair Range Part must be exactly
+                            2. - ERR002"""
+    ERR003_NOT_VALID_CHAR = ' is not a valid character for a range - ERR003'
+    ERR004_WRONG_SHAPE = """Frequencies must be a vector of 169 hands.
+                         - ERR004"""
+    ERR005_GROUPING = """Unknown grouping. Use 'by_hand' or 'skl-mal'.
+                      - ERR005"""
+    ERR006_UNEXPECTED = ' was not expected here - ERR006'
+    ERR007_NOT_ALIGNED = """Start and end hand of a range must share the first
+                         rank or the gap between the ranks. - ERR007"""
+    ERR008_FREQ = ' is not a valid frequency (0-100) - ERR008'
+    ERR009_MIXED_TYPES = """Start and end hand of a range must be of the same
+                         type (pair, suited, offsuit). - ERR009"""
+    ERR010_PERCENT = ' is not a valid percentage (0-100) - ERR010'
+
+    def __init__(self, range_str: str, msg: str = 'Not a valid range!',
+                 position: int = None):
+        self.range_str = range_str
+        self.msg = msg
+        self.position = position
+        super().__init__(self.msg)
+
+    def __str__(self):
+        if self.position is None:
+            return f"'{self.range_str}' -> {self.msg}"
+        return f"'{self.range_str}' -> {self.msg} (position {self.position})"
+
+
+class Token(NamedTuple):
+    """
+    A token of a range string. "kind" is one of PERCENT, HAND, DASH, PLUS,
+    COMMA, OPEN or CLOSE, "value" the matched text (or the frequency of
+    OPEN) and "pos" the position of the token in the range string.
+    """
+    kind: str
+    value: object
+    pos: int
+
+
+RANK_CHARS = NLH_SHORTS + NLH_SHORTS.lower()
+TOKEN_RE = re.compile(r'''
+    (?P<SKIP>[^\S\n]+)
+  | (?P<PERCENT>[0-9]*\.?[0-9]+%)
+  | (?P<HAND>[AKQJTakqjt2-9]{2}[SOso]?)
+  | (?P<DASH>-)
+  | (?P<PLUS>\+)
+  | (?P<COMMA>[,;\n])
+  | (?P<OPEN>\[\s*(?P<freq>[0-9]*\.?[0-9]*)\s*\])
+  | (?P<CLOSE>\[/[^\]]*\])
+''', re.VERBOSE)
+
+_RANK_INDEX = {rank: i for i, rank in enumerate(NLH_SHORTS)}
+_HAND_INDEX = {(_RANK_INDEX[h.handstring[0]], _RANK_INDEX[h.handstring[1]],
+                h.handstring[2:]): h.index for h in HAND_TABLE}
+
+
+def tokenize(range_str: str, pos: int = 0) -> Iterator[Token]:
+    """
+    Splits a range string (from position "pos" on) into Tokens in a single
+    pass.
+    """
+    end = len(range_str)
+    match = TOKEN_RE.match
+    while pos < end:
+        m = match(range_str, pos)
+        if m is None:
+            chr = range_str[pos]
+            if chr in RANK_CHARS:
+                raise HandError(range_str[pos:pos + 3],
+                                msg=f'Not a valid hand! (position {pos})')
+            raise RangeError(range_str, position=pos,
+                             msg=chr + RangeError.ERR003_NOT_VALID_CHAR)
+        kind = m.lastgroup
+        if kind == 'OPEN':
+            yield Token(kind, _read_freq(range_str, m), pos)
+        elif kind != 'SKIP':
+            yield Token(kind, m.group(kind), pos)
+        pos = m.end()
+
+
+def _read_freq(range_str: str, m) -> float:
+    try:
+        freq = float(m.group('freq'))
+    except ValueError:
+        freq = -1
+    if not 0 <= freq <= 100:
+        pos = range_str.rindex('[', 0, m.start('freq'))
+        raise RangeError(range_str, position=pos,
+                         msg=f"[{m.group('freq')}]" + RangeError.ERR008_FREQ)
+    return freq
+
+
+_HAND = r'[AKQJTakqjt2-9]{2}[SOso]?'
+_PERCENT = r'[0-9]*\.?[0-9]+%'
+# Whitespace within a part (a line break separates parts).
+_SPACE = r'[^\S\n]'
+PART_RE = re.compile(rf'''
+    [\s,;]*
+    (?:\[\s*(?P<freq>[0-9]*\.?[0-9]*)\s*\]{_SPACE}*)?
+    (?P<part>(?P<percent>{_PERCENT}){_SPACE}*
+             (?:-{_SPACE}*(?P<percent_end>{_PERCENT}))?
+           |(?P<start>{_HAND}){_SPACE}*
+             (?:(?P<plus>\+)|-{_SPACE}*(?P<end>{_HAND}))?)
+    (?P<close>(?:{_SPACE}*\[/[^\]]*\])*)
+    {_SPACE}*(?:[,;\n]|$)
+''', re.VERBOSE)
+_SEPARATORS = string.whitespace + ',;'
+
+
+def _hand_key(range_str: str, hand: str, pos: int) -> tuple:
+    """
+    Converts a hand like 'AKs' to (rank_index1, rank_index2, suit) with the
+    higher rank first. Suit is 's', 'o' or '' (pairs and hands without
+    suit).
+    """
+    r1, r2 = _RANK_INDEX[hand[0].upper()], _RANK_INDEX[hand[1].upper()]
+    suit = hand[2:].lower()
+    if r1 == r2 and suit:
+        raise RangeError(range_str, position=pos,
+                         msg=RangeError.ERR002_PAIR_LEN_NOT_2)
+    if r1 > r2:
+        r1, r2 = r2, r1
+    return r1, r2, suit
+
+
+def _indices(keys: List[tuple]) -> List[int]:
+    """
+    Converts hand keys to grid indices. Hands without a suit expand to
+    the suited and the offsuit hand.
+    """
+    rv = []
+    for r1, r2, suit in keys:
+        if suit or r1 == r2:
+            rv.append(_HAND_INDEX[(r1, r2, suit)])
+        else:
+            rv.append(_HAND_INDEX[(r1, r2, 's')])
+            rv.append(_HAND_INDEX[(r1, r2, 'o')])
+    return rv
+
+
+def _expand(range_str: str, m) -> List[int]:
+    """
+    Expands a matched part (PART_RE) with a single hand ('AKs'), a plus
+    range ('ATs+', '22+') or a dash range ('AKs-ATs', 'QQ-TT', 'JTs-54s')
+    to grid indices.
+    """
+    start = m.group('start')
+    r1, r2, suit = _hand_key(range_str, start, m.start('start'))
+    if m.group('plus'):
+        if r1 == r2:
+            return _indices([(r, r, '') for r in range(r1, -1, -1)])
+        return _indices([(r1, k, suit) for k in range(r2, r1, -1)])
+    end = m.group('end')
+    if end is None:
+        return _indices([(r1, r2, suit)])
+    pos = m.start('end')
+    e1, e2, e_suit = _hand_key(range_str, end, pos)
+    if len(start) != len(end):
+        raise RangeError(range_str, position=pos,
+                         msg=RangeError.ERR001_LEN_NOT_EQUAL)
+    if (suit != e_suit) or ((r1 == r2) != (e1 == e2)):
+        raise RangeError(range_str, position=pos,
+                         msg=RangeError.ERR009_MIXED_TYPES)
+    step = 1 if (r1, r2) <= (e1, e2) else -1
+    if r1 == r2:
+        keys = [(r, r, '') for r in range(r1, e1 + step, step)]
+    elif r1 == e1:
+        keys = [(r1, k, suit) for k in range(r2, e2 + step, step)]
+    elif r2 - r1 == e2 - e1:
+        keys = [(r, r + r2 - r1, suit) for r in range(r1, e1 + step, step)]
+    else:
+        raise RangeError(range_str, position=pos,
+                         msg=RangeError.ERR007_NOT_ALIGNED)
+    return _indices(keys)
+
+
+def _read_percent(range_str: str, m, group: str) -> float:
+    percent = float(m.group(group)[:-1])
+    if percent > 100:
+        raise RangeError(range_str, position=m.start(group),
+                         msg=m.group(group) + RangeError.ERR010_PERCENT)
+    return percent
+
+
+def _expand_percent(range_str: str, m,
+                    ordering: HandOrdering) -> List[int]:
+    """
+    Expands a matched percentage part (PART_RE) like '15%' or '10%-20%' to
+    the grid indices of the hands of the ordering.
+    """
+    lower = 0.
+    upper = _read_percent(range_str, m, 'percent')
+    if m.group('percent_end') is not None:
+        lower = upper
+        upper = _read_percent(range_str, m, 'percent_end')
+    return ordering.between(lower, upper).tolist()
+
+
+def _raise_syntax_error(range_str: str, pos: int):
+    """
+    Locates the first token from "pos" on that does not fit the grammar and
+    raises a RangeError with its position.
+    """
+    expected = ('OPEN', 'HAND', 'PERCENT', 'COMMA')
+    last = None
+    for token in tokenize(range_str, pos):
+        if token.kind not in expected:
+            msg = f"'{token.value}'" + RangeError.ERR006_UNEXPECTED
+            raise RangeError(range_str, position=token.pos, msg=msg)
+        expected = {
+            'OPEN': ('HAND', 'PERCENT'),
+            'HAND': ('DASH', 'PLUS', 'CLOSE', 'COMMA'),
+            'PERCENT': ('DASH', 'CLOSE', 'COMMA'),
+            'DASH': ('HAND', 'PERCENT'),
+            'PLUS': ('CLOSE', 'COMMA'),
+            'CLOSE': ('CLOSE', 'COMMA'),
+            'COMMA': ('OPEN', 'HAND', 'PERCENT', 'COMMA'),
+        }[token.kind]
+        last = token
+    # A range string must not end with an open tag or a dash.
+    if last is not None and last.kind in ('OPEN', 'DASH'):
+        text = last.value
+        if last.kind == 'OPEN':
+            text = range_str[last.pos:range_str.index(']', last.pos) + 1]
+        msg = f"'{text}'" + RangeError.ERR006_UNEXPECTED
+        raise RangeError(range_str, position=last.pos, msg=msg)
+    raise RangeError(range_str, position=pos)
+
+
+class RangePartSpec(NamedTuple):
+    """
+    A compiled part of a range string like 'KQs-KTs' with its frequency
+    and the grid indices of its hands.
+    """
+    part: str
+    freq: float
+    indices: Tuple[int, ...]
+
+
+# Expansions of part strings like 'KQs-KTs'. Solver exports repeat the same
+# few hundred parts over and over, so they are only expanded once.
+_EXPANSIONS = {}
+_MAX_EXPANSIONS = 4096
+
+
+def parse_range(range_str: str,
+                ordering: str = None) -> List[RangePartSpec]:
+    """
+    Parses a range string in a single pass and returns its compiled parts.
+    Every part is read with one match of PART_RE, the tokenizer is only
+    used to locate syntax errors. Percentages are resolved with the hand
+    ordering registered as "ordering" (default: 'equity').
+    """
+    rv = []
+    freq = 100.0
+    pos = 0
+    end = len(range_str)
+    match = PART_RE.match
+    while pos < end:
+        m = match(range_str, pos)
+        if m is None:
+            if not range_str[pos:].strip(_SEPARATORS):
+                break
+            _raise_syntax_error(range_str, pos)
+        freq_str, part, close = m.group('freq', 'part', 'close')
+        if freq_str is not None:
+            freq = _read_freq(range_str, m)
+        if m.group('percent') is not None:
+            # Depends on the ordering, so it is not kept in _EXPANSIONS.
+            indices = tuple(_expand_percent(range_str, m,
+                                            get_ordering(ordering)))
+        else:
+            indices = _EXPANSIONS.get(part)
+        if indices is None:
+            indices = tuple(_expand(range_str, m))
+            if len(_EXPANSIONS) < _MAX_EXPANSIONS:
+                _EXPANSIONS[part] = indices
+        rv.append(RangePartSpec(part.replace(' ', ''), freq, indices))
+        if close:
+            freq = 100.0
+        pos = m.end()
+    return rv
+
+
+def compile_range(range_str: str, ordering: str = None) -> np.ndarray:
+    """
+    Compiles a range string into a vector of 169 frequencies (in the order
+    of pynlh's hand table). Later parts overwrite earlier ones. Percentages
+    are resolved with the hand ordering "ordering" (see parse_range).
+    """
+    freqs = [0.0] * len(HAND_TABLE)
+    for part in parse_range(range_str, ordering):
+        for i in part.indices:
+            freqs[i] = part.freq
+    return np.array(freqs)
+
+
+def expand_part(part: str) -> List[str]:
+    """
+    Returns the handstrings of a single range part like 'QQ-TT' or 'ATs+'
+    (without frequency tags).
+    """
+    specs = parse_range(part)
+    if len(specs) != 1:
+        raise RangeError(part)
+    return [HAND_TABLE[i].handstring for i in specs[0].indices]
+
+
+assert len(_HAND_INDEX) == len(HANDS_BY_NAME)
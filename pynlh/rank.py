@@ -1,5 +1,7 @@
 from functools import total_ordering
 
+from .tools import Immutable
+
 
 NLH_SHORTS = 'AKQJT98765432'
 NLH_NAMES = ['Ace', 'King', 'Queen', 'Jack', 'Ten', 'Nine', 'Eight', 'Seven',
@@ -22,16 +24,33 @@ class RankError(Exception):
 
 
 @total_ordering
-class Rank():
-
-    def __init__(self, name: str, order: int, short: str) -> None:
-        """
-        Pynlh's Rank class Object.
-        """
+class Rank(Immutable):
+    """
+    Pynlh's Rank class Object.
+    Ranks are immutable and interned, so Rank('Ace', 1, 'A') is RANKS['A'].
+    """
+    __slots__ = ('name', 'order', 'short')
+    _instances = {}
+
+    def __new__(cls, name: str, order: int, short: str) -> 'Rank':
+        key = (name, order, short)
+        try:
+            return cls._instances[key]
+        except KeyError:
+            pass
+        self = super().__new__(cls)
         self.name = name
         self.order = order
         self.short = short
         self.check_input()
+        self._freeze()
+        return cls._instances.setdefault(key, self)
+
+    def __reduce__(self):
+        return (self.__class__, (self.name, self.order, self.short))
+
+    def __hash__(self) -> int:
+        return hash(self.order)
 
     def check_input(self):
         if not isinstance(self.name, str):
@@ -0,0 +1,76 @@
+"""
+NumPy arrays in shared memory.
+
+SharedArrays copies a dict of arrays into one shared memory block once.
+Worker processes receive only its small, picklable handle and attach
+read-only views of the arrays, so large vectors are never pickled per
+task.
+"""
+
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, NamedTuple, Tuple
+
+import numpy as np
+
+# Offsets of the arrays in the block are multiples of ALIGNMENT bytes.
+ALIGNMENT = 64
+
+
+class SharedHandle(NamedTuple):
+    """
+    Name of the shared memory block and (offset, shape, dtype) of every
+    array in it.
+    """
+    name: str
+    layout: Dict[str, Tuple[int, tuple, str]]
+
+
+class SharedArrays:
+
+    def __init__(self, arrays: Dict[str, np.ndarray]) -> None:
+        """
+        Copies "arrays" into a new shared memory block. Use it as context
+        manager (or call close()) to release the block.
+        """
+        layout = {}
+        size = 0
+        for name, array in arrays.items():
+            array = np.asarray(array)
+            layout[name] = (size, array.shape, array.dtype.str)
+            size += -(-array.nbytes // ALIGNMENT) * ALIGNMENT
+        self.shm = SharedMemory(create=True, size=max(size, 1))
+        self.handle = SharedHandle(self.shm.name, layout)
+        for name, view in _views(self.shm, layout).items():
+            view[...] = arrays[name]
+
+    def __enter__(self) -> 'SharedArrays':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Releases and removes the shared memory block.
+        """
+        self.shm.close()
+        self.shm.unlink()
+
+
+def _views(shm: SharedMemory, layout) -> Dict[str, np.ndarray]:
+    return {name: np.ndarray(shape, dtype=dtype, buffer=shm.buf,
+                             offset=offset)
+            for name, (offset, shape, dtype) in layout.items()}
+
+
+def attach(handle: SharedHandle) -> Tuple[SharedMemory, dict]:
+    """
+    Attaches to the block of a SharedArrays object (e.g. in a worker
+    process). Returns the block, which must be kept referenced while the
+    arrays are used, and read-only views of the arrays.
+    """
+    shm = SharedMemory(name=handle.name)
+    arrays = _views(shm, handle.layout)
+    for array in arrays.values():
+        array.flags.writeable = False
+    return shm, arrays
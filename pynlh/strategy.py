@@ -1,4 +1,5 @@
 from pynlh import Range
+from .hand_table import HAND_TABLE, HANDS_BY_XY
 
 
 class StrategyError(Exception):
@@ -40,23 +41,25 @@ class Strategy():
         return (key in self.aggressive_range) or (key in self.passive_range)
 
     def _create_easiness_dict(self) -> dict:
-        raise NotImplementedError
-        rv = Range.build_0freq_hands_dict()
-        xy_dict = Range.build_xy_dict()
-        # print(xy_dict[(13, 3)])
-        for hand, (rate, x, y) in rv.items():
+        """
+        Counts for every hand the steps along the diagonal of the grid
+        (AA -> KK -> QQ, AKs -> KQs -> QJs, ...) that stay in the strategy's
+        aggressive or passive range. Returns {hand: (steps, x, y)}.
+        """
+        rv = {}
+        for hand in HAND_TABLE:
             steps = 0
-            next_x = x
-            next_y = y
-            next_hand = hand
+            next_x = hand.x
+            next_y = hand.y
+            next_hand = hand.handstring
             while next_hand in self:
                 steps += 1
                 next_x += 1
                 next_y += 1
                 if (next_x == 14) or (next_y == 14):
                     break
-                next_hand = xy_dict[(next_x, next_y)]
-            rv[hand] = (steps, x, y)
+                next_hand = HANDS_BY_XY[(next_x, next_y)].handstring
+            rv[hand.handstring] = (steps, hand.x, hand.y)
         return rv
 
     def _get_easiness(self, hand) -> int:
@@ -1,6 +1,7 @@
 from functools import total_ordering
 
 from .rank import NLH_NAMES, NLH_SHORTS
+from .tools import Immutable
 
 
 NLH_SHORTS = 'csdh'
@@ -22,10 +23,28 @@ class SuitError(Exception):
         return f"'{self.name}' -> {self.msg}"
 
 
-class Suit():
-    def __init__(self, name: str, short: str) -> None:
+class Suit(Immutable):
+    """
+    Pynlh's Suit class Object.
+    Suits are immutable and interned, so Suit('Club', 'c') is SUITS['c'].
+    """
+    __slots__ = ('name', 'short')
+    _instances = {}
+
+    def __new__(cls, name: str, short: str) -> 'Suit':
+        key = (name, short)
+        try:
+            return cls._instances[key]
+        except KeyError:
+            pass
+        self = super().__new__(cls)
         self.name = name
         self.short = short
+        self._freeze()
+        return cls._instances.setdefault(key, self)
+
+    def __reduce__(self):
+        return (self.__class__, (self.name, self.short))
 
     def __repr__(self) -> str:
         return f"Suit(name={self.name}, short={self.short})"
@@ -27,3 +27,59 @@ def timer(func):
         return result
 
     return timed
+
+
+def get_rng(seed=None) -> 'np.random.Generator':
+    """
+    Returns a NumPy random Generator. "seed" can be None (fresh entropy), an
+    int or SeedSequence (reproducible) or an existing Generator, which is
+    passed through. NumPy is imported here so that importing the timer does
+    not load it.
+    """
+    import numpy as np
+
+    if isinstance(seed, np.random.Generator):
+        return seed
+    return np.random.default_rng(seed)
+
+
+def get_seed_sequence(seed=None) -> 'np.random.SeedSequence':
+    """
+    Returns a NumPy SeedSequence to spawn independent random streams from
+    (e.g. one per task of a process pool). "seed" is passed through if it
+    is a SeedSequence and otherwise seeds one via get_rng.
+    """
+    import numpy as np
+
+    if isinstance(seed, np.random.SeedSequence):
+        return seed
+    return np.random.SeedSequence(int(get_rng(seed).integers(1 << 63)))
+
+
+class Immutable():
+    """
+    Base class for pynlh's interned objects (Hand, Combo, Rank, Suit).
+    Subclasses set their attributes in __new__, call _freeze() and hand out
+    the same instance from a class level cache afterwards. Frozen objects
+    can't be changed and copy to themselves.
+    """
+    __slots__ = ('_frozen',)
+
+    def _freeze(self):
+        object.__setattr__(self, '_frozen', True)
+
+    def __setattr__(self, name, value):
+        if getattr(self, '_frozen', False):
+            raise AttributeError(
+                f"{self.__class__.__name__} objects are immutable.")
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name):
+        raise AttributeError(
+            f"{self.__class__.__name__} objects are immutable.")
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
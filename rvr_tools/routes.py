@@ -10,8 +10,7 @@ from rvr_tools.forms import (BetSizeForm,
                              RandomizeForm)
 from rvr_tools.calculator import MDF
 from rvr_tools import app
-from pynlh import Range
-from .game_scraper import Game
+import pynlh
 
 
 @app.route('/favicon.ico')
@@ -31,7 +30,7 @@ def home():
 def randomize():
     form = RandomizeForm()
     if form.validate_on_submit():
-        range_ = Range(form.range_str.data)
+        range_ = pynlh.Range(form.range_str.data)
         # range_str = range_.randomize_suits_for_range()  # old randomizer
         range_str = range_.pick_combos(as_str=True)
         # flash('successfully randomized', 'success')
@@ -48,6 +47,9 @@ def calculator():
     get_form = GetGameForm()
     size_form = BetSizeForm()
     if get_form.validate_on_submit():
+        # The scraper pulls in requests and bs4, so it is only imported here.
+        from .game_scraper import Game
+
         game_id = get_form.game_id.data
         try:
             scraper = Game(game_id)
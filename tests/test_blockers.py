@@ -0,0 +1,46 @@
+import numpy as np
+
+from pynlh import ComboRange, Range
+from pynlh.blockers import dead_mask, live_combos, remove_blockers
+from pynlh.combo_table import COMBO_STR
+from pynlh.hand_table import HANDS_BY_NAME
+
+
+def test_live_combos():
+    assert(live_combos().all())
+    live = live_combos('AsKd7c')
+    assert(live.sum() == 1176)
+    assert(not live[COMBO_STR.index('AsAh')])
+    assert(live[COMBO_STR.index('AhQh')])
+    assert(dead_mask('Ac', ['As']) == 3)
+    assert(live_combos(board='AsKd7c', dead='QhQs').sum() == 1081)
+
+
+def test_remove_blockers():
+    range_ = Range('AA,[50]AKs[/50],72o')
+    blocked = range_.remove_blockers(board='AsKd7c', dead='2h')
+    counts = dict(zip((h.handstring for h in HANDS_BY_NAME.values()),
+                      blocked.hand_counts))
+    assert(counts['AA'] == 3)
+    assert(counts['AKs'] == 2)
+    assert(counts['72o'] == 7)
+    assert(blocked.weighted_combos == 3 + 1 + 7)
+    assert(len(blocked.combo_indices) == 12)
+    assert(not any('As' in COMBO_STR[i] for i in blocked.combo_indices))
+    same = remove_blockers(range_.combo_freqs, 'AsKd7c2h')
+    assert(np.array_equal(same.combo_freqs, blocked.combo_freqs))
+
+
+def test_remove_blockers_combo_range():
+    range_ = ComboRange('AcKc,AsKs,[50]QhQd[/50]')
+    blocked = range_.remove_blockers(board='Ks')
+    assert(blocked.weighted_combos == 1.5)
+
+
+def test_pick_combos_dead():
+    range_ = Range('AA,AKs')
+    picked = range_.pick_combos(as_str=True, rng=1, board='AsKd7c')
+    assert(picked == 'AcAd,AcAh,AdAh,AcKc,AhKh')
+    assert(range_.pick_combos_bulk(4, rng=1, dead='Ac').sum() == 4 * 6)
+    combos = ComboRange(picked).pick_combos(as_str=True, dead='Ac')
+    assert(combos == 'AdAh,AhKh')
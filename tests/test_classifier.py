@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+
+from pynlh.classifier import (AIR, DRAWS, MADE_HANDS, classify_combos,
+                              classify_range)
+from pynlh.combo_range import ComboRange
+from pynlh.combo_table import combo_index
+from pynlh.evaluator import EvaluatorError
+from pynlh.range import Range
+
+
+def _classify(combo: str, board: str) -> tuple:
+    made, draws = classify_combos([combo_index(combo)], board)
+    return (MADE_HANDS[made[0]],
+            {DRAWS[i] for i in np.flatnonzero(draws[0])})
+
+
+@pytest.mark.parametrize('combo, board, made, draws', [
+    ('7c7d', 'Ah8d7s', 'set', set()),
+    ('Ac7c', '7h7d2c', 'trips', {'backdoor_flush_draw'}),
+    ('Ac8c', 'Ah8d7s', 'two_pair', set()),
+    ('KcKd', 'Qh8d7s', 'overpair', set()),
+    ('AcJd', 'Ah8d7s', 'top_pair', set()),
+    ('QcQd', 'Ah8d7s', 'underpair', set()),
+    ('Kc8c', 'Ah8d7s', 'middle_pair', set()),
+    ('Kc7c', 'Ah8d7s', 'bottom_pair', set()),
+    ('AcQd', 'Kh8d7s', 'ace_high', set()),
+    ('AcQh', 'Kh8h7s', 'ace_high', {'backdoor_flush_draw'}),
+    ('Qc3d', 'Kh8s7s', 'no_made_hand', set()),
+    ('6c5c', 'Kh8d7s', 'no_made_hand', {'oesd'}),
+    ('Ts9s', 'Ks8s2d', 'no_made_hand', {'flush_draw'}),
+    ('Js9s', 'Ts8s2d', 'no_made_hand', {'flush_draw', 'oesd'}),
+    ('Tc6c', 'Kh8d7s', 'no_made_hand', {'gutshot'}),
+    ('AsQs', 'KsJs7d', 'ace_high', {'flush_draw', 'gutshot'}),
+    ('Kh5d', 'Ac4s3d2h', 'straight', set()),
+    ('Kh6h', '8h7h5h', 'flush', set()),
+    ('8c8d', '8h7h7d', 'full_house', set()),
+    ('9h6h', '8h7h5h', 'straight_flush', set()),
+    ('Kc2c', 'KhKdKs', 'quads', set()),
+])
+def test_classify_combos(combo, board, made, draws):
+    assert(_classify(combo, board) == (made, draws))
+
+
+def test_board_draws():
+    # Four to a straight on the board are no draw ...
+    assert(_classify('KcKd', '9c8c7d6h')[1] == set())
+    # ... unless a hole card makes a higher straight.
+    assert(_classify('KhTh', '9c8c6d5h') == ('no_made_hand', {'gutshot'}))
+    # No draws on the river.
+    assert(_classify('6c5c', 'Kh8d7sQd2c') == ('no_made_hand', set()))
+
+
+def test_classify_range():
+    classes = classify_range(Range('AA,KQs,76s'), 'Ah7d2c')
+    counts = classes.counts()
+    assert(set(counts) == set(MADE_HANDS) | set(DRAWS) | {AIR})
+    # AA keeps 3 combos, KQs 4 and 76s 3.
+    assert(counts['set'] == 3)
+    assert(counts['bottom_pair'] == 0)
+    assert(counts['middle_pair'] == 3)
+    assert(counts['no_made_hand'] == 4)
+    assert(sum(counts[name] for name in MADE_HANDS) == 10)
+    # Backdoor flush draws: all KQs but KsQs, 7c6c and 7h6h.
+    assert(counts['backdoor_flush_draw'] == 5)
+    assert(counts[AIR] == 4)
+
+
+def test_classify_range_weights():
+    range_ = ComboRange('[50]AsKs[/50],QhQd')
+    counts = classify_range(range_, 'Kh8d2c', dead='Qc').counts()
+    assert(counts['top_pair'] == .5)
+    assert(counts['underpair'] == 1)
+    assert(classify_range(range_, 'Kh8d2c', dead='Qd').counts()[
+        'underpair'] == 0)
+
+
+def test_board_size():
+    with pytest.raises(EvaluatorError):
+        classify_combos([0], 'AsKs')
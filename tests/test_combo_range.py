@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from pynlh import Combo, ComboRange, Range, RangeError
+
+
+def test_combo_range_from_str():
+    range_ = ComboRange('AcKc, adkd;[50]QhQs[/50]')
+    assert(len(range_) == 3)
+    assert(range_['KcAc'] == 100)
+    assert(range_['QsQh'] == 50)
+    assert('AsKs' not in range_)
+    assert(str(range_) == 'AcKc,AdKd,[50]QsQh[/50]')
+    assert(np.array_equal(ComboRange(str(range_)).freqs, range_.freqs))
+    with pytest.raises(RangeError):
+        ComboRange('AcKc,AcAc')
+    with pytest.raises(RangeError):
+        ComboRange('AcKx')
+
+
+def test_combo_range_from_pick_combos():
+    range_ = Range('AA,[50]AKs,KQo[/50]')
+    picked = range_.pick_combos(rng=3)
+    assert(ComboRange(picked).combos == picked)
+    assert(str(ComboRange(range_.pick_combos(as_str=True, rng=3)))
+           == range_.pick_combos(as_str=True, rng=3))
+    assert(ComboRange(['AcKc', Combo('AdKd'), 0])['AcAs'] == 100)
+
+
+def test_combo_range_to_range():
+    range_ = ComboRange('AcKc,AdKd')
+    assert(range_.to_range().converted_range_dict == {'AKs': 50})
+    range_ = Range('AA,[50]AKs[/50]')
+    assert(np.array_equal(ComboRange.from_range(range_).to_range().freqs,
+                          range_.freqs))
+
+
+def test_combo_range_arithmetic():
+    aks = ComboRange('AcKc,AsKs')
+    assert(len(aks + ComboRange('AdKd')) == 3)
+    assert(str(aks - ComboRange('AcKc')) == 'AsKs')
+    assert(str(aks * .5) == '[50]AcKc,AsKs[/50]')
+    mixed = Range('AKs') - aks
+    assert(isinstance(mixed, ComboRange))
+    assert(str(mixed) == 'AdKd,AhKh')
+    assert(str(aks & Range('[25]AKs[/25]')) == '[25]AcKc,AsKs[/25]')
+    assert(str(aks | Range('KK')) == str(Range('KK') | aks))
+
+
+def test_combo_range_setitem_delitem():
+    range_ = ComboRange()
+    range_['AcKc'] = 40
+    assert(str(range_) == '[40]AcKc[/40]')
+    del range_['AcKc']
+    assert(len(range_) == 0)
+    with pytest.raises(KeyError):
+        del range_['AcKc']
+
+
+def test_combo_range_pick_combos():
+    range_ = ComboRange('AcKc,[50]AdKd[/50]')
+    picked = range_.pick_combos(as_str=True, rng=1)
+    assert(picked.startswith('AcKc'))
+    assert(picked == range_.pick_combos(as_str=True, rng=1))
@@ -0,0 +1,70 @@
+import pytest
+
+from pynlh import RANKS, SUITS, Combo, Hand, Rank, Suit
+from pynlh.card import CARDS, CardError, card_to_int, cards_mask, cards_to_ints
+from pynlh.combo import ComboError
+from pynlh.combo_table import (COMBO_CARDS, COMBO_HAND, COMBO_INDEX,
+                               COMBO_MASK, COMBO_STR, combo_index)
+from pynlh.hand_table import HAND_TABLE
+
+
+def test_card_encoding():
+    assert(len(CARDS) == 52)
+    assert(card_to_int('Ac') == 0)
+    assert(card_to_int('kD') == 6)
+    assert(card_to_int('2h') == 51)
+    assert(cards_to_ints('As Kd,7c') == [1, 6, 28])
+    assert(cards_mask('AcAs') == 3)
+    with pytest.raises(CardError):
+        card_to_int('1c')
+    with pytest.raises(CardError):
+        cards_to_ints('AcAc')
+
+
+def test_combo_table_unique():
+    assert(len(COMBO_STR) == 1326)
+    assert(len(set(COMBO_STR)) == 1326)
+    assert(len(set(COMBO_MASK.tolist())) == 1326)
+    assert(COMBO_CARDS.shape == (1326, 2))
+
+
+def test_combo_table_consistent():
+    for i, combo in enumerate(COMBO_STR):
+        card1, card2 = COMBO_CARDS[i]
+        assert(CARDS[card1] + CARDS[card2] == combo)
+        assert(int(COMBO_MASK[i]) == (1 << int(card1)) | (1 << int(card2)))
+        assert(COMBO_INDEX[combo] == i)
+        assert(COMBO_INDEX[combo[2:] + combo[:2]] == i)
+    for hand in HAND_TABLE:
+        assert((COMBO_HAND[hand.combo_slice] == hand.index).all())
+
+
+def test_combo_index():
+    assert(combo_index('AcAs') == 0)
+    assert(combo_index('KhAh') == combo_index(('Ah', 'Kh')))
+    assert(Combo('AdKd').index == combo_index('AdKd'))
+    assert(Combo('AdKd').cards == (2, 6))
+    assert(Combo.from_index(0).combo_str == 'AcAs')
+
+
+def test_hand_combos_from_table():
+    assert(Hand('AA').all_combos_str == ['AcAs', 'AcAd', 'AcAh', 'AsAd',
+                                         'AsAh', 'AdAh'])
+    assert(Hand('AKs').all_combos_str == ['AcKc', 'AsKs', 'AdKd', 'AhKh'])
+    assert(len(set(Hand('AK').all_combos_str)) == 16)
+
+
+def test_combo_rank_suit_interned():
+    index = combo_index('AdKd')
+    assert(Combo('KdAd') is Combo('AdKd') is Combo.from_index(index))
+    assert(Combo(rank1=RANKS['A'], suit1=SUITS['d'],
+                 rank2=RANKS['K'], suit2=SUITS['d']) is Combo('AdKd'))
+    assert(Combo('AdKd').rank2 is RANKS['K'])
+    assert(Rank('Ace', 1, 'A') is RANKS['A'])
+    assert(Suit('Club', 'c') is SUITS['c'])
+    assert(Combo('AdKd').pick(100))
+    assert(not Combo('AdKd').pick(0))
+    with pytest.raises(AttributeError):
+        RANKS['A'].order = 2
+    with pytest.raises(ComboError):
+        Combo('AdAd')
@@ -0,0 +1,72 @@
+import sqlite3
+
+import pytest
+
+from pynlh import ComboRange, Range, equity
+from pynlh.equity_cache import EquityCache, cache_key, canonical_query
+
+
+def test_isomorphic_boards_share_key():
+    assert(cache_key('QQ+,AK', 'TT+', 'AsKs7d')
+           == cache_key(Range('AK,QQ+'), 'TT+', '7cAhKh'))
+    assert(cache_key('QQ+', 'TT+', 'AsKs7d')
+           != cache_key('QQ+', 'TT+', 'AsKd7c'))
+    assert(canonical_query('AA', 'KK', 'Ks7d2c', 'Ah')[2:]
+           == canonical_query('AA', 'KK', 'Kh7c2s', 'Ad')[2:])
+
+
+def test_combo_ranges_are_relabeled():
+    # s->h, h->c, d->s, c->d maps both queries onto each other.
+    assert(cache_key(ComboRange('AsAh'), 'KK', 'Ks7d2c')
+           == cache_key(ComboRange('AhAc'), 'KK', 'Kh7s2d'))
+    assert(cache_key(ComboRange('AsAh'), 'KK', 'Ks7d2c')
+           != cache_key(ComboRange('AcAd'), 'KK', 'Ks7d2c'))
+
+
+def test_key_arguments():
+    assert(cache_key('AA', 'KK', rng=1, processes=4)
+           == cache_key('AA', 'KK', rng=1))
+    assert(cache_key('AA', 'KK', rng=1) != cache_key('AA', 'KK', rng=2))
+
+
+def test_cache_equity(tmp_path):
+    path = tmp_path / 'equity.sqlite'
+    with EquityCache(path) as cache:
+        result = cache.equity('QQ+,AKs', 'JJ+', board='AsKs7d')
+        assert(cache.equity('QQ+,AKs', 'JJ+', board='7cKhAh') == result)
+        assert(result == equity('QQ+,AKs', 'JJ+', board='AsKs7d'))
+        assert(cache.info() == (1, 1, 0, 100_000, 1))
+    with EquityCache(path) as cache:
+        assert(cache.equity('QQ+,AKs', 'JJ+', board='AdKd7s') == result)
+        assert(cache.info().hits == 1)
+        cache.clear()
+        assert(len(cache) == 0)
+
+
+def test_lru_eviction():
+    cache = EquityCache(':memory:', maxsize=2)
+    cache.put('a', equity('AA', 'KK', board='2c3d4h5s6c'))
+    cache.put('b', equity('AA', 'KK', board='2c3d4h5s7c'))
+    cache.get('a')
+    cache.put('c', equity('AA', 'KK', board='2c3d4h5s8c'))
+    assert('a' in cache and 'c' in cache and 'b' not in cache)
+    assert(cache.info().evictions == 1)
+
+
+def test_schema_version(tmp_path):
+    path = tmp_path / 'equity.sqlite'
+    with EquityCache(path) as cache:
+        cache.put('a', equity('AA', 'KK', board='2c3d4h5s6c'))
+    db = sqlite3.connect(path)
+    db.execute('PRAGMA user_version = 0')
+    db.commit()
+    db.close()
+    with EquityCache(path) as cache:
+        assert(len(cache) == 0)
+
+
+@pytest.mark.parametrize('board', ['AsKs7d', ''])
+def test_canonical_board(board):
+    query = canonical_query('AA', 'KK', board)
+    assert(query[:2] == ('R:AA', 'R:KK'))
+    assert(len(query[2]) == len(board))
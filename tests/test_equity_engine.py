@@ -0,0 +1,215 @@
+import subprocess
+import sys
+from itertools import combinations
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from pynlh import ComboRange, Range, equity
+from pynlh.card import cards_to_ints
+from pynlh.combo_table import COMBO_CARDS, combo_index
+from pynlh.equity_engine import (BATCH_SIZE, CONFIDENCE_Z, EquityError,
+                                 combo_equity, enumeration_size,
+                                 matchups)
+from pynlh.hand_table import HANDS_BY_NAME
+from pynlh.evaluator import evaluate
+
+
+def test_equity_aa_vs_kk():
+    result = equity(Range('AA'), Range('KK'), iterations=50_000, rng=1)
+    assert(abs(result.equity - 0.8195) < 4 * result.std_error)
+    assert(result.iterations == 50_000)
+    assert(0 < result.tie < 0.01)
+    assert(result.equity == pytest.approx(result.win + result.tie / 2))
+
+
+def test_equity_symmetric():
+    result = equity('22+,AJs+', '22+,AJs+', iterations=20_000, rng=2)
+    assert(abs(result.equity - 0.5) < 4 * result.std_error)
+
+
+def test_equity_board_and_dead():
+    result = equity('AA', '72o', board='As7d2c5h9s', iterations=1000, rng=3)
+    assert(result.equity == 1)
+    assert(result.std_error == 0)
+    result = equity('AA', 'KK', board='KsKd2c', dead='Ac', iterations=10)
+    assert(result.equity == 0)
+
+
+def test_equity_reproducible():
+    args = (Range('[50]AKs,QQ[/50],JJ'), Range('TT+,AQs+'))
+    assert(equity(*args, iterations=5000, rng=7)
+           == equity(*args, iterations=5000, rng=7))
+
+
+def test_matchups_weights():
+    pairs = matchups(Range('[50]AA[/50]'), ComboRange('AcKc,KdKh'))
+    # AA without Ac (3 combos) vs AcKc and 6 AA combos vs KdKh.
+    assert(len(pairs.hero) == 9)
+    assert(set(pairs.weights) == {5000})
+
+
+def test_equity_errors():
+    with pytest.raises(EquityError):
+        equity(ComboRange('AcKc'), ComboRange('AcQc'), iterations=10)
+    with pytest.raises(EquityError):
+        equity('AA', 'KK', board='2c3c4c5c6c7c')
+    with pytest.raises(EquityError):
+        equity('AA', 'KK', board='2c3c4c', dead='2c')
+
+
+def _brute_force_equity(hero, villain, board):
+    pairs = matchups(hero, villain, board)
+    board = cards_to_ints(board)
+    total = shares = 0
+    for h, v, w in zip(pairs.hero, pairs.villain, pairs.weights):
+        used = set(board) | set(COMBO_CARDS[h].tolist()) \
+            | set(COMBO_CARDS[v].tolist())
+        deck = [card for card in range(52) if card not in used]
+        for runout in combinations(deck, 5 - len(board)):
+            cards = board + list(runout)
+            hero_score = evaluate(np.array(COMBO_CARDS[h].tolist() + cards))
+            villain_score = evaluate(
+                np.array(COMBO_CARDS[v].tolist() + cards))
+            shares += w * ((hero_score > villain_score)
+                           + 0.5 * (hero_score == villain_score))
+            total += w
+    return shares / total
+
+
+@pytest.mark.parametrize('hero, villain, board', [
+    ('[50]AKs[/50],QQ,76s', 'JJ+,AQo', 'Qs9s2d5hKc'),
+    (ComboRange('AcKc,8h8d'), '[25]TT[/25],QJs', '9c8cTd2s'),
+])
+def test_exact_equity(hero, villain, board):
+    result = equity(hero, villain, board=board, method='exact')
+    assert(result.equity == pytest.approx(
+        _brute_force_equity(hero, villain, board), abs=1e-12))
+    assert(result.std_error == 0)
+
+
+def test_exact_equity_matches_monte_carlo():
+    exact = equity('99+,AJs+', 'TT+,AKo,KQs', board='Ts7c2h',
+                   method='exact')
+    sampled = equity('99+,AJs+', 'TT+,AKo,KQs', board='Ts7c2h',
+                     method='monte_carlo', iterations=50_000, rng=4)
+    assert(abs(exact.equity - sampled.equity) < 4 * sampled.std_error)
+    assert(exact == equity('99+,AJs+', 'TT+,AKo,KQs', board='Ts7c2h',
+                           method='exact'))
+
+
+def test_equity_auto_method():
+    pairs = matchups('AA', 'KK', 'Ts7c2h')
+    # 36 pairs times C(49, 2) runouts.
+    assert(enumeration_size(pairs) == 36 * 1176)
+    exact = equity('AA', 'KK', board='Ts7c2h')
+    assert(exact.std_error == 0)
+    # 36 pairs with C(45, 2) runouts each.
+    assert(exact.iterations == 36 * 990)
+    sampled = equity('AA', 'KK', board='Ts7c2h', iterations=1000, rng=5,
+                     exact_budget=1000)
+    assert(sampled.iterations == 1000)
+    with pytest.raises(EquityError):
+        equity('AA', 'KK', method='simulation')
+
+
+def test_equity_tolerance():
+    result = equity('AA', 'KK', iterations=None, tolerance=0.005, rng=6)
+    assert(CONFIDENCE_Z * result.std_error <= 0.005)
+    assert(result.iterations % BATCH_SIZE == 0)
+    assert(result.iterations < 10 * BATCH_SIZE)
+    # A loose tolerance stops after the first batch.
+    result = equity('AA', 'KK', iterations=None, tolerance=0.1, rng=6)
+    assert(result.iterations == BATCH_SIZE)
+    # The iterations still limit the sampling.
+    result = equity('AA', 'KK', iterations=1000, tolerance=1e-6, rng=6)
+    assert(result.iterations == 1000)
+
+
+def test_equity_deadline():
+    result = equity('22+,A2s+', 'KK+', iterations=None, deadline=0, rng=8)
+    assert(result.iterations == BATCH_SIZE)
+    assert(result.std_error > 0)
+
+
+def test_equity_stop_errors():
+    with pytest.raises(EquityError):
+        equity('AA', 'KK', iterations=None)
+    with pytest.raises(EquityError):
+        equity('AA', 'KK', iterations=0)
+    with pytest.raises(EquityError):
+        equity('AA', 'KK', tolerance=0)
+
+
+@pytest.mark.parametrize('kwargs', [
+    dict(board='Ts7c2h', method='exact'),
+    dict(iterations=3 * BATCH_SIZE + 5, rng=9),
+    dict(iterations=None, tolerance=0.003, rng=9),
+])
+def test_equity_processes(kwargs):
+    args = ('99+,AJs+', 'TT+,AKo,KQs')
+    assert(equity(*args, processes=2, **kwargs)
+           == equity(*args, processes=1, **kwargs))
+
+
+def test_equity_processes_spawn():
+    # Spawned workers get the matchups and the runout table from shared
+    # memory only.
+    code = (
+        'import multiprocessing\n'
+        'from pynlh import equity\n'
+        'multiprocessing.set_start_method("spawn")\n'
+        'args = ("99+,AJs+", "TT+,AKo,KQs")\n'
+        'kwargs = dict(board="Ts7c2h", method="exact")\n'
+        'print(equity(*args, processes=2, **kwargs)\n'
+        '      == equity(*args, processes=1, **kwargs))'
+    )
+    result = subprocess.run([sys.executable, '-c', code], check=True,
+                            capture_output=True, text=True,
+                            cwd=Path(__file__).resolve().parents[1])
+    assert(result.stdout.strip() == 'True')
+
+
+def test_combo_equity_exact():
+    args = ('QQ+,[50]AKs[/50],T9s', 'JJ+,AQs+,KQs')
+    result = combo_equity(*args, board='AsKs7d4c')
+    assert(result.equity == pytest.approx(
+        equity(*args, board='AsKs7d4c').equity, abs=1e-12))
+    combo = combo_index('Td9d')
+    assert(result.combo_equities[combo] == pytest.approx(
+        equity(ComboRange('Td9d'), args[1], board='AsKs7d4c').equity,
+        abs=1e-12))
+    assert(np.isnan(result.combo_equities[combo_index('2c2d')]))
+    # Blocked by the board.
+    assert(np.isnan(result.combo_equities[combo_index('AsAd')]))
+    assert(result.histogram.sum() == pytest.approx(1))
+    assert(len(result.bucket_edges) == 11)
+
+
+def test_combo_equity_grid():
+    result = combo_equity('AA,KQs', 'TT+', board='Ts7c2h')
+    aa = HANDS_BY_NAME['AA']
+    combos = [combo_index(c) for c in ('AcAs', 'AcAd', 'AcAh', 'AsAd',
+                                       'AsAh', 'AdAh')]
+    assert(result.grid[aa.x - 1, aa.y - 1] == pytest.approx(
+        np.average(result.combo_equities[combos],
+                   weights=result.combo_weights[combos])))
+    kqs = HANDS_BY_NAME['KQs']
+    assert(not np.isnan(result.grid[kqs.x - 1, kqs.y - 1]))
+    assert(np.isnan(result.grid).sum() == 169 - 2)
+
+
+def test_combo_equity_sampled():
+    args = ('99+,AJs+', 'TT+,AKo,KQs')
+    exact = combo_equity(*args, board='Ts7c2h', method='exact')
+    sampled = combo_equity(*args, board='Ts7c2h', method='monte_carlo',
+                           iterations=200_000, rng=10)
+    assert(abs(sampled.equity - exact.equity) < 0.01)
+    known = ~np.isnan(exact.combo_equities)
+    assert(np.abs(sampled.combo_equities[known]
+                  - exact.combo_equities[known]).max() < 0.1)
+    pooled = combo_equity(*args, board='Ts7c2h', method='monte_carlo',
+                          iterations=200_000, rng=10, processes=2)
+    assert(np.array_equal(pooled.combo_equities, sampled.combo_equities,
+                          equal_nan=True))
@@ -0,0 +1,90 @@
+from itertools import combinations, product
+
+import numpy as np
+import pytest
+
+from pynlh.card import cards_to_ints
+from pynlh.combo_table import combo_index
+from pynlh.evaluator import (HAND_CATEGORIES, SORTING_NETWORKS,
+                             EvaluatorError, evaluate, evaluate_cards,
+                             evaluate_combos, hand_category)
+
+
+def test_all_five_card_hands():
+    hands = np.fromiter(combinations(range(52), 5),
+                        dtype=np.dtype((np.int8, 5)))
+    scores = evaluate(hands)
+    counts = dict(zip(HAND_CATEGORIES,
+                      np.bincount(hand_category(scores)).tolist()))
+    assert(counts == {
+        'High Card': 1302540,
+        'Pair': 1098240,
+        'Two Pair': 123552,
+        'Three of a Kind': 54912,
+        'Straight': 10200,
+        'Flush': 5108,
+        'Full House': 3744,
+        'Four of a Kind': 624,
+        'Straight Flush': 40,
+    })
+    assert(len(np.unique(scores)) == 7462)
+
+
+@pytest.mark.parametrize('stronger, weaker', [
+    ('AsKsQsJsTs', '9h8h7h6h5h'),
+    ('5c4c3c2cAc', 'AsAdAhAc2d'),
+    ('AsAdAhAcKd', 'AsAdAhAc2d'),
+    ('3s3d3h2c2d', '2s2d2hAcAd'),
+    ('AsJs9s7s5s', 'KsQsJs9s7s'),
+    ('6d5c4s3h2d', '5c4d3h2sAh'),
+    ('2s2d2hAcKd', 'AsAdKhKcQd'),
+    ('AsAdKhKc3d', 'AsAdKhKc2d'),
+    ('AsAdKhQcJd', 'KsKdAhQcJd'),
+    ('AsKdQh9c8d', 'AsKdQh9c7d'),
+])
+def test_hand_order(stronger, weaker):
+    assert(evaluate_cards(stronger) > evaluate_cards(weaker))
+
+
+def test_equal_hands():
+    assert(evaluate_cards('AsKdQh9c8d') == evaluate_cards('AcKhQd9s8h'))
+    assert(evaluate_cards('AsKsQsJsTs9s8s') == evaluate_cards('AhKhQhJhTh'))
+
+
+@pytest.mark.parametrize('n', [6, 7])
+def test_against_brute_force(n):
+    rng = np.random.default_rng(n)
+    hands = np.array([rng.choice(52, n, replace=False)
+                      for _ in range(3000)])
+    subsets = np.array(list(combinations(range(n), 5)))
+    best = evaluate(hands[:, subsets]).max(axis=1)
+    assert(np.array_equal(evaluate(hands), best))
+
+
+def test_sorting_networks():
+    # 0-1 principle: a network sorting all 0-1 inputs sorts everything.
+    for n, network in SORTING_NETWORKS.items():
+        for values in product((0, 1), repeat=n):
+            values = list(values)
+            for i, j in network:
+                if values[i] > values[j]:
+                    values[i], values[j] = values[j], values[i]
+            assert(values == sorted(values))
+
+
+def test_evaluate_combos():
+    combos = np.array([combo_index('AsKs'), combo_index('7h7d')])
+    scores = evaluate_combos(combos, 'QsJsTs2c7c')
+    assert(hand_category(scores).tolist() == [8, 3])
+    boards = np.array([cards_to_ints('QsJsTs'), cards_to_ints('2c3c4c')])
+    scores = evaluate_combos(combos, boards)
+    assert(hand_category(scores).tolist() == [8, 1])
+    with pytest.raises(EvaluatorError):
+        evaluate_combos(combos, 'QsJs')
+
+
+def test_evaluate_shape():
+    hands = np.array([[cards_to_ints('AsKsQsJsTs')] * 3] * 2)
+    assert(evaluate(hands).shape == (2, 3))
+    with pytest.raises(EvaluatorError):
+        evaluate(np.array([[0, 1, 2, 3]]))
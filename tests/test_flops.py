@@ -0,0 +1,100 @@
+import csv
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from pynlh.card import cards_to_ints
+from pynlh.combo_range import ComboRange
+from pynlh.equity_engine import EquityError
+from pynlh.flops import (CSV_COLUMNS, FlopClasses, all_flops, analyze_flop,
+                         analyze_flops, flop_classes, flop_str, flop_texture,
+                         write_flop_report)
+
+
+def test_flop_classes():
+    classes = flop_classes()
+    assert(classes.flops.shape == (1755, 3))
+    assert(classes.weights.sum() == 22100)
+    weights = Counter()
+    for flop, weight in zip(classes.flops, classes.weights):
+        weights[flop_texture(flop_str(flop))] += weight
+    assert(weights[('monotone', 'unpaired')] == 4 * 286)
+    assert(weights[('rainbow', 'trips')] == 4 * 13)
+    assert(weights[('two-tone', 'paired')] == 13 * 12 * 6 * 2)
+
+
+@pytest.mark.parametrize('flop, texture', [
+    ('AsKs7s', ('monotone', 'unpaired')),
+    ('AsAd7s', ('two-tone', 'paired')),
+    ('7c7s7d', ('rainbow', 'trips')),
+])
+def test_flop_texture(flop, texture):
+    assert(flop_texture(flop) == texture)
+
+
+def test_analyze_flop():
+    analysis = analyze_flop('AA,KK', 'AKs,QQ', 'AsKs7d')
+    # AA and KK keep 3 combos each, AKs keeps 3 and QQ all 6.
+    assert((analysis.hero_combos, analysis.villain_combos) == (6, 9))
+    assert(analysis.hero_categories[3] == 1)
+    # QQ makes a pair, AKs two pair.
+    assert(analysis.villain_categories.tolist()
+           == pytest.approx([0, 6 / 9, 3 / 9, 0, 0, 0, 0, 0, 0]))
+    assert(analysis.std_error == 0)
+    assert(np.isnan(analyze_flop('AA', 'AA', 'AsAd7c').equity))
+
+
+def test_analyze_flops_processes():
+    classes = flop_classes()
+    some = FlopClasses(classes.flops[::200], classes.weights[::200])
+    args = ('22+,AT+', 'QQ+,AK')
+    single = list(analyze_flops(*args, processes=1, rng=3,
+                                iterations=1000, classes=some))
+    pooled = list(analyze_flops(*args, processes=2, rng=3,
+                                iterations=1000, classes=some))
+    assert([(a.flop, a.equity) for a in single]
+           == [(a.flop, a.equity) for a in pooled])
+
+
+def test_all_flops():
+    flops = all_flops()
+    assert(flops.flops.shape == (22100, 3))
+    assert(flops.weights.tolist() == [1] * 22100)
+    assert(len({flop_str(flop) for flop in flops.flops}) == 22100)
+
+
+def test_analyze_flops_combo_range():
+    # The flops are in one flop class, but AhKh only has a flush draw on
+    # the first.
+    flops = ['2h3h4c', '2s3s4c']
+    some = FlopClasses(np.array([cards_to_ints(flop) for flop in flops],
+                                dtype=np.int8), np.ones(2, dtype=np.int64))
+    analyses = list(analyze_flops(ComboRange('AhKh'), 'QQ', processes=1,
+                                  method='exact', classes=some))
+    assert([a.flop for a in analyses] == flops)
+    assert(analyses[0].equity == pytest.approx(0.60505, abs=1e-5))
+    assert(analyses[1].equity == pytest.approx(0.36111, abs=1e-5))
+    classes = flop_classes()
+    with pytest.raises(EquityError):
+        next(analyze_flops(ComboRange('AhKh'), 'QQ', processes=1,
+                           classes=classes))
+    # Every flop by default.
+    first = next(analyze_flops('QQ', ComboRange('AhKh'), processes=1,
+                               iterations=100))
+    assert((first.flop, first.weight) == (flop_str(all_flops().flops[0]), 1))
+
+
+def test_write_flop_report(tmp_path):
+    classes = flop_classes()
+    some = FlopClasses(classes.flops[:20], classes.weights[:20])
+    path = tmp_path / 'report.csv'
+    average = write_flop_report('QQ+,AK', 'JJ+', path, processes=1, rng=4,
+                                iterations=1000, classes=some)
+    with open(path, newline='') as file:
+        rows = list(csv.reader(file))
+    assert(rows[0] == CSV_COLUMNS)
+    assert(len(rows) == 22)
+    assert(rows[-1][0] == 'all')
+    assert(average.weight == classes.weights[:20].sum())
+    assert(average.hero_categories.sum() == pytest.approx(1))
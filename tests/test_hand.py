@@ -1,6 +1,11 @@
-# import pytest
+import copy
+import pickle
 
-from pynlh import Hand
+import pytest
+
+from pynlh import Hand, Range
+from pynlh.hand import HandError
+from pynlh.hand_table import HAND_TABLE
 
 
 def test_get_all_combos_str_hand_n_type():
@@ -28,19 +33,17 @@ def test_get_combos_hand_n_type():
 
 
 def test_get_combos_hand_n_type_freq():
-    hand_offsuit = Hand(hand="AJ", hand_type='offsuit', freq=20)
-    hand_suited = Hand(hand="AJ", hand_type='suited', freq=20)
-    hand_pair = Hand(hand="AA", hand_type='pair', freq=20)
-    hand_nosuit = Hand(hand="83", hand_type='nosuit', freq=20)
+    range_ = Range('[20]AJo,AJs,AA,83[/20]')
+    hand_offsuit = Hand(hand="AJ", hand_type='offsuit')
+    hand_suited = Hand(hand="AJ", hand_type='suited')
+    hand_pair = Hand(hand="AA", hand_type='pair')
+    hand_nosuit = Hand(hand="83", hand_type='nosuit')
 
-    assert(len(hand_offsuit.combos) == 12)
-    assert(hand_offsuit.combos[11].freq == 20)
-    assert(len(hand_suited.combos) == 4)
-    assert(hand_suited.combos[3].freq == 20)
-    assert(len(hand_pair.combos) == 6)
-    assert(hand_pair.combos[5].freq == 20)
-    assert(len(hand_nosuit.combos) == 16)
-    assert(hand_nosuit.combos[15].freq == 20)
+    for hand, no_of_combos in ((hand_offsuit, 12), (hand_suited, 4),
+                               (hand_pair, 6), (hand_nosuit, 16)):
+        assert(len(hand.combos) == no_of_combos)
+        freqs = range_.combo_freqs[[c.index for c in hand.combos]]
+        assert((freqs == 20).all())
 
 
 def test_get_all_combos_str_handstring():
@@ -67,20 +70,34 @@ def test_get_combos_str_handstring():
     assert(len(hand_nosuit.combos) == 16)
 
 
-def test_get_combos_str_handstring_freq():
-    hand_offsuit = Hand(handstring='QJo', freq=20)
-    hand_suited = Hand(handstring='QJs', freq=20)
-    hand_pair = Hand(handstring='22', freq=20)
-    hand_nosuit = Hand(handstring='92', freq=20)
+def test_hand_interned():
+    assert(Hand(handstring='QJo') is Hand(hand='qj', hand_type='offsuit'))
+    assert(Hand('92').combos[15] is Hand('92o').combos[11])
+    assert(copy.deepcopy(Hand('22')) is Hand('22'))
+    assert(pickle.loads(pickle.dumps(Hand('22'))) is Hand('22'))
+    with pytest.raises(AttributeError):
+        Hand('AKs').handstring = 'AKo'
+    with pytest.raises(AttributeError):
+        Hand('AKs').freq = 20
 
-    assert(len(hand_offsuit.combos) == 12)
-    assert(hand_offsuit.combos[11].freq == 20)
-    assert(len(hand_suited.combos) == 4)
-    assert(hand_suited.combos[3].freq == 20)
-    assert(len(hand_pair.combos) == 6)
-    assert(hand_pair.combos[5].freq == 20)
-    assert(len(hand_nosuit.combos) == 16)
-    assert(hand_nosuit.combos[15].freq == 20)
+
+def test_hand_interned_canonical():
+    assert(Hand('aks') is Hand('AKs') is Hand('KAs'))
+    assert(Hand('ka') is Hand('AK'))
+    assert(Hand('KAs').handstring == 'AKs')
+    assert(len(Hand('KAs').combos) == 4)
+    for hand in HAND_TABLE:
+        Hand(hand.handstring.lower())
+        Hand(hand.handstring[1::-1] + hand.handstring[2:])
+    # One instance per hand (169 plus 78 "nosuit" hands at most).
+    assert(len(Hand._instances) <= 169 + 78)
+
+
+@pytest.mark.parametrize('handstring', ['A', 'AKx', 'AAs', 'AKsx'])
+def test_hand_invalid(handstring):
+    with pytest.raises(HandError):
+        Hand(handstring)
+    assert(handstring not in Hand._instances)
 
 
 def test_hand_index():
@@ -96,19 +113,20 @@ def test_hand_index():
 
 
 def test_pick_combos():
-    hand_offsuit = Hand(handstring='QJo', freq=20)
-    hand_suited = Hand(handstring='QJs', freq=20)
-    hand_pair = Hand(handstring='22', freq=20)
-    hand_nosuit = Hand(handstring='92', freq=20)
-
-    assert(len(hand_offsuit.pick_combos()) < 13 or hand_offsuit == [])
-    assert(hand_offsuit.pick_combos() is not None)
-    assert(len(hand_suited.pick_combos()) < 5 or hand_suited == [])
-    assert(hand_suited.pick_combos() is not None)
-    assert(len(hand_pair.pick_combos()) < 7 or hand_pair == [])
-    assert(hand_pair.pick_combos() is not None)
-    assert(len(hand_nosuit.pick_combos()) < 17 or hand_offsuit == [])
-    assert(hand_nosuit.pick_combos() is not None)
+    hand_offsuit = Hand(handstring='QJo')
+    hand_suited = Hand(handstring='QJs')
+    hand_pair = Hand(handstring='22')
+    hand_nosuit = Hand(handstring='92')
+
+    assert(len(hand_offsuit.pick_combos(freq=20)) < 13)
+    assert(hand_offsuit.pick_combos(freq=20) is not None)
+    assert(len(hand_suited.pick_combos(freq=20)) < 5)
+    assert(hand_suited.pick_combos(freq=20) is not None)
+    assert(len(hand_pair.pick_combos(freq=20)) < 7)
+    assert(hand_pair.pick_combos(freq=20) is not None)
+    assert(len(hand_nosuit.pick_combos(freq=20)) < 17)
+    assert(hand_nosuit.pick_combos(freq=20) is not None)
+    assert(len(hand_nosuit.pick_combos()) == 16)
 
 
 def test_ordering():
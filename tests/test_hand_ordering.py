@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+
+from pynlh.hand_ordering import (DEFAULT_ORDERING, ORDERINGS, HandOrdering,
+                                 HandOrderingError, get_ordering,
+                                 register_ordering)
+from pynlh.hand_table import HAND_TABLE, HANDS_BY_NAME
+
+
+def test_equity_ordering():
+    ordering = get_ordering()
+    assert(ordering is ORDERINGS[DEFAULT_ORDERING])
+    assert(ordering.hands[:3] == ['AA', 'KK', 'QQ'])
+    assert(ordering.hands[-1] == '32o')
+    assert(ordering.cumulative_combos[-1] == 1326)
+    assert(not ordering.indices.flags.writeable)
+
+
+def test_sklansky_malmuth_ordering():
+    ordering = get_ordering('sklansky_malmuth')
+    assert(sorted(ordering.hands[:5]) == ['AA', 'AKs', 'JJ', 'KK', 'QQ'])
+    groups = [HANDS_BY_NAME[hand].skl_mal for hand in ordering.hands]
+    assert(groups == sorted(groups))
+
+
+def test_prefix_length():
+    ordering = get_ordering()
+    assert(ordering.prefix_length(0) == 0)
+    assert(ordering.prefix_length(100) == 169)
+    # 0.5% are 7 combos, closest to the 6 combos of AA.
+    assert(ordering.top(.5).tolist() == [HANDS_BY_NAME['AA'].index])
+    # 0.9% are 12 combos: AA and KK.
+    assert(ordering.prefix_length(.9) == 2)
+    lengths = ordering.prefix_lengths
+    assert(np.all(np.diff(lengths) >= 0))
+    for percent in (5, 15, 33.3, 50):
+        combos = ordering.cumulative_combos[ordering.prefix_length(percent)]
+        # At most half an offsuit hand plus the rounding to whole combos.
+        assert(abs(combos - percent * 13.26) <= 6.5)
+
+
+def test_between():
+    ordering = get_ordering()
+    between = ordering.between(10, 20)
+    assert(set(between) == set(ordering.top(20)) - set(ordering.top(10)))
+    assert(np.array_equal(ordering.between(20, 10), between))
+
+
+def test_from_values():
+    ordering = HandOrdering.from_values(-np.arange(len(HAND_TABLE)))
+    assert(ordering.hands == [hand.handstring for hand in HAND_TABLE])
+    with pytest.raises(HandOrderingError):
+        HandOrdering.from_values([1, 2, 3])
+
+
+@pytest.mark.parametrize('hands', [
+    ['AA', 'KK'],
+    ['AA'] * 169,
+    ['AKx'] + [hand.handstring for hand in HAND_TABLE[1:]],
+])
+def test_invalid_ordering(hands):
+    with pytest.raises(HandOrderingError):
+        HandOrdering(hands)
+
+
+def test_register_ordering():
+    hands = [hand.handstring for hand in reversed(HAND_TABLE)]
+    ordering = register_ordering('test_reversed', hands)
+    try:
+        assert(get_ordering('test_reversed') is ordering)
+        assert(ordering.hands[0] == '22')
+        with pytest.raises(HandOrderingError):
+            register_ordering('test_reversed', hands)
+    finally:
+        del ORDERINGS['test_reversed']
+    with pytest.raises(HandOrderingError):
+        get_ordering('unknown')
+    with pytest.raises(HandOrderingError):
+        ordering.top(101)
@@ -0,0 +1,35 @@
+from pynlh import Hand, Range
+from pynlh.hand_table import (HAND_TABLE, HANDS_BY_NAME, HANDS_BY_XY,
+                              NO_OF_COMBOS, find_hand)
+
+
+def test_hand_table_size():
+    assert(len(HAND_TABLE) == 169)
+    assert(len(HANDS_BY_NAME) == 169)
+    assert(len(HANDS_BY_XY) == 169)
+    assert(NO_OF_COMBOS == 1326)
+
+
+def test_hand_table_matches_hand():
+    for info in HAND_TABLE:
+        hand = Hand(handstring=info.handstring)
+        assert(hand.index_x == info.x and hand.index_y == info.y)
+        assert(hand.hand_type == info.hand_type)
+        assert(hand.class_skl_mal == info.skl_mal)
+        assert(len(hand.all_combos_str) == info.n_combos)
+        assert(Range.grid_index(info.handstring) == info.index)
+
+
+def test_hand_table_combo_slices():
+    starts = [info.combo_slice.start for info in HAND_TABLE]
+    stops = [info.combo_slice.stop for info in HAND_TABLE]
+    assert(starts[0] == 0 and stops[-1] == 1326)
+    assert(starts[1:] == stops[:-1])
+
+
+def test_hand_table_lookups():
+    assert(HANDS_BY_NAME['AKs'].skl_mal == 1)
+    assert(HANDS_BY_XY[(2, 1)].handstring == 'AKs')
+    assert(HANDS_BY_XY[(1, 2)].handstring == 'AKo')
+    assert(find_hand('23o').handstring == '32o')
+    assert(find_hand('AK') is None)
@@ -0,0 +1,70 @@
+import ast
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Upper bound for the time "import pynlh" may take in a fresh interpreter.
+IMPORT_BUDGET_SECONDS = 0.1
+HEAVY_MODULES = ('numpy', 'pandas', 'requests', 'bs4')
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _run(code: str) -> str:
+    return subprocess.run([sys.executable, '-c', code], check=True,
+                          capture_output=True, text=True,
+                          cwd=REPO_ROOT).stdout
+
+
+def test_import_pynlh_is_lazy():
+    loaded = _run(
+        'import sys, pynlh\n'
+        f'print([m for m in {HEAVY_MODULES!r} if m in sys.modules])'
+    )
+    assert(loaded.strip() == '[]')
+
+
+def test_import_pynlh_budget():
+    timings = _run(
+        'from time import perf_counter\n'
+        'ts = perf_counter()\n'
+        'import pynlh  # noqa: F401\n'
+        'print(perf_counter() - ts)'
+    )
+    assert(float(timings) < IMPORT_BUDGET_SECONDS)
+
+
+def test_lazy_attributes():
+    import pynlh
+    assert(pynlh.Range('AA')['AA'] == 100)
+    assert('Strategy' in dir(pynlh))
+    with pytest.raises(AttributeError):
+        pynlh.NotThere
+
+
+def test_lazy_attributes_survive_submodule_imports():
+    # Importing a submodule binds it as attribute of the package, so no
+    # exported name may be the name of a submodule.
+    result = _run(
+        'import pynlh\n'
+        'pynlh.EquityResult\n'
+        'import pynlh.flops, pynlh.equity_cache  # noqa: F401\n'
+        'print(pynlh.equity("AA", "KK", method="exact").equity)'
+    )
+    assert(abs(float(result) - 0.8195) < 1e-3)
+    import pynlh
+    modules = {path.stem for path in (REPO_ROOT / 'pynlh').glob('*.py')}
+    assert(modules.isdisjoint(pynlh.__all__))
+
+
+@pytest.mark.parametrize('path', sorted((REPO_ROOT / 'pynlh').glob('*.py')),
+                         ids=lambda path: path.name)
+def test_module_docstring(path):
+    # A docstring after the imports is a plain expression and leaves
+    # __doc__ empty.
+    body = ast.parse(path.read_text()).body
+    strings = [node for node in body[1:] if isinstance(node, ast.Expr)
+               and isinstance(node.value, ast.Constant)
+               and isinstance(node.value.value, str)]
+    assert(strings == [])
@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from pynlh.preflop import (PAIR_COUNTS, PreflopError, build_matrix,
+                           equity_vs_random, hand_pair_equity, load_matrix,
+                           preflop_equity, representatives)
+
+
+@pytest.fixture(scope='module')
+def matrix_file(tmp_path_factory):
+    path = tmp_path_factory.mktemp('preflop') / 'preflop.npy'
+    np.save(path, build_matrix(['AA', 'KK'], processes=1))
+    return path
+
+
+def test_pair_counts():
+    assert(PAIR_COUNTS.sum() == 1326 * 1225)
+    assert(np.array_equal(PAIR_COUNTS, PAIR_COUNTS.T))
+    # AA vs AA: every combo with the one of the two remaining aces.
+    assert(PAIR_COUNTS[0, 0] == 6)
+    # AA vs KK, AKs and AKo (indices 14, 13 and 1).
+    assert(PAIR_COUNTS[0, 14] == 36)
+    assert(PAIR_COUNTS[0, 13] == 12)
+    assert(PAIR_COUNTS[0, 1] == 36)
+
+
+def test_representatives():
+    pairs = representatives('AKo', 'QJo')
+    # Villain's suits relative to hero's two suits.
+    assert(len(pairs.hero) == 7)
+    assert(len(set(pairs.hero)) == 1)
+    assert(pairs.weights.sum() == 12)
+    assert(representatives('AKs', 'AKo').weights.sum() == 6)
+
+
+def test_hand_pair_equity():
+    assert(hand_pair_equity('T9s', 'T8s').equity
+           == pytest.approx(0.67008, abs=1e-5))
+
+
+def test_preflop_equity(matrix_file):
+    result = preflop_equity('AA', 'KK', path=matrix_file)
+    assert(result.equity == pytest.approx(0.81946, abs=1e-5))
+    assert(result.std_error == 0)
+    reverse = preflop_equity('KK', 'AA', path=matrix_file)
+    assert(reverse.equity == pytest.approx(1 - result.equity))
+    assert(preflop_equity('AA,KK', 'AA,KK', path=matrix_file).equity
+           == pytest.approx(0.5))
+    assert(load_matrix(matrix_file) is load_matrix(matrix_file))
+    with pytest.raises(PreflopError):
+        preflop_equity('AA', 'QQ', path=matrix_file)
+
+
+def test_missing_matrix(tmp_path):
+    with pytest.raises(PreflopError, match='--build'):
+        preflop_equity('AA', 'KK', path=tmp_path / 'missing.npy')
+
+
+def test_equity_vs_random(tmp_path):
+    path = tmp_path / 'preflop.npy'
+    values = np.linspace(.2, .8, 169)
+    matrix = np.zeros((2, 169, 169))
+    matrix[0] = values[:, None]
+    matrix[1, :, 0] = .2
+    np.save(path, matrix)
+    # The ties against AA count half, weighted by the combo pairs.
+    expected = values + .1 * PAIR_COUNTS[:, 0] / PAIR_COUNTS.sum(axis=1)
+    assert(equity_vs_random(path) == pytest.approx(expected))
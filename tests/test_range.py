@@ -1,4 +1,5 @@
 from typing import Union
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -306,6 +307,41 @@ def test_range_pick_combo():
     assert(cycle_pick_combos_for(range_plus))
 
 
+def test_range_pick_combo_indices():
+    range_ = Range('AA,[50]KK[/50]')
+    indices = range_.pick_combo_indices()
+    assert(set(range_.combo_indices[:6]) <= set(indices))
+    assert(set(indices) <= set(range_.combo_indices))
+    assert(len(Range.full_range().pick_combo_indices()) == 1326)
+    picked = range_.pick_combos(as_str=True).split(',')
+    assert(picked[:6] == ['AcAs', 'AcAd', 'AcAh', 'AsAd', 'AsAh', 'AdAh'])
+
+
+def test_range_pick_combos_seeded():
+    range_ = Range('[50]22+,AKs-ATs,AKo-AJo[/50]')
+    picks = [range_.pick_combos(as_str=True, rng=7) for _ in range(3)]
+    assert(picks[0] == picks[1] == picks[2])
+    rng1 = np.random.default_rng(3)
+    rng2 = np.random.default_rng(3)
+    assert((range_.pick_combo_indices(rng=rng1)
+            == range_.pick_combo_indices(rng=rng2)).all())
+    assert(range_.randomize_suits_for_range('by_hand', rng=1) ==
+           range_.randomize_suits_for_range('by_hand', rng=1))
+
+
+def test_range_pick_combos_bulk():
+    range_ = Range('AA,[25]KK[/25]')
+    picks = range_.pick_combos_bulk(4000, rng=11)
+    assert(picks.shape == (4000, 1326))
+    assert(picks.dtype == bool)
+    assert(picks[:, range_.combo_indices[:6]].all())
+    assert(picks.sum(axis=1).min() >= 6)
+    assert(picks.sum() == picks[:, range_.combo_indices].sum())
+    assert(abs(picks[:, range_.combo_indices[6:]].mean() - .25) < .02)
+    assert((range_.pick_combos_bulk(5, rng=2) ==
+            range_.pick_combos_bulk(5, rng=2)).all())
+
+
 def cycle_pick_combos_for(obj: Union[RangePart, Range]):
     CYCLES = 1000
     TOL = 0.1
@@ -341,6 +377,19 @@ def test_randomizer_skl_mal():
     assert(len(rand_combos_15) == 4)
 
 
+def test_randomizer_skl_mal_groups():
+    range_ = Range('[50]AA,KK[/50],[25]AKs,A9s-A2s[/25],T9o')
+    combos = range_.randomize_suits_for_range(grouping='skl-mal', rng=5)
+    combos = combos.split(',')
+    assert(len(combos) == len(set(combos)) == 6 + 1 + 8 + 12)
+    assert(sum(c[0] == c[2] for c in combos) == 6)
+    assert(sum(c[:3:2] == 'T9' for c in combos) == 12)
+    by_hand = range_.randomize_suits_for_range(grouping='by_hand', rng=5)
+    assert(len(by_hand.split(',')) == 3 + 3 + 1 + 8 + 12)
+    with pytest.raises(RangeError):
+        range_.randomize_suits_for_range(grouping='by_suit')
+
+
 def test_range_subtraction():
     range_50 = Range('[50]AA[/50],KK-JJ')
     range_15 = Range('[15]AA[/15],JJ')
@@ -362,6 +411,49 @@ def test_range_addition():
     assert(range_15['AA'] == 15)
 
 
+def test_range_addition_capped():
+    range_sum = Range('[80]AA[/80]') + Range('[50]AA[/50],KK')
+    assert(range_sum['AA'] == 100)
+    assert(range_sum['KK'] == 100)
+
+
+def test_range_intersection():
+    range_50 = Range('[50]AA[/50],KK-JJ')
+    range_15 = Range('[15]AA[/15],JJ,TT')
+    range_and = range_50 & range_15
+    assert(range_and.converted_range_dict == {'AA': 15, 'JJ': 100})
+    assert(range_50.intersect(range_15).converted_range_dict ==
+           range_and.converted_range_dict)
+
+
+def test_range_min_max():
+    range_50 = Range('[50]AA[/50],KK')
+    range_15 = Range('[15]AA[/15],[30]QQ[/30]')
+    assert(range_50.minimum(range_15).converted_range_dict == {'AA': 15})
+    assert((range_50 | range_15).converted_range_dict ==
+           {'AA': 50, 'KK': 100, 'QQ': 30})
+
+
+def test_range_scale_clip_normalize():
+    range_ = Range('[50]AA[/50],KK')
+    assert((range_ * .5).converted_range_dict == {'AA': 25, 'KK': 50})
+    assert(range_.scale(3).converted_range_dict == {'AA': 100, 'KK': 100})
+    assert(range_.clip(0, 40).converted_range_dict == {'AA': 40, 'KK': 40})
+    assert((range_ * .5).normalize().converted_range_dict ==
+           {'AA': 50, 'KK': 100})
+
+
+def test_range_from_freqs():
+    range_ = Range('[50]AA[/50],KK')
+    copy = Range.from_freqs(range_.freqs)
+    copy['QQ'] = 100
+    assert('QQ' not in range_)
+    assert(Range(str(range_ - Range('KK'))).converted_range_dict ==
+           {'AA': 50})
+    with pytest.raises(RangeError):
+        Range.from_freqs([100, 50])
+
+
 def test_range_iter():
     range_50 = Range('[50]AA[/50],KK-JJ')
     i = sum(1 for hand, freq in range_50)
@@ -381,6 +473,44 @@ def test_full_range():
     assert(full_range['54s'] == 100)
 
 
+def test_range_percent():
+    range_ = Range('15%')
+    assert(range_.range_str == '15%')
+    assert(abs(len(range_.combo_indices) - 198.9) <= 6)
+    assert('AA' in range_ and '72o' not in range_)
+    # 2% are 27 combos: AA-JJ by equity, the whole first group (with AKs)
+    # by Sklansky-Malmuth.
+    assert(Range('2%').converted_range_dict
+           == {'AA': 100, 'KK': 100, 'QQ': 100, 'JJ': 100})
+    skl = Range('[50]2%[/50]', ordering='sklansky_malmuth')
+    assert(skl.converted_range_dict
+           == {'AA': 50, 'KK': 50, 'QQ': 50, 'JJ': 50, 'AKs': 50})
+    assert(skl.range_str == str(skl))
+
+
+def test_range_freqs_vector():
+    range_ = Range('[50]AA[/50],AKs,23o')
+    assert(range_.freqs.shape == (169,))
+    assert(range_.freqs[Range.grid_index('AA')] == 50)
+    assert(range_.freqs[Range.grid_index('AKs')] == 100)
+    assert(range_.freqs[Range.grid_index('32o')] == 100)
+    assert(range_.freqs.sum() == 250)
+    assert('23o' in range_)
+    assert('AKo' not in range_)
+    assert(list(range_) == [('AA', 50), ('AKs', 100), ('32o', 100)])
+
+
+def test_range_setitem_delitem():
+    range_ = Range('AA,KK')
+    range_['QQ'] = 25
+    del range_['AA']
+    assert(range_.converted_range_dict == {'KK': 100, 'QQ': 25})
+    with pytest.raises(KeyError):
+        range_['AA']
+    with pytest.raises(KeyError):
+        del range_['AA']
+
+
 if __name__ == "__main__":
     # test_range_hands()
     # test_range_ranges()
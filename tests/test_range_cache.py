@@ -0,0 +1,102 @@
+import pytest
+
+from pynlh import Range, RangeError
+from pynlh.hand import HandError
+from pynlh.range_cache import RANGE_CACHE, RangeCache, normalize_range_str
+from pynlh.range_parser import compile_range
+
+
+def test_normalize_range_str():
+    assert(normalize_range_str('AA-JJ, [25]ATs+;\nAQo+[/25] ')
+           == 'AA-JJ,[25]ATs+,AQo+[/25]')
+    # Whitespace within a token is kept.
+    assert(normalize_range_str('A K s, 1 5%') == 'A K s,1 5%')
+
+
+def test_hits_misses_evictions():
+    cache = RangeCache(maxsize=2)
+    cache.get('AA')
+    cache.get(' AA ')
+    cache.get('KK')
+    cache.get('AA')
+    cache.get('QQ')
+    info = cache.info()
+    assert((info.hits, info.misses, info.evictions) == (2, 3, 1))
+    assert(info.currsize == 2)
+    assert('AA' in cache)
+    assert('KK' not in cache)
+    cache.clear()
+    assert(cache.info() == (0, 0, 0, 2, 0))
+
+
+def test_cached_freqs_read_only():
+    cache = RangeCache()
+    freqs = cache.get('AA,KK')
+    with pytest.raises(ValueError):
+        freqs[0] = 50
+    assert(cache.get('AA;KK') is freqs)
+
+
+def test_invalid_range_not_cached():
+    cache = RangeCache()
+    with pytest.raises(RangeError):
+        cache.get('AA,JJs')
+    assert(len(cache) == 0)
+    assert(cache.info().misses == 1)
+
+
+def test_range_uses_cache():
+    RANGE_CACHE.clear()
+    r1 = Range('AA-JJ, [25]ATs+, AQo+[/25]')
+    r2 = Range('AA-JJ,[25]ATs+,AQo+[/25]')
+    assert(RANGE_CACHE.info().hits == 1)
+    r1['22'] = 100
+    assert('22' not in r2)
+    assert('22' not in Range('AA-JJ, [25]ATs+, AQo+[/25]'))
+
+
+@pytest.mark.parametrize('range_str', [
+    'A K s', '1 5%', '[5 0]AA[/50]', 'A\nKs', 'AA KK', '[ /50]AA',
+])
+def test_whitespace_within_tokens(range_str):
+    RANGE_CACHE.clear()
+    Range('AKs,15%,[50]AA[/50],AA,KK')
+    for valid in ('AKs', '15%', '[50]AA[/50]'):
+        Range(valid)
+    with pytest.raises((RangeError, HandError)) as e_compile:
+        compile_range(range_str)
+    with pytest.raises(e_compile.type) as e:
+        Range(range_str)
+    assert(str(e.value) == str(e_compile.value))
+
+
+@pytest.mark.parametrize('range_str', [
+    'AKs\nKQo', 'AKs \r\n KQo\n', '[50]AKs\nKQo[/50]\nQQ', 'AKs;\n\nKQo',
+])
+def test_line_breaks_separate_parts(range_str):
+    RANGE_CACHE.clear()
+    range_ = Range(range_str)
+    expected = compile_range(range_str.replace('\n', ','))
+    assert((range_.freqs == expected).all())
+    assert((compile_range(range_str) == expected).all())
+    assert((Range(range_.range_str).freqs == expected).all())
+    assert(normalize_range_str(range_str)
+           == normalize_range_str(range_str.replace('\n', ',')))
+
+
+@pytest.mark.parametrize('range_str, position', [
+    ('AA-\nQQ', 3),
+    ('[50]AA\n[/50]', 7),
+    ('AA KK', 3),
+    ('QQ,  AA KK', 8),
+    ('[50]AA,\nJJs', 8),
+])
+def test_error_refers_to_input(range_str, position):
+    RANGE_CACHE.clear()
+    with pytest.raises(RangeError) as e:
+        Range(range_str)
+    assert(e.value.range_str == range_str)
+    assert(e.value.position == position)
+    with pytest.raises(RangeError) as e_compile:
+        compile_range(range_str)
+    assert(str(e.value) == str(e_compile.value))
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+from pynlh import Range
+from pynlh.range_encoder import encode_range, format_freq
+
+
+@pytest.mark.parametrize('range_str, expected', [
+    ('AA,KK,QQ', 'QQ+'),
+    ('JJ,TT,99,55', 'JJ-99,55'),
+    ('AKs,AQs,AJs,ATs', 'ATs+'),
+    ('KQo,KJo,KTo', 'KTo+'),
+    ('QTo,Q9o,Q8o', 'QTo-Q8o'),
+    ('AKs,AKo,AQs,AQo', 'AQ+'),
+    ('32', '32'),
+    ('[50]AA[/50],KK', 'KK,[50]AA[/50]'),
+    ('[25]72o[/25],[75]AKs[/75]', '[75]AKs[/75],[25]72o[/25]'),
+    ('', ''),
+])
+def test_encode_range(range_str, expected):
+    assert(encode_range(Range(range_str).freqs) == expected)
+
+
+def test_encode_full_range():
+    assert(str(Range.full_range())
+           == '22+,A2+,K2+,Q2+,J2+,T2+,92+,82+,72+,62+,52+,42+,32')
+
+
+def test_canonical_str():
+    assert(str(Range('KK,AA')) == str(Range('KK+')))
+    range_ = Range('AA-QQ') - Range('KK')
+    assert(str(range_) == 'AA,QQ')
+    assert(range_.range_str == 'AA,QQ')
+    range_['JJ'] = 50
+    assert(str(range_) == 'AA,QQ,[50]JJ[/50]')
+
+
+def test_encode_round_trip():
+    rng = np.random.default_rng(7)
+    for _ in range(200):
+        freqs = np.where(rng.random(169) < rng.random(),
+                         rng.choice([100, 50, 12.5, 1 / 3], 169), 0)
+        assert(np.array_equal(Range(encode_range(freqs)).freqs, freqs))
+
+
+def test_format_freq():
+    assert(format_freq(50.0) == '50')
+    assert(format_freq(5.2) == '5.2')
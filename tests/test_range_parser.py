@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+
+from pynlh import Range, RangeError
+from pynlh.hand_ordering import get_ordering
+from pynlh.hand_table import HANDS_BY_NAME
+from pynlh.range_parser import (compile_range, expand_part, parse_range,
+                                tokenize)
+
+
+def test_tokenize():
+    kinds = [t.kind for t in tokenize('[50]AKs-ATs, QQ+[/50];72o')]
+    assert(kinds == ['OPEN', 'HAND', 'DASH', 'HAND', 'COMMA', 'HAND', 'PLUS',
+                     'CLOSE', 'COMMA', 'HAND'])
+    kinds = [t.kind for t in tokenize('[50]10%-25%[/50],2.5%')]
+    assert(kinds == ['OPEN', 'PERCENT', 'DASH', 'PERCENT', 'CLOSE', 'COMMA',
+                     'PERCENT'])
+    tokens = list(tokenize('[12.5]AA'))
+    assert(tokens[0].value == 12.5)
+    assert(tokens[1].pos == 6)
+
+
+def test_expand_part():
+    assert(expand_part('QQ-TT') == ['QQ', 'JJ', 'TT'])
+    assert(expand_part('TT-QQ') == ['TT', 'JJ', 'QQ'])
+    assert(expand_part('JTs-87s') == ['JTs', 'T9s', '98s', '87s'])
+    assert(expand_part('KQo-KTo') == ['KQo', 'KJo', 'KTo'])
+    assert(expand_part('KQ-KT') == ['KQs', 'KQo', 'KJs', 'KJo', 'KTs',
+                                    'KTo'])
+    assert(expand_part('A2+') == [h for r in '23456789TJQK'
+                                  for h in ('A' + r + 's', 'A' + r + 'o')])
+    assert(expand_part('T8s+') == ['T8s', 'T9s'])
+    assert(expand_part('22+')[-1] == 'AA')
+    assert(expand_part('kqS') == ['KQs'])
+
+
+def test_parse_range():
+    parts = parse_range('AA, [50]KK-QQ,AKs[/50],[25]72o[/25]')
+    assert([p.part for p in parts] == ['AA', 'KK-QQ', 'AKs', '72o'])
+    assert([p.freq for p in parts] == [100, 50, 50, 25])
+    assert(parse_range('') == [])
+
+
+def test_compile_range():
+    freqs = compile_range('AA,[50]AKs[/50],AKs')
+    assert(freqs[HANDS_BY_NAME['AA'].index] == 100)
+    assert(freqs[HANDS_BY_NAME['AKs'].index] == 100)
+    assert(freqs.sum() == 200)
+    assert(np.array_equal(freqs, Range('AA,AKs').freqs))
+
+
+def test_compile_percent():
+    ordering = get_ordering()
+    freqs = compile_range('15%')
+    assert(np.flatnonzero(freqs).tolist() == sorted(ordering.top(15)))
+    freqs = compile_range('AA,[50]10% - 20%[/50],2.5%')
+    assert(set(np.flatnonzero(freqs == 50)) == set(ordering.between(10, 20)))
+    assert(set(np.flatnonzero(freqs == 100)) == set(ordering.top(2.5)))
+    assert([p.part for p in parse_range('[50]10% - 20%[/50],AA')]
+           == ['10%-20%', 'AA'])
+    # '25' would be a hand without the percent sign.
+    assert(compile_range('25%').sum() > compile_range('25').sum())
+    skl = compile_range('3%', ordering='sklansky_malmuth')
+    assert(set(np.flatnonzero(skl))
+           == set(get_ordering('sklansky_malmuth').top(3)))
+
+
+@pytest.mark.parametrize('range_str, position', [
+    ('AA,KK,#', 6),
+    ('[50]', 0),
+    ('AA,[50]', 3),
+    ('AA, [ 50 ] ', 4),
+    ('AA,120%', 3),
+    ('AA,10%-101%', 7),
+    ('15%+', 3),
+    ('[50]10%-', 7),
+    ('AA,[50]10%-[/50]', 11),
+    ('10%-,AA', 4),
+    ('AA,[25.5]', 3),
+    ('AA,,KK-', 6),
+    ('AA,[120]KK[/120]', 3),
+    ('AKs-QTs', 4),
+    ('AA KK', 3),
+])
+def test_error_position(range_str, position):
+    with pytest.raises(RangeError) as e:
+        compile_range(range_str)
+    assert(e.value.position == position)
+    assert(f'position {position}' in str(e.value))
+
+
+def test_dangling_open_tag():
+    with pytest.raises(RangeError) as e:
+        Range('AA,[50]')
+    assert(e.value.msg == "'[50]'" + RangeError.ERR006_UNEXPECTED)
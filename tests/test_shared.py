@@ -0,0 +1,19 @@
+import numpy as np
+import pytest
+
+from pynlh.shared import SharedArrays, attach
+
+
+def test_shared_arrays():
+    arrays = {'a': np.arange(10, dtype=np.int16),
+              'b': np.linspace(0, 1, 6).reshape(2, 3),
+              'c': np.array([2 ** 63], dtype=np.uint64)}
+    with SharedArrays(arrays) as shared:
+        shm, views = attach(shared.handle)
+        for name, array in arrays.items():
+            assert(views[name].dtype == array.dtype)
+            assert(np.array_equal(views[name], array))
+        with pytest.raises(ValueError):
+            views['a'][0] = 1
+        del views
+        shm.close()
@@ -5,7 +5,21 @@ def test_easiness():
     a = Range('AA-55')
     b = Range('44-22')
     strategy = Strategy('Test Strategy', a, b)
-    print(strategy._create_easiness_dict())
+    easiness = strategy._create_easiness_dict()
+    assert(len(easiness) == 169)
+    # AA to 22 are all in the strategy: 13 steps from AA, 1 from 22.
+    assert(easiness['AA'] == (13, 1, 1))
+    assert(easiness['55'] == (4, 10, 10))
+    assert(easiness['22'] == (1, 13, 13))
+    assert(easiness['AKs'] == (0, 2, 1))
+
+
+def test_easiness_suited_diagonal():
+    strategy = Strategy('Suited', Range('AKs,KQs'), Range('QJs'))
+    easiness = strategy._create_easiness_dict()
+    assert(easiness['AKs'][0] == 3)
+    assert(easiness['KQs'][0] == 2)
+    assert(easiness['JTs'][0] == 0)
 
 
 if __name__ == "__main__":